@@ -0,0 +1,287 @@
+import sys
+import zlib
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+from eventos import IEventListener, SimulationEvent, PlaceEvent, MoveEvent, DepartEvent #eventos de la línea de procesos
+
+class Allocation: #struct
+    """Clase que representa la estancia de un proceso en un rango de memoria durante un rango de instantes
+
+    Attributes:
+        name (str): Nombre del proceso
+        memory (int): Memoria del proceso
+        position (int): Posición inicial del bloque reservado
+        space (int): Memoria reservada para el proceso
+        start (int): Primer instante en el que aparece en esa posición en la línea temporal
+        end (int): Instante siguiente al último en el que aparece. None si sigue en memoria
+    """
+    __slots__ = ("name", "memory", "position", "space", "start", "end")
+
+    def __init__(self, name: str, memory: int, position: int, space: int, start: int, end: int = None) -> None:
+        self.name = name
+        self.memory = memory
+        self.position = position
+        self.space = space
+        self.start = start
+        self.end = end
+
+    def __str__(self) -> str:
+        return f"{self.name} [{self.position}-{self.position + self.space - 1}] {self.start}-{'' if self.end is None else self.end - 1}"
+
+class AllocationHistory(IEventListener):
+    """Clase que guarda cada estancia de un proceso en memoria como un intervalo de posiciones por un intervalo de instantes,
+    a partir de los eventos de entrada, movimiento y salida. Permite consultar la memoria en cualquier instante y las estancias de un proceso
+    sin volver a simular. Los intervalos se guardan en columnas en orden de inicio, con un árbol de segmentos del mayor final de cada rango,
+    por lo que una consulta en un instante cuesta O(k log n) para k resultados, y se puede consultar mientras la simulación sigue.
+
+    Attributes:
+        MAGIC (bytes): Inicio de los archivos del historial
+        OPEN (int): Final de los intervalos que siguen abiertos
+        lastTime (int): Instante del último evento recibido. 0 si no hay eventos
+    """
+    MAGIC = b"GMHIST01"
+    OPEN = (1 << 63) - 1
+    HEADER = struct.Struct("<8sQQ") #magic, número de intervalos, número de nombres
+    COLUMNS = ("starts", "ends", "positions", "spaces", "memory", "names")
+
+    def __init__(self) -> None:
+        self.lastTime = 0
+        for column in self.COLUMNS:
+            setattr(self, f"__{column}__", array("q"))
+        self.__nameList__ = []
+        self.__nameIds__ = {}
+        self.__byName__ = {}
+        self.__open__ = {}
+        self.__tree__ = [-1, -1]
+        self.__lock__ = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__starts__)
+
+    def onEvent(self, event: SimulationEvent):
+        if isinstance(event, PlaceEvent):
+            with self.__lock__:
+                self.__open__[event.process] = self.__openInterval__(event.process.name, event.process.memory, event.position, event.space, event.time)
+        elif isinstance(event, MoveEvent):
+            with self.__lock__:
+                index = self.__open__.get(event.process)
+                if index is not None:
+                    self.__closeInterval__(index, event.time)
+                    self.__open__[event.process] = self.__openInterval__(event.process.name, event.process.memory, event.position, self.__spaces__[index], event.time)
+        elif isinstance(event, DepartEvent):
+            with self.__lock__:
+                index = self.__open__.pop(event.process, None)
+                if index is not None:
+                    self.__closeInterval__(index, event.time + 1)
+        self.lastTime = max(self.lastTime, event.time)
+
+    def addResidents(self, line: "ProcessLine"):
+        """Abre un intervalo en el instante actual para cada proceso que ya está en memoria, por ejemplo al continuar una instantánea.
+        Se debe llamar antes de que la línea emita eventos
+
+        Args:
+            line (ProcessLine): Línea de procesos
+        """
+        with self.__lock__:
+            for page in line.processList:
+                if page.process is not None:
+                    self.__open__[page.process] = self.__openInterval__(page.process.name, page.process.memory, page.start_position, page.space, line.__time__)
+            self.lastTime = max(self.lastTime, line.__time__)
+
+    def __openInterval__(self, name: str, memory: int, position: int, space: int, start: int):
+        """Añade un intervalo abierto. Los intervalos llegan en orden de inicio
+
+        Returns:
+            int: Índice del intervalo
+        """
+        nameId = self.__nameIds__.get(name)
+        if nameId is None:
+            nameId = self.__nameIds__[name] = len(self.__nameList__)
+            self.__nameList__.append(name)
+        index = len(self.__starts__)
+        self.__starts__.append(start)
+        self.__ends__.append(self.OPEN)
+        self.__positions__.append(position)
+        self.__spaces__.append(space)
+        self.__memory__.append(memory)
+        self.__names__.append(nameId)
+        self.__byName__.setdefault(nameId, []).append(index)
+        if index == len(self.__tree__) // 2:
+            self.__rebuild__(2 * index)
+        self.__setEnd__(index, self.OPEN)
+        return index
+
+    def __closeInterval__(self, index: int, end: int):
+        """Cierra un intervalo abierto
+
+        Args:
+            index (int): Índice del intervalo
+            end (int): Instante siguiente al último del intervalo
+        """
+        self.__ends__[index] = end
+        self.__setEnd__(index, end)
+
+    def __setEnd__(self, index: int, end: int):
+        """Cambia el final de un intervalo en el árbol y actualiza el mayor final de sus rangos.
+        Deja de subir en cuanto un rango no cambia, lo normal cuando hay intervalos abiertos cerca
+
+        Args:
+            index (int): Índice del intervalo
+            end (int): Final del intervalo
+        """
+        tree = self.__tree__
+        node = len(tree) // 2 + index
+        tree[node] = end
+        node //= 2
+        while node != 0:
+            value = max(tree[2 * node], tree[2 * node + 1])
+            if tree[node] == value:
+                return
+            tree[node] = value
+            node //= 2
+
+    def __rebuild__(self, capacity: int):
+        """Vuelve a generar el árbol con la capacidad dada a partir de los finales de los intervalos
+
+        Args:
+            capacity (int): Número de hojas, potencia de 2 y al menos el número de intervalos
+        """
+        self.__tree__ = [-1] * capacity + list(self.__ends__) + [-1] * (capacity - len(self.__ends__))
+        for node in range(capacity - 1, 0, -1):
+            self.__tree__[node] = max(self.__tree__[2 * node], self.__tree__[2 * node + 1])
+
+    def __collect__(self, node: int, low: int, high: int, limit: int, time: int, result: list):
+        """Busca en el rango de un nodo los intervalos con índice menor que limit y final mayor que time
+
+        Args:
+            node (int): Nodo del árbol
+            low (int): Primer índice del rango del nodo
+            high (int): Índice siguiente al último del rango del nodo
+            limit (int): Número de intervalos que empiezan antes del final de la consulta
+            time (int): Inicio de la consulta
+            result (list): Índices encontrados
+        """
+        if low >= limit or self.__tree__[node] <= time:
+            return
+        if high - low == 1:
+            result.append(low)
+            return
+        middle = (low + high) // 2
+        self.__collect__(2 * node, low, middle, limit, time, result)
+        self.__collect__(2 * node + 1, middle, high, limit, time, result)
+
+    def __allocation__(self, index: int):
+        """Crea la estancia de un intervalo
+
+        Args:
+            index (int): Índice del intervalo
+
+        Returns:
+            Allocation: Estancia
+        """
+        end = self.__ends__[index]
+        return Allocation(self.__nameList__[self.__names__[index]], self.__memory__[index], self.__positions__[index], self.__spaces__[index],
+                          self.__starts__[index], None if end == self.OPEN else end)
+
+    def query(self, start: int, end: int = None):
+        """Obtiene las estancias que coinciden con un rango de instantes
+
+        Args:
+            start (int): Primer instante
+            end (int, optional): Instante siguiente al último. Defaults to start + 1, solo el instante start.
+
+        Returns:
+            list: Estancias (Allocation) en orden de inicio
+        """
+        end = start + 1 if end is None else end
+        result = []
+        with self.__lock__:
+            self.__collect__(1, 0, len(self.__tree__) // 2, bisect_left(self.__starts__, end), start, result)
+            return [self.__allocation__(index) for index in result]
+
+    def getMemoryAt(self, time: int):
+        """Obtiene los procesos en memoria en un instante, igual que la línea de ese instante en la línea temporal
+
+        Args:
+            time (int): Instante
+
+        Returns:
+            list: Estancias (Allocation) ordenadas por posición
+        """
+        return sorted(self.query(time), key=lambda allocation: allocation.position)
+
+    def getProcess(self, name: str):
+        """Obtiene las estancias de un proceso, varias si se ha movido al compactar
+
+        Args:
+            name (str): Nombre del proceso
+
+        Returns:
+            list: Estancias (Allocation) en orden de inicio
+        """
+        with self.__lock__:
+            nameId = self.__nameIds__.get(name)
+            return [self.__allocation__(index) for index in self.__byName__.get(nameId, [])]
+
+    def save(self, filename: str):
+        """Guarda el historial en un archivo binario: una cabecera y las columnas y los nombres comprimidos con zlib
+
+        Args:
+            filename (str): Nombre del archivo
+        """
+        with self.__lock__:
+            columns = [array("q", getattr(self, f"__{column}__")) for column in self.COLUMNS]
+            names = [name.encode() for name in self.__nameList__]
+            count = len(self.__starts__)
+        offsets = array("q", [0])
+        for name in names:
+            offsets.append(offsets[-1] + len(name))
+        if sys.byteorder == "big":
+            for column in columns + [offsets]:
+                column.byteswap()
+        body = b"".join(column.tobytes() for column in columns) + offsets.tobytes() + b"".join(names)
+        with open(filename, 'wb') as f:
+            f.write(self.HEADER.pack(self.MAGIC, count, len(names)))
+            f.write(zlib.compress(body))
+
+    @classmethod
+    def load(cls, filename: str):
+        """Carga un historial guardado con save. Los intervalos abiertos al guardar se quedan abiertos
+
+        Args:
+            filename (str): Nombre del archivo
+
+        Raises:
+            ValueError: En caso de que el archivo no sea un historial
+
+        Returns:
+            AllocationHistory: Historial cargado
+        """
+        with open(filename, 'rb') as f:
+            header = f.read(cls.HEADER.size)
+            body = f.read()
+        if len(header) != cls.HEADER.size or header[:len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError("Not an allocation history file")
+        _, count, nameCount = cls.HEADER.unpack(header)
+        body = zlib.decompress(body)
+        history = cls()
+        width = array("q").itemsize
+        position = 0
+        for column in cls.COLUMNS + ("offsets",):
+            size = count if column != "offsets" else nameCount + 1
+            values = array("q", body[position:position + size * width])
+            if sys.byteorder == "big":
+                values.byteswap()
+            position += size * width
+            if column == "offsets":
+                history.__nameList__ = [str(body[position + values[i]:position + values[i + 1]], "utf-8") for i in range(nameCount)]
+            else:
+                setattr(history, f"__{column}__", values)
+        history.__nameIds__ = {name: nameId for nameId, name in enumerate(history.__nameList__)}
+        for index, nameId in enumerate(history.__names__):
+            history.__byName__.setdefault(nameId, []).append(index)
+        history.__rebuild__(1 << max(count - 1, 0).bit_length())
+        history.lastTime = max((start if end == cls.OPEN else max(start, end - 1) for start, end in zip(history.__starts__, history.__ends__)), default=0)
+        return history
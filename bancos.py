@@ -0,0 +1,365 @@
+import os
+import copy
+import zlib
+import argparse
+import multiprocessing
+from abc import ABC, abstractmethod
+import gestormemoria as gm #modulo gestor
+import comparador as cmp #métricas de la simulación
+import trazas #trazas binarias
+
+class BankState: #struct
+    """Clase que representa el estado de un banco de memoria que el repartidor usa para elegir banco
+
+    Attributes:
+        bank (int): Índice del banco
+        size (int): Tamaño del banco
+        free (int): Memoria libre total
+        largestHole (int): Tamaño del hueco libre más grande
+        residents (int): Número de procesos en memoria
+        bufferLength (int): Número de procesos esperando en el buffer
+        nextEvent (int): Siguiente instante en el que el banco puede cambiar sin llegadas. None si está vacío
+    """
+    __slots__ = ("bank", "size", "free", "largestHole", "residents", "bufferLength", "nextEvent")
+
+    def __init__(self, bank: int, line: gm.ProcessLine):
+        self.bank = bank
+        self.size = line.size
+        self.free = line.__free__
+        self.largestHole = line.__holes__.max() if len(line.__holes__.keys) != 0 else 0
+        self.residents = line.__residents__
+        self.bufferLength = len(line.__buff__)
+        self.nextEvent = line.nextEventTime()
+
+    def __getstate__(self):
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __setstate__(self, state):
+        for field, value in zip(self.__slots__, state):
+            setattr(self, field, value)
+
+class IPlacement(ABC): #clase abstracta
+    """Clase abstracta que representa la estrategia de reparto de los procesos que llegan entre los bancos de memoria.
+    Nota: Hereda la clase ABC que indica que la clase es abstracta
+
+    Attributes:
+        stateless (bool): Indica si el reparto no depende del estado de los bancos. En ese caso cada banco se simula de principio a fin sin sincronizarse
+    """
+    stateless = False
+
+    @abstractmethod
+    def selectBank(self, process: gm.Process, banks: list):
+        """Elige el banco de un proceso
+
+        Args:
+            process (Process): Proceso que llega
+            banks (list): Estado de cada banco (BankState) al final del intervalo anterior, con los procesos ya repartidos en este intervalo descontados
+
+        Returns:
+            int: Índice del banco
+        """
+        pass #abstract
+
+class LeastLoadedPlacement(IPlacement):
+    """Clase que representa el reparto al banco con más memoria libre. En caso de empate, el de menor índice
+    """
+    def selectBank(self, process: gm.Process, banks: list):
+        return max(banks, key=lambda bank: (bank.free, -bank.bank)).bank
+
+class LargestHolePlacement(IPlacement):
+    """Clase que representa el reparto al banco con el hueco libre más grande. En caso de empate, el de menor índice
+    """
+    def selectBank(self, process: gm.Process, banks: list):
+        return max(banks, key=lambda bank: (bank.largestHole, -bank.bank)).bank
+
+class HashPlacement(IPlacement):
+    """Clase que representa el reparto por el hash del nombre del proceso, siempre al mismo banco
+    """
+    stateless = True
+
+    def selectBank(self, process: gm.Process, banks: list):
+        return zlib.crc32(process.name.encode()) % len(banks)
+
+def bankFilename(outputDir: str, bank: int):
+    """Obtiene el archivo de la línea temporal de un banco
+
+    Args:
+        outputDir (str): Directorio de salida
+        bank (int): Índice del banco
+
+    Returns:
+        str: Nombre del archivo
+    """
+    return os.path.join(outputDir, f"result_bank{bank}.txt")
+
+class LocalShard:
+    """Clase que representa un banco de memoria simulado en el mismo proceso
+
+    Attributes:
+        bank (int): Índice del banco
+        line (ProcessLine): Línea de procesos del banco
+        sink (MetricsSink): Métricas del banco, que reenvía la línea temporal a su archivo
+    """
+    def __init__(self, bank: int, sorting: gm.ISorting, size: int, outputDir: str = None) -> None:
+        """Constructor de la clase
+
+        Args:
+            bank (int): Índice del banco
+            sorting (ISorting): Método de búsqueda de huecos
+            size (int): Tamaño del banco
+            outputDir (str, optional): Directorio donde escribir la línea temporal del banco. Defaults to None, que no la escribe.
+        """
+        self.bank = bank
+        self.sink = cmp.MetricsSink(gm.BufferedFileSink(bankFilename(outputDir, bank)) if outputDir is not None else None)
+        self.line = gm.ProcessLine(copy.copy(sorting), size, sink=self.sink) # copia propia, Siguiente Hueco guarda dónde buscar
+
+    def getState(self):
+        """Obtiene el estado del banco
+
+        Returns:
+            BankState: Estado del banco
+        """
+        return BankState(self.bank, self.line)
+
+    def send(self, steps: list, until: int = None):
+        """Simula el banco con los procesos que le llegan en varios instantes y sigue sin llegadas hasta el instante dado.
+        Los intervalos sin llegadas se simulan sin esperas, sin pasar por el repartidor
+
+        Args:
+            steps (list): Tuplas (instante, procesos repartidos a este banco en el instante), en orden
+            until (int, optional): Instante en el que se detiene, antes de simularlo. Defaults to None, hasta que el banco se vacíe.
+        """
+        for time, processes in steps:
+            gm.runHeadless(self.line, [], until=time)
+            self.line.skipTo(time)
+            self.line.update(processes=processes)
+        gm.runHeadless(self.line, [], until=until)
+
+    def run(self, processes: list):
+        """Simula el banco de principio a fin sin esperas
+
+        Args:
+            processes (list): Procesos repartidos a este banco
+        """
+        gm.runHeadless(self.line, processes)
+
+    def receive(self):
+        """Obtiene el estado del banco tras la última simulación
+
+        Returns:
+            BankState: Estado del banco
+        """
+        return self.getState()
+
+    def close(self):
+        """Termina la simulación del banco
+
+        Returns:
+            dict: Métricas del banco
+        """
+        self.line.close()
+        metrics = self.sink.getMetrics(self.line.size)
+        metrics["bank"] = self.bank
+        metrics["rejected"] = self.line.__rejected__
+        return metrics
+
+def shardWorker(connection, bank: int, sorting: gm.ISorting, size: int, outputDir: str):
+    """Bucle del proceso de un banco remoto. Atiende los mensajes ("step", [(instante, procesos)], hasta), ("run", procesos) y ("close",)
+
+    Args:
+        connection (Connection): Extremo de la tubería con el repartidor
+        bank (int): Índice del banco
+        sorting (ISorting): Método de búsqueda de huecos
+        size (int): Tamaño del banco
+        outputDir (str): Directorio donde escribir la línea temporal del banco. None para no escribirla
+    """
+    shard = LocalShard(bank, sorting, size, outputDir)
+    connection.send(shard.getState())
+    while True:
+        message = connection.recv()
+        if message[0] == "step":
+            shard.send([(time, [gm.Process(*data) for data in processes]) for time, processes in message[1]], message[2])
+            connection.send(shard.getState())
+        elif message[0] == "run":
+            shard.run([gm.Process(*data) for data in message[1]])
+            connection.send(shard.getState())
+        else:
+            connection.send(shard.close())
+            connection.close()
+            return
+
+class RemoteShard:
+    """Clase que representa un banco de memoria simulado en otro proceso del sistema.
+    Los procesos de todos los instantes de cada envío van juntos en un solo mensaje, como tuplas
+
+    Attributes:
+        bank (int): Índice del banco
+    """
+    def __init__(self, bank: int, sorting: gm.ISorting, size: int, outputDir: str = None) -> None:
+        """Constructor de la clase, arranca el proceso del banco
+
+        Args:
+            bank (int): Índice del banco
+            sorting (ISorting): Método de búsqueda de huecos
+            size (int): Tamaño del banco
+            outputDir (str, optional): Directorio donde escribir la línea temporal del banco. Defaults to None, que no la escribe.
+        """
+        self.bank = bank
+        self.__connection__, child = multiprocessing.Pipe()
+        self.__process__ = multiprocessing.Process(target=shardWorker, args=(child, bank, sorting, size, outputDir), daemon=True)
+        self.__process__.start()
+        child.close()
+        self.__state__ = self.__connection__.recv()
+
+    def getState(self):
+        return self.__state__
+
+    def send(self, steps: list, until: int = None):
+        self.__connection__.send(("step", [(time, [(p.name, p.arribal, p.memory, p.execTime) for p in processes]) for time, processes in steps], until))
+
+    def run(self, processes: list):
+        self.__connection__.send(("run", [(p.name, p.arribal, p.memory, p.execTime) for p in processes]))
+
+    def receive(self):
+        self.__state__ = self.__connection__.recv()
+        return self.__state__
+
+    def close(self):
+        self.__connection__.send(("close",))
+        metrics = self.__connection__.recv()
+        self.__process__.join()
+        return metrics
+
+def runBanks(processes, banks: int = 2, sorting: gm.ISorting = None, size: int = gm.ProcessLine.DEFAULT_SIZE, placement: IPlacement = None, outputDir: str = None, parallel: bool = True, window: int = 1):
+    """Simula una máquina con varios bancos de memoria independientes. Un repartidor envía cada proceso que llega a un banco según la estrategia de reparto.
+    Los bancos solo se sincronizan en los instantes con llegadas: entre ellos cada banco avanza por su cuenta, sin esperas,
+    y el repartidor usa su estado al final del intervalo anterior a la llegada.
+    Con una ventana mayor que 1, cada envío reparte los procesos de varios instantes con llegadas usando el estado al principio de la ventana,
+    descontando la memoria de los procesos ya repartidos, por lo que hay menos mensajes pero el reparto puede cambiar.
+    Si la estrategia no depende del estado, cada banco se simula de principio a fin sin sincronizarse.
+
+    Args:
+        processes (list | ProcessStream): Procesos que van a ser añadidos
+        banks (int, optional): Número de bancos. Defaults to 2.
+        sorting (ISorting, optional): Método de búsqueda de huecos de todos los bancos. Defaults to BestFitSorting().
+        size (int, optional): Tamaño de cada banco. Defaults to ProcessLine.DEFAULT_SIZE.
+        placement (IPlacement, optional): Estrategia de reparto. Defaults to LeastLoadedPlacement().
+        outputDir (str, optional): Directorio donde escribir la línea temporal de cada banco y la combinada. Defaults to None, que no las escribe.
+        parallel (bool, optional): Simula cada banco en un proceso del sistema. Defaults to True.
+        window (int, optional): Número de instantes con llegadas que se reparten en cada envío. Defaults to 1, el reparto exacto.
+
+    Returns:
+        list: Métricas de cada banco
+    """
+    sorting = sorting if sorting is not None else gm.BestFitSorting()
+    placement = placement if placement is not None else LeastLoadedPlacement()
+    if outputDir is not None:
+        os.makedirs(outputDir, exist_ok=True)
+    if not isinstance(processes, gm.ProcessStream):
+        processes = gm.ArrivalIndex(processes)
+    shardClass = RemoteShard if parallel else LocalShard
+    shards = [shardClass(bank, sorting, size, outputDir) for bank in range(banks)]
+    if placement.stateless:
+        batches = [[] for _ in shards]
+        states = [shard.getState() for shard in shards]
+        while not processes.isEmpty():
+            for process in processes.getArrivals(processes.nextArrival()):
+                batches[placement.selectBank(process, states)].append(process)
+        for shard, batch in zip(shards, batches):
+            shard.run(batch)
+        for shard in shards:
+            shard.receive()
+    else:
+        states = [shard.getState() for shard in shards]
+        time = 1
+        while not processes.isEmpty():
+            steps = [[] for _ in shards]
+            for _ in range(window):
+                processes.getArrivals(time - 1) # descarta los procesos que ya no pueden llegar
+                arrival = processes.nextArrival()
+                if arrival is None:
+                    break
+                batches = [[] for _ in shards]
+                for process in processes.getArrivals(arrival):
+                    bank = placement.selectBank(process, states)
+                    batches[bank].append(process)
+                    space = sorting.getAllocationSize(process.memory)
+                    states[bank].free -= space
+                    states[bank].largestHole -= space
+                for step, batch in zip(steps, batches):
+                    if len(batch) != 0:
+                        step.append((arrival, batch))
+                time = arrival + 1
+            processes.getArrivals(time - 1)
+            until = processes.nextArrival()
+            for shard, step in zip(shards, steps):
+                shard.send(step, until)
+            states = [shard.receive() for shard in shards]
+    results = [shard.close() for shard in shards]
+    if outputDir is not None:
+        mergeTimelines([bankFilename(outputDir, bank) for bank in range(banks)], os.path.join(outputDir, "result.txt"), size)
+    return results
+
+def mergeTimelines(filenames: list, output: str, size: int):
+    """Combina las líneas temporales de los bancos en un archivo, con una línea por instante y los fragmentos de cada banco tras " | banco N:".
+    Los bancos que terminan antes se muestran vacíos
+
+    Args:
+        filenames (list): Archivos de la línea temporal de cada banco
+        output (str): Archivo combinado
+        size (int): Tamaño de cada banco
+    """
+    files = [open(filename) for filename in filenames]
+    empty = f" [0 hueco {size}]"
+    try:
+        with open(output, "w", buffering=1 << 20) as out:
+            time = 1
+            while True:
+                parts = []
+                finished = 0
+                for f in files:
+                    line = f.readline()
+                    if not line:
+                        finished += 1
+                        parts.append(empty)
+                    else:
+                        parts.append(line.rstrip("\n")[len(str(time)):])
+                if finished == len(files):
+                    return
+                out.write(f"{time}" + "".join(f" | banco {bank}:{part}" for bank, part in enumerate(parts)) + "\n")
+                time += 1
+    finally:
+        for f in files:
+            f.close()
+
+def formatBanks(results: list):
+    """Genera una tabla con las métricas de cada banco. Los bancos que rechazaron procesos se marcan con un asterisco
+
+    Args:
+        results (list): Métricas de cada banco
+
+    Returns:
+        str: Tabla de texto
+    """
+    rows = [f"{'Banco':>6} {'Colocados':>10} {'Rechazados':>11} {'Makespan':>9} {'Espera media':>13} {'Fragmentación máx.':>19} {'Utilización':>12}"]
+    for result in results:
+        rows.append(f"{cmp.flagRejected(str(result['bank']), result):>6} {result['placed']:>10} {result['rejected']:>11} {result['makespan']:>9} {result['meanWait']:>13.2f} {result['peakFragmentation']:>19.2%} {result['utilization']:>12.2%}")
+    return "\n".join(rows + cmp.getRejectedNote(results))
+
+PLACEMENTS = {"least": LeastLoadedPlacement, "hole": LargestHolePlacement, "hash": HashPlacement}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Simula una máquina con varios bancos de memoria, cada uno en un proceso del sistema")
+    parser.add_argument("file", nargs="?", default="samples/process.txt", help="Archivo de procesos, de texto o traza binaria")
+    parser.add_argument("--banks", type=int, default=2, help="Número de bancos")
+    parser.add_argument("--size", type=int, default=gm.ProcessLine.DEFAULT_SIZE, help="Tamaño de cada banco")
+    parser.add_argument("--sorting", choices=list(gm.SORTINGS), default="best", help="Método de búsqueda de huecos")
+    parser.add_argument("--placement", choices=list(PLACEMENTS), default="least", help="Estrategia de reparto: más memoria libre, hueco más grande o hash del nombre")
+    parser.add_argument("--output-dir", help="Directorio donde escribir la línea temporal de cada banco y la combinada")
+    parser.add_argument("--serial", action="store_true", help="Simula todos los bancos en este proceso")
+    parser.add_argument("--window", type=int, default=1, help="Instantes con llegadas que se reparten en cada envío. Más de 1 reduce los mensajes, pero el reparto usa un estado más antiguo")
+    args = parser.parse_args()
+    if args.window < 1:
+        parser.error("--window debe ser al menos 1")
+    results = runBanks(trazas.openProcesses(args.file), args.banks, gm.SORTINGS[args.sorting](), args.size, PLACEMENTS[args.placement](), args.output_dir, not args.serial, args.window)
+    print(formatBanks(results))
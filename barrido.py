@@ -0,0 +1,204 @@
+import os
+import csv
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import gestormemoria as gm #modulo gestor
+import comparador as cmp #métricas de la simulación
+import trazas #trazas binarias
+
+CACHE_VERSION = 2 #cambiarlo cuando cambien los resultados de la simulación invalida la caché
+CACHE_DIR = ".barrido" #directorio de la caché por defecto
+FIELDS = ["sorting", "size", "makespan", "placed", "rejected", "meanWait", "maxWait", "peakFragmentation", "internalFragmentation", "utilization"] #columnas del resumen
+
+def hashTrace(filename: str):
+    """Calcula el hash del contenido de una traza, de texto o binaria
+
+    Args:
+        filename (str): Nombre del archivo
+
+    Returns:
+        str: Hash SHA-256 en hexadecimal
+    """
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def getPointKey(traceHash: str, sorting: str, size: int):
+    """Calcula la clave de un punto del barrido en la caché.
+    Incluye los parámetros del método, para que dos configuraciones del mismo método no compartan resultado
+
+    Args:
+        traceHash (str): Hash de la traza, ver hashTrace
+        sorting (str): Método de búsqueda de huecos, clave de SORTINGS
+        size (int): Tamaño de la memoria
+
+    Returns:
+        str: Clave en hexadecimal
+    """
+    parameters = sorted(vars(gm.SORTINGS[sorting]()).items())
+    return hashlib.sha256(json.dumps([CACHE_VERSION, traceHash, sorting, parameters, size]).encode()).hexdigest()
+
+class SweepCache:
+    """Clase que representa la caché en disco de los resultados del barrido, con un archivo JSON por punto.
+    Los archivos se escriben en uno temporal y se renombran, por lo que varios barridos pueden compartir la caché.
+
+    Attributes:
+        directory (str): Directorio de la caché
+    """
+    def __init__(self, directory: str = CACHE_DIR) -> None:
+        """Constructor de la clase, crea el directorio si no existe
+
+        Args:
+            directory (str, optional): Directorio de la caché. Defaults to CACHE_DIR.
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def getFilename(self, key: str):
+        """Obtiene el archivo de un punto
+
+        Args:
+            key (str): Clave del punto, ver getPointKey
+
+        Returns:
+            str: Nombre del archivo
+        """
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str):
+        """Obtiene el resultado guardado de un punto
+
+        Args:
+            key (str): Clave del punto
+
+        Returns:
+            dict: Métricas del punto
+            None: en caso de que no esté guardado o el archivo no se pueda leer
+        """
+        try:
+            with open(self.getFilename(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, result: dict):
+        """Guarda el resultado de un punto
+
+        Args:
+            key (str): Clave del punto
+            result (dict): Métricas del punto
+        """
+        filename = self.getFilename(key)
+        temporary = f"{filename}.{os.getpid()}.tmp"
+        with open(temporary, 'w') as f:
+            json.dump(result, f)
+        os.replace(temporary, filename)
+
+def runPoint(filename: str, sorting: str, size: int):
+    """Simula la traza con un método y un tamaño. Se ejecuta en un proceso del pool, que lee la traza por su cuenta
+
+    Args:
+        filename (str): Archivo de procesos, de texto o traza binaria
+        sorting (str): Método de búsqueda de huecos, clave de SORTINGS
+        size (int): Tamaño de la memoria
+
+    Returns:
+        dict: Métricas de la simulación, ver comparador.runSorting
+    """
+    metrics = cmp.runSorting(gm.SORTINGS[sorting](), trazas.openProcesses(filename), size)
+    metrics["sorting"] = sorting
+    return metrics
+
+def sweep(filename: str, sizes: list, sortings: list = None, cache: SweepCache = None, workers: int = None):
+    """Simula la traza con cada combinación de tamaño de memoria y método en paralelo, uno por proceso del sistema.
+    Solo se simulan los puntos que no están en la caché, y se guardan según terminan.
+
+    Args:
+        filename (str): Archivo de procesos, de texto o traza binaria
+        sizes (list): Tamaños de la memoria
+        sortings (list, optional): Métodos de búsqueda de huecos, claves de SORTINGS. Defaults to todos.
+        cache (SweepCache, optional): Caché de resultados. Defaults to SweepCache(CACHE_DIR).
+        workers (int, optional): Número de procesos. Defaults to el número de núcleos.
+
+    Returns:
+        tuple: Métricas de cada punto, por tamaño y después por método, y número de puntos simulados
+    """
+    sortings = list(gm.SORTINGS) if sortings is None else sortings
+    cache = cache if cache is not None else SweepCache()
+    traceHash = hashTrace(filename)
+    points = [(size, sorting) for size in sizes for sorting in sortings]
+    keys = {point: getPointKey(traceHash, point[1], point[0]) for point in points}
+    results = {point: cache.get(keys[point]) for point in points}
+    missing = [point for point in points if results[point] is None]
+    if missing:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(runPoint, filename, sorting, size): (size, sorting) for size, sorting in missing}
+            for future in as_completed(futures):
+                point = futures[future]
+                results[point] = future.result()
+                cache.put(keys[point], results[point])
+    return [results[point] for point in points], len(missing)
+
+def writeSummary(filename: str, results: list):
+    """Escribe el resumen del barrido en CSV, una fila por punto
+
+    Args:
+        filename (str): Nombre del archivo
+        results (list): Métricas de cada punto
+    """
+    with open(filename, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+def formatSweep(results: list, metric: str = "makespan"):
+    """Genera una tabla con una métrica por tamaño de memoria (filas) y método (columnas).
+    Los puntos que rechazaron procesos se marcan con un asterisco
+
+    Args:
+        results (list): Métricas de cada punto
+        metric (str, optional): Métrica a mostrar. Defaults to "makespan".
+
+    Returns:
+        str: Tabla de texto
+    """
+    sortings = list(dict.fromkeys(result["sorting"] for result in results))
+    sizes = list(dict.fromkeys(result["size"] for result in results))
+    points = {(result["size"], result["sorting"]): result for result in results}
+    rows = [f"{metric}", f"{'Tamaño':>7} " + " ".join(f"{sorting:>13}" for sorting in sortings)]
+    for size in sizes:
+        cells = []
+        for sorting in sortings:
+            value = points[size, sorting][metric]
+            cells.append(cmp.flagRejected(f"{value:.4f}" if isinstance(value, float) else f"{value}", points[size, sorting]))
+        rows.append(f"{size:>7} " + " ".join(f"{cell:>13}" for cell in cells))
+    return "\n".join(rows + cmp.getRejectedNote(results))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Barrido de tamaños de memoria y métodos de búsqueda de huecos sobre una traza, con caché de resultados")
+    parser.add_argument("file", nargs="?", default="samples/process.txt", help="Archivo de procesos, de texto o traza binaria")
+    parser.add_argument("--sizes", type=int, nargs="+", help="Tamaños de la memoria")
+    parser.add_argument("--range", type=int, nargs=3, metavar=("INICIO", "FIN", "PASO"), help="Tamaños de la memoria de INICIO a FIN, incluido, de PASO en PASO")
+    parser.add_argument("--sorting", nargs="+", choices=list(gm.SORTINGS), default=list(gm.SORTINGS), help="Métodos de búsqueda de huecos")
+    parser.add_argument("--workers", type=int, help="Número de procesos en paralelo")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="Directorio de la caché de resultados")
+    parser.add_argument("--csv", help="Archivo CSV donde escribir el resumen, una fila por punto")
+    parser.add_argument("--metric", nargs="+", choices=FIELDS[2:], default=["makespan", "meanWait", "peakFragmentation"], help="Métricas de las tablas")
+    args = parser.parse_args()
+    sizes = list(args.sizes or [])
+    if args.range is not None:
+        start, stop, step = args.range
+        sizes += range(start, stop + 1, step)
+    if not sizes:
+        sizes = [gm.ProcessLine.DEFAULT_SIZE]
+    results, computed = sweep(args.file, sizes, args.sorting, SweepCache(args.cache_dir), args.workers)
+    for metric in args.metric:
+        print(formatSweep(results, metric), end="\n\n")
+    print(f"{computed} puntos simulados, {len(results) - computed} de la caché")
+    if args.csv is not None:
+        writeSummary(args.csv, results)
+        print(f"Resumen guardado en {args.csv}")
@@ -0,0 +1,60 @@
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import gestormemoria as gm #modulo gestor
+import generador as gen #generador de cargas
+import bancos #bancos de memoria
+
+def timeBanks(processes: list, banks: int, size: int, window: int, parallel: bool):
+    """Simula una carga en varios bancos y mide el tiempo
+
+    Args:
+        processes (list): Tuplas (nombre, llegada, memoria, duración)
+        banks (int): Número de bancos
+        size (int): Tamaño de cada banco
+        window (int): Instantes con llegadas que se reparten en cada envío
+        parallel (bool): Simula cada banco en un proceso del sistema
+
+    Returns:
+        tuple: Segundos y métricas de cada banco
+    """
+    start = time.perf_counter()
+    results = bancos.runBanks([gm.Process(*data) for data in processes], banks, gm.BestFitSorting(), size, bancos.LeastLoadedPlacement(), parallel=parallel, window=window)
+    return time.perf_counter() - start, results
+
+def compareModes(count: int, banks: list, windows: list, size: int, seed: int = 0):
+    """Compara la simulación de los bancos en este proceso y en un proceso por banco, para cada número de bancos y ventana.
+    Cada banco recibe de media un proceso cada cuatro intervalos, para que el búfer de admisión no domine el tiempo. Comprueba que ambas formas dan las mismas métricas
+
+    Args:
+        count (int): Número de procesos
+        banks (list): Números de bancos
+        windows (list): Ventanas de reparto, ver runBanks
+        size (int): Tamaño de cada banco
+        seed (int, optional): Semilla del generador. Defaults to 0.
+
+    Raises:
+        AssertionError: En caso de que las métricas en serie y en paralelo sean distintas
+    """
+    print(f"Núcleos: {os.cpu_count()}")
+    print(f"{'Bancos':>6} {'Ventana':>8} {'Serie (proc/s)':>15} {'Paralelo (proc/s)':>18} {'Aceleración':>12}")
+    for bankCount in banks:
+        processes = [(p.name, p.arribal, p.memory, p.execTime) for p in gen.generateWorkload(count, seed, "poisson", bankCount / 4, size=size)]
+        for window in windows:
+            serial, expected = timeBanks(processes, bankCount, size, window, False)
+            parallel, results = timeBanks(processes, bankCount, size, window, True)
+            if results != expected:
+                raise AssertionError(f"Métricas distintas en paralelo: {bankCount} bancos, ventana {window}")
+            print(f"{bankCount:>6} {window:>8} {count / serial:>15.0f} {count / parallel:>18.0f} {serial / parallel:>11.2f}x")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compara el rendimiento de los bancos de memoria en serie y en paralelo")
+    parser.add_argument("--count", type=int, default=20000, help="Número de procesos")
+    parser.add_argument("--banks", type=int, nargs="+", default=[2, 4], help="Números de bancos")
+    parser.add_argument("--windows", type=int, nargs="+", default=[1, 8, 64], help="Ventanas de reparto")
+    parser.add_argument("--size", type=int, default=gm.ProcessLine.DEFAULT_SIZE, help="Tamaño de cada banco")
+    args = parser.parse_args()
+    compareModes(args.count, args.banks, args.windows, args.size)
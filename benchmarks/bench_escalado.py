@@ -0,0 +1,128 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import resource
+import tempfile
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import gestormemoria as gm #modulo gestor
+import generador as gen #generador de cargas
+
+SORTINGS = gm.SORTINGS
+
+def runPoint(count: int, seed: int, sorting: str, size: int, arrivals: str, sizes: str, rate: float):
+    """Genera una traza, la carga y la simula sin esperas, midiendo el tiempo de cada fase.
+    Se ejecuta en un proceso nuevo para que el pico de memoria sea solo el de esta traza.
+    Usa FirstFitAdmission, ya que con llegadas por encima de la capacidad el buffer crece con la traza.
+
+    Args:
+        count (int): Número de procesos
+        seed (int): Semilla del generador
+        sorting (str): Método de búsqueda de huecos, clave de SORTINGS
+        size (int): Tamaño de la memoria
+        arrivals (str): Tipo de llegadas
+        sizes (str): Distribución de la memoria de los procesos
+        rate (float): Media de procesos que llegan por intervalo
+
+    Returns:
+        dict: Resultados de la medida
+    """
+    phases = {}
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "workload.txt")
+        start = time.perf_counter()
+        gen.writeWorkload(filename, gen.generateWorkload(count, seed, arrivals, rate, sizes=sizes, size=size))
+        phases["generate"] = time.perf_counter() - start
+        start = time.perf_counter()
+        processes = gm.generateProcessFromFile(filename)
+        phases["parse"] = time.perf_counter() - start
+    start = time.perf_counter()
+    processes = gm.ArrivalIndex(processes)
+    phases["index"] = time.perf_counter() - start
+    line = gm.ProcessLine(SORTINGS[sorting](), size, sink=gm.NullSink(), admission=gm.FirstFitAdmission()) # RetryAdmission reintenta todo el buffer en cada intervalo
+    start = time.perf_counter()
+    gm.runHeadless(line, processes)
+    phases["simulate"] = time.perf_counter() - start
+    ticks = line.__time__ - 1
+    return {
+        "count": count,
+        "sorting": sorting,
+        "ticks": ticks,
+        "placements": line.__order__,
+        "ticksPerSec": ticks / phases["simulate"],
+        "placementsPerSec": line.__order__ / phases["simulate"],
+        "peakRssKb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "phases": phases,
+    }
+
+def getCommit():
+    """Obtiene el commit actual del repositorio
+
+    Returns:
+        str: Hash corto del commit
+        None: en caso de que no se pueda obtener
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compareResults(results: list, baseline: dict):
+    """Genera una tabla con la variación de cada medida respecto a otra ejecución
+
+    Args:
+        results (list): Resultados de esta ejecución
+        baseline (dict): Contenido del JSON de la otra ejecución
+
+    Returns:
+        str: Tabla de texto
+    """
+    previous = {(result["count"], result["sorting"]): result for result in baseline["results"]}
+    rows = [f"Comparación con {baseline.get('commit')}", f"{'Procesos':>9} {'Método':>10} {'Intervalos/s':>13} {'Colocaciones/s':>15} {'Pico RSS':>9}"]
+    for result in results:
+        old = previous.get((result["count"], result["sorting"]))
+        if old is None:
+            continue
+        rows.append(f"{result['count']:>9} {result['sorting']:>10} {result['ticksPerSec'] / old['ticksPerSec'] - 1:>+13.1%} {result['placementsPerSec'] / old['placementsPerSec'] - 1:>+15.1%} {result['peakRssKb'] / old['peakRssKb'] - 1:>+9.1%}")
+    return "\n".join(rows)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Mide cómo escala la simulación sin esperas con el número de procesos de la traza")
+    parser.add_argument("counts", nargs="*", type=int, default=[1000, 10000, 100000, 1000000], help="Número de procesos de cada traza")
+    parser.add_argument("--sorting", nargs="+", choices=list(SORTINGS), default=list(SORTINGS), help="Métodos de búsqueda de huecos")
+    parser.add_argument("--size", type=int, default=gm.ProcessLine.DEFAULT_SIZE, help="Tamaño de la memoria")
+    parser.add_argument("--arrivals", choices=gen.ARRIVALS, default="poisson", help="Tipo de llegadas")
+    parser.add_argument("--sizes", choices=gen.SIZES, default="uniform", help="Distribución de la memoria de los procesos")
+    parser.add_argument("--rate", type=float, default=1.0, help="Media de procesos que llegan por intervalo")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla del generador")
+    parser.add_argument("--output", default="bench_escalado.json", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--compare", help="Archivo JSON de otra ejecución con el que comparar")
+    args = parser.parse_args()
+    results = []
+    print(f"{'Procesos':>9} {'Método':>10} {'Intervalos/s':>13} {'Colocaciones/s':>15} {'Pico RSS (MB)':>14} {'Generar (s)':>12} {'Leer (s)':>9} {'Simular (s)':>12}")
+    for count in args.counts:
+        for sorting in args.sorting:
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                result = pool.submit(runPoint, count, args.seed, sorting, args.size, args.arrivals, args.sizes, args.rate).result()
+            results.append(result)
+            phases = result["phases"]
+            print(f"{count:>9} {sorting:>10} {result['ticksPerSec']:>13.0f} {result['placementsPerSec']:>15.0f} {result['peakRssKb'] / 1024:>14.1f} {phases['generate']:>12.2f} {phases['parse'] + phases['index']:>9.2f} {phases['simulate']:>12.2f}")
+    report = {
+        "commit": getCommit(),
+        "python": platform.python_version(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "parameters": {"size": args.size, "arrivals": args.arrivals, "sizes": args.sizes, "rate": args.rate, "seed": args.seed},
+        "results": results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Resultados guardados en {args.output}")
+    if args.compare:
+        with open(args.compare) as f:
+            print(compareResults(results, json.load(f)))
@@ -0,0 +1,87 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import gestormemoria as gm #modulo gestor
+
+def generateFragments(count: int, seed: int = 0):
+    """Genera una memoria fragmentada alternando huecos y procesos de tamaño aleatorio
+
+    Args:
+        count (int): Número de fragmentos
+        seed (int, optional): Semilla del generador aleatorio. Defaults to 0.
+
+    Returns:
+        list: Lista de fragmentos ordenados por posición inicial
+    """
+    rand = random.Random(seed)
+    pages = []
+    position = 0
+    for i in range(count):
+        space = rand.randint(50, 5000)
+        process = None if i % 2 == 0 else gm.Process(f"P{i}", 1, space, 1)
+        page = gm.PageSpace(space, process)
+        page.start_position = position
+        page.end_position = position + space - 1
+        position += space
+        pages.append(page)
+    return pages
+
+def timeSearch(search, queries):
+    """Mide el tiempo medio de una búsqueda de hueco
+
+    Args:
+        search (function): Función que recibe el tamaño del proceso y devuelve el fragmento elegido
+        queries (list): Tamaños de proceso a buscar
+
+    Returns:
+        tuple: Tiempo medio por búsqueda en segundos y lista de fragmentos elegidos
+    """
+    chosen = []
+    start = time.perf_counter()
+    for size in queries:
+        try:
+            chosen.append(search(size))
+        except gm.InsuficientFragmentSpaceError:
+            chosen.append(None)
+    return (time.perf_counter() - start) / len(queries), chosen
+
+def timeUpdate(holes: gm.FreeHoleIndex, samples: list):
+    """Mide el tiempo medio de quitar un hueco del índice y volver a añadirlo, lo que hace la línea al ocupar o liberar un hueco.
+    Ambas operaciones desplazan las listas del índice, por lo que crecen linealmente con el número de huecos
+
+    Args:
+        holes (FreeHoleIndex): Índice de huecos
+        samples (list): Huecos del índice a actualizar
+
+    Returns:
+        float: Tiempo medio por actualización en segundos
+    """
+    start = time.perf_counter()
+    for page in samples:
+        holes.remove(page)
+        holes.add(page)
+    return (time.perf_counter() - start) / len(samples)
+
+if __name__ == '__main__':
+    counts = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 4000]
+    print(f"{'Fragmentos':>10} {'Método':>16} {'Lista (ms)':>12} {'Índice (ms)':>12}")
+    for count in counts:
+        pages = generateFragments(count)
+        holes = gm.FreeHoleIndex(pages)
+        queries = [random.Random(count).randint(1, 60) for _ in range(20)]
+        for sorting in (gm.BestFitSorting(), gm.WorstFitSorting()):
+            listTime, listChosen = timeSearch(lambda size: pages[sorting.searchPage(pages, size)], queries)
+            indexTime, indexChosen = timeSearch(lambda size: sorting.searchHole(pages, holes, size), queries)
+            if any(a is not b for a, b in zip(listChosen, indexChosen)):
+                raise AssertionError(f"{type(sorting).__name__} elige fragmentos distintos con {count} fragmentos")
+            print(f"{count:>10} {type(sorting).__name__:>16} {listTime * 1000:>12.3f} {indexTime * 1000:>12.4f}")
+    print()
+    print(f"{'Fragmentos':>10} {'Actualizar (us)':>16}")
+    for count in [1000, 10000, 100000, 1000000]:
+        pages = generateFragments(count)
+        holes = gm.FreeHoleIndex(pages)
+        samples = random.Random(count).choices(holes.pages, k=1000)
+        print(f"{count:>10} {timeUpdate(holes, samples) * 1e6:>16.3f}")
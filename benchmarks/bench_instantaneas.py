@@ -0,0 +1,119 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import gestormemoria as gm #modulo gestor
+
+def generateTrace(seed: int, count: int, size: int, span: int):
+    """Genera una traza aleatoria
+
+    Args:
+        seed (int): Semilla del generador aleatorio
+        count (int): Número de procesos
+        size (int): Tamaño de la memoria
+        span (int): Último instante de llegada
+
+    Returns:
+        list: Tuplas (nombre, llegada, memoria, duración)
+    """
+    rand = random.Random(seed)
+    return [(f"P{i}", rand.randint(1, span), rand.randint(1, size // 3 + 5) * rand.choice([1, 1, 1, 2]), rand.randint(1, rand.choice([3, 20]))) for i in range(count)]
+
+def simulate(line: gm.ProcessLine, processes: gm.ArrivalIndex, until: int = None):
+    """Avanza una línea intervalo a intervalo hasta un instante o hasta que termine la simulación
+
+    Args:
+        line (ProcessLine): Línea de procesos
+        processes (ArrivalIndex): Procesos por llegar
+        until (int, optional): Instante en el que se detiene, sin simularlo. Defaults to None, hasta el final.
+
+    Returns:
+        list: Instantes al final de los cuales quedó una compactación a medias
+    """
+    compacting = []
+    while (not processes.isEmpty() or len(line.__buff__) != 0 or not line.isEmpty()) and (until is None or line.__time__ < until):
+        line.update(processes=processes.getArrivals(line.__time__))
+        if line.__compacting__:
+            compacting.append(line.__time__)
+    return compacting
+
+def createCompaction(size: int):
+    """Crea una compactación parcial, que mueve poca memoria por intervalo para que queden compactaciones a medias
+
+    Args:
+        size (int): Tamaño de la memoria
+
+    Returns:
+        FragmentationCompaction: Política de compactación
+    """
+    return gm.FragmentationCompaction(threshold=0.3, maxMove=max(1, size // 40), moveCost=0.05)
+
+def checkSnapshots(seeds: int):
+    """Comprueba que una línea restaurada de una instantánea guardada en disco continúa igual que la línea sin interrumpir,
+    con instantáneas en medio de una compactación y en un instante aleatorio
+
+    Args:
+        seeds (int): Número de trazas
+
+    Raises:
+        AssertionError: En caso de que alguna línea temporal o el coste de la compactación sean distintos
+    """
+    checked = 0
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "line.snapshot")
+        for seed in range(seeds):
+            rand = random.Random(seed)
+            size = rand.choice([100, 500, 2000])
+            trace = generateTrace(seed, rand.randint(1, 40), size, rand.choice([5, 30, 200]))
+            for sortingClass in (gm.BestFitSorting, gm.WorstFitSorting, gm.FirstFitSorting, gm.SegregatedFitSorting):
+                sink = gm.MemorySink()
+                line = gm.ProcessLine(sortingClass(), size, sink=sink, compaction=createCompaction(size))
+                compacting = simulate(line, gm.ArrivalIndex([gm.Process(*data) for data in trace]))
+                expected = sink.getvalue().splitlines()
+                stats = line.compactionStats.asDict()
+                cuts = compacting[:3] + [rand.randint(1, line.__time__)]
+                for cut in cuts:
+                    processes = gm.ArrivalIndex([gm.Process(*data) for data in trace])
+                    line = gm.ProcessLine(sortingClass(), size, sink=gm.NullSink(), compaction=createCompaction(size))
+                    simulate(line, processes, cut)
+                    line.snapshot().save(filename)
+                    sink = gm.MemorySink()
+                    line = gm.ProcessLine.fromSnapshot(gm.LineSnapshot.load(filename), sink=sink, compaction=createCompaction(size))
+                    simulate(line, processes)
+                    if sink.getvalue().splitlines() != expected[cut - 1:] or line.compactionStats.asDict() != stats:
+                        raise AssertionError(f"Restauración distinta: semilla {seed}, {sortingClass.__name__}, instante {cut}")
+                    checked += 1
+    print(f"{checked} instantáneas restauradas con la misma línea temporal")
+
+def timeSnapshots(counts: list):
+    """Mide el tiempo de guardar y restaurar una línea con un número creciente de procesos residentes
+
+    Args:
+        counts (list): Número de procesos residentes de cada medida
+    """
+    print(f"{'Procesos':>9} {'Guardar (ms)':>13} {'Restaurar (ms)':>15} {'Tamaño (KB)':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "line.snapshot")
+        for count in counts:
+            line = gm.ProcessLine(gm.WorstFitSorting(), count * 20, sink=gm.NullSink())
+            processes = gm.ArrivalIndex([gm.Process(f"P{i}", 1 + i // 1000, random.Random(i).randint(1, 15), 1_000_000) for i in range(count)])
+            simulate(line, processes, 1 + count // 1000 + 1)
+            start = time.perf_counter()
+            line.snapshot().save(filename)
+            saved = time.perf_counter() - start
+            start = time.perf_counter()
+            gm.ProcessLine.fromSnapshot(gm.LineSnapshot.load(filename), sink=gm.NullSink())
+            restored = time.perf_counter() - start
+            print(f"{count:>9} {saved * 1000:>13.1f} {restored * 1000:>15.1f} {os.path.getsize(filename) / 1024:>12.1f}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Comprueba y mide las instantáneas de ProcessLine")
+    parser.add_argument("--seeds", type=int, default=200, help="Número de trazas aleatorias a comprobar")
+    parser.add_argument("counts", nargs="*", type=int, default=[10000, 100000], help="Número de procesos residentes a medir")
+    args = parser.parse_args()
+    checkSnapshots(args.seeds)
+    timeSnapshots(args.counts)
@@ -0,0 +1,73 @@
+import os
+import sys
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import gestormemoria as gm #modulo gestor
+
+class DictProcess:
+    """Proceso sin __slots__, igual que la versión anterior de Process. Sirve como referencia
+    """
+    def __init__(self, name: str, arribalTime: int, memory: int, execTime: int):
+        self.name = name
+        self.execTime = execTime
+        self.memory = memory
+        self.arribal = arribalTime
+
+class DictPageSpace:
+    """Fragmento sin __slots__, igual que la versión anterior de PageSpace. Sirve como referencia
+    """
+    def __init__(self, space, process = None) -> None:
+        self.process = process
+        self.space = space
+        self.end_position = space-1
+        self.start_position = 0
+
+def bytesPerObject(factory, count: int):
+    """Mide la memoria media que ocupa cada objeto creado
+
+    Args:
+        factory (function): Función que recibe un índice y crea un objeto
+        count (int): Número de objetos a crear
+
+    Returns:
+        float: Bytes por objeto
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return (used - sys.getsizeof(objects)) / len(objects)
+
+def bytesPerSegment(count: int):
+    """Mide la memoria media que ocupa cada fragmento de una línea de procesos llena de procesos pequeños,
+    incluyendo la lista y el índice de huecos, pero no los procesos
+
+    Args:
+        count (int): Número de procesos a añadir
+
+    Returns:
+        float: Bytes por fragmento
+    """
+    processes = gm.ArrivalIndex([gm.Process(f"P{i}", 1 + i // 1000, 1, 1_000_000) for i in range(count)])
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    line = gm.ProcessLine(gm.WorstFitSorting(), count, sink=gm.NullSink())
+    while not processes.isEmpty():
+        line.update(processes=processes.getArrivals(line.__time__))
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / len(line.processList)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Mide la memoria que ocupan los procesos y los fragmentos")
+    parser.add_argument("count", nargs="?", type=int, default=20000, help="Número de objetos a crear")
+    args = parser.parse_args()
+    print(f"{'Objeto':<28} {'Bytes':>8}")
+    print(f"{'Process':<28} {bytesPerObject(lambda i: gm.Process(f'P{i}', i, i, i), args.count):>8.1f}")
+    print(f"{'Process sin __slots__':<28} {bytesPerObject(lambda i: DictProcess(f'P{i}', i, i, i), args.count):>8.1f}")
+    print(f"{'PageSpace':<28} {bytesPerObject(lambda i: gm.PageSpace(i), args.count):>8.1f}")
+    print(f"{'PageSpace sin __slots__':<28} {bytesPerObject(lambda i: DictPageSpace(i), args.count):>8.1f}")
+    print(f"{'Fragmento en ProcessLine':<28} {bytesPerSegment(args.count):>8.1f}")
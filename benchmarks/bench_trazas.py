@@ -0,0 +1,42 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import gestormemoria as gm #modulo gestor
+import generador as gen #generador de cargas
+import trazas #trazas binarias
+
+def timeLoad(filename: str):
+    """Mide el tiempo hasta tener el primer proceso listo para simular y el de recorrer la traza entera
+
+    Args:
+        filename (str): Archivo de texto o traza binaria
+
+    Returns:
+        tuple: Segundos hasta el primer proceso y segundos hasta el último
+    """
+    start = time.perf_counter()
+    processes = trazas.openProcesses(filename)
+    first = time.perf_counter() - start
+    while not processes.isEmpty():
+        processes.getArrivals(processes.nextArrival())
+    return first, time.perf_counter() - start
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compara la carga de una traza de texto con la de la traza binaria equivalente")
+    parser.add_argument("counts", nargs="*", type=int, default=[100000, 1000000], help="Número de procesos de cada traza")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla del generador")
+    args = parser.parse_args()
+    print(f"{'Procesos':>9} {'Formato':>8} {'Tamaño (MB)':>12} {'Primer proceso (s)':>19} {'Traza entera (s)':>17}")
+    with tempfile.TemporaryDirectory() as directory:
+        for count in args.counts:
+            text = os.path.join(directory, "workload.txt")
+            binary = os.path.join(directory, "workload.trace")
+            gen.writeWorkload(text, gen.generateWorkload(count, args.seed))
+            trazas.convertText(text, binary)
+            for label, filename in (("texto", text), ("binaria", binary)):
+                first, total = timeLoad(filename)
+                print(f"{count:>9} {label:>8} {os.path.getsize(filename) / 2**20:>12.1f} {first:>19.3f} {total:>17.3f}")
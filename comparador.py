@@ -0,0 +1,286 @@
+import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import gestormemoria as gm #modulo gestor
+import trazas #trazas binarias
+
+REJECTED_NOTE = "* Rechazó procesos que no caben en la memoria: su makespan, espera y utilización no cubren la traza completa" #nota de las tablas
+
+class MetricsSink(gm.ITimelineSink):
+    """Clase que calcula las métricas de la simulación a partir de la línea temporal de la memoria.
+    Puede reenviar la línea temporal a otro destino.
+
+    Attributes:
+        sink (ITimelineSink): Destino al que se reenvía la línea temporal
+        makespan (int): Último instante escrito
+        ticks (int): Número de instantes escritos
+        usedTicks (int): Suma de la memoria ocupada en cada instante
+        wastedTicks (int): Suma de la memoria reservada que los procesos no usan en cada instante
+        peakFragmentation (float): Mayor fragmentación externa observada
+        waits (list): Tiempo de espera en el buffer de cada proceso que ha entrado en memoria
+    """
+    def __init__(self, sink: gm.ITimelineSink = None) -> None:
+        """Constructor de la clase
+
+        Args:
+            sink (ITimelineSink, optional): Destino al que se reenvía la línea temporal. Defaults to NullSink().
+        """
+        self.sink = sink if sink is not None else gm.NullSink()
+        self.makespan = 0
+        self.ticks = 0
+        self.usedTicks = 0
+        self.wastedTicks = 0
+        self.peakFragmentation = 0.0
+        self.waits = []
+        self.__seen__ = set()
+
+    def write(self, time: int, line: gm.ProcessLine):
+        self.__sample__(time, 1, line)
+        self.sink.write(time, line)
+
+    def writeRepeated(self, start: int, end: int, line: gm.ProcessLine):
+        self.__sample__(end - 1, end - start, line)
+        self.sink.writeRepeated(start, end, line)
+
+    def close(self):
+        self.sink.close()
+
+    def __sample__(self, time: int, ticks: int, line: gm.ProcessLine):
+        """Añade a las métricas el estado de la memoria durante varios instantes iguales
+
+        Args:
+            time (int): Último instante del intervalo
+            ticks (int): Número de instantes del intervalo
+            line (ProcessLine): Línea de procesos
+        """
+        used = 0
+        wasted = 0
+        largest = 0
+        for page in line.processList:
+            if page.process is None:
+                largest = max(largest, page.space)
+                continue
+            used += page.space
+            wasted += page.space - page.process.memory
+            if page.process not in self.__seen__: # guarda el proceso y no su id, que se reutiliza al liberarlo
+                self.__seen__.add(page.process)
+                self.waits.append(time - page.process.arribal)
+        free = line.size - used
+        if free > 0:
+            self.peakFragmentation = max(self.peakFragmentation, 1 - largest / free)
+        self.makespan = time
+        self.ticks += ticks
+        self.usedTicks += used * ticks
+        self.wastedTicks += wasted * ticks
+
+    def getMetrics(self, size: int):
+        """Obtiene el resumen de las métricas
+
+        Args:
+            size (int): Tamaño de la memoria simulada
+
+        Returns:
+            dict: Métricas de la simulación
+        """
+        return {
+            "makespan": self.makespan,
+            "placed": len(self.waits),
+            "meanWait": sum(self.waits) / len(self.waits) if self.waits else 0.0,
+            "maxWait": max(self.waits, default=0),
+            "peakFragmentation": self.peakFragmentation,
+            "utilization": self.usedTicks / (size * self.ticks) if self.ticks else 0.0,
+            "internalFragmentation": self.wastedTicks / self.usedTicks if self.usedTicks else 0.0,
+        }
+
+def runSorting(sorting: gm.ISorting, processes: list, size: int = gm.ProcessLine.DEFAULT_SIZE, output: str = None, compaction: gm.ICompaction = None):
+    """Simula la traza con un método de búsqueda de huecos y obtiene sus métricas.
+
+    Args:
+        sorting (ISorting): Método de búsqueda de huecos
+        processes (list): Lista de procesos de la traza
+        size (int, optional): Tamaño de la memoria. Defaults to ProcessLine.DEFAULT_SIZE.
+        output (str, optional): Archivo donde escribir la línea temporal. Defaults to None, que no la escribe.
+        compaction (ICompaction, optional): Política de compactación. Defaults to None, sin compactación.
+
+    Returns:
+        dict: Métricas de la simulación, junto al nombre del método, el tamaño de memoria, los procesos rechazados y el coste de la compactación
+    """
+    sink = MetricsSink(gm.BufferedFileSink(output) if output is not None else None)
+    line = gm.ProcessLine(sorting, size, sink=sink, compaction=compaction)
+    gm.runHeadless(line, processes)
+    line.close()
+    metrics = sink.getMetrics(size)
+    metrics["sorting"] = type(sorting).__name__
+    metrics["size"] = size
+    metrics["rejected"] = line.__rejected__
+    metrics["compaction"] = type(compaction).__name__ if compaction is not None else None
+    metrics.update(line.compactionStats.asDict())
+    return metrics
+
+def compareCompactions(processes: list, compactions: list, sorting: gm.ISorting = None, size: int = gm.ProcessLine.DEFAULT_SIZE, workers: int = None):
+    """Simula la misma traza sin compactación y con cada política de compactación en paralelo, uno por proceso del sistema.
+
+    Args:
+        processes (list): Lista de procesos de la traza
+        compactions (list): Políticas de compactación
+        sorting (ISorting, optional): Método de búsqueda de huecos. Defaults to BestFitSorting().
+        size (int, optional): Tamaño de la memoria. Defaults to ProcessLine.DEFAULT_SIZE.
+        workers (int, optional): Número de procesos. Defaults to el número de núcleos.
+
+    Returns:
+        list: Métricas sin compactación seguidas de las de cada política
+    """
+    sorting = sorting if sorting is not None else gm.BestFitSorting()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(runSorting, sorting, processes, size, None, compaction) for compaction in [None] + list(compactions)]
+        return [future.result() for future in futures]
+
+def flagRejected(name: str, result: dict):
+    """Marca con un asterisco el nombre de una fila cuya simulación rechazó procesos, ver REJECTED_NOTE
+
+    Args:
+        name (str): Nombre de la fila
+        result (dict): Métricas de la simulación
+
+    Returns:
+        str: Nombre, con el asterisco si hubo rechazos
+    """
+    return f"{name}*" if result.get("rejected") else name
+
+def getRejectedNote(results: list):
+    """Obtiene la nota que acompaña a una tabla con filas marcadas por flagRejected
+
+    Args:
+        results (list): Métricas de cada fila
+
+    Returns:
+        list: Filas de la nota, vacía si no hubo rechazos
+    """
+    return [REJECTED_NOTE] if any(result.get("rejected") for result in results) else []
+
+def formatCompactions(results: list):
+    """Genera una tabla con el rendimiento y el coste de cada política de compactación
+
+    Args:
+        results (list): Métricas de cada política
+
+    Returns:
+        str: Tabla de texto
+    """
+    rows = [f"{'Compactación':<24} {'Tamaño':>7} {'Colocados':>10} {'Rechazados':>11} {'Makespan':>9} {'Procesos/intervalo':>19} {'Espera media':>13} {'Espera máx.':>12} {'Movimientos':>12} {'Memoria movida':>15} {'Retraso':>8}"]
+    for result in results:
+        throughput = result['placed'] / result['makespan'] if result['makespan'] else 0.0
+        rows.append(f"{flagRejected(result['compaction'] or 'Ninguna', result):<24} {result['size']:>7} {result['placed']:>10} {result['rejected']:>11} {result['makespan']:>9} {throughput:>19.3f} {result['meanWait']:>13.2f} {result['maxWait']:>12} {result['moves']:>12} {result['movedMemory']:>15} {result['delay']:>8}")
+    return "\n".join(rows + getRejectedNote(results))
+
+def compareSortings(processes: list, sortings: list = None, size: int = gm.ProcessLine.DEFAULT_SIZE, outputDir: str = None, workers: int = None):
+    """Simula la misma traza con varios métodos de búsqueda de huecos en paralelo, uno por proceso del sistema.
+
+    Args:
+        processes (list): Lista de procesos de la traza
+        sortings (list, optional): Métodos de búsqueda de huecos. Defaults to uno de cada método de SORTINGS.
+        size (int, optional): Tamaño de la memoria. Defaults to ProcessLine.DEFAULT_SIZE.
+        outputDir (str, optional): Directorio donde escribir un archivo "result_<método>.txt" por método. Defaults to None, que no los escribe.
+        workers (int, optional): Número de procesos. Defaults to el número de núcleos.
+
+    Returns:
+        list: Métricas de cada método, en el mismo orden que sortings
+    """
+    if sortings is None:
+        sortings = [sortingClass() for sortingClass in gm.SORTINGS.values()]
+    outputs = [None] * len(sortings)
+    if outputDir is not None:
+        os.makedirs(outputDir, exist_ok=True)
+        outputs = [os.path.join(outputDir, f"result_{type(sorting).__name__}.txt") for sorting in sortings]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(runSorting, sorting, processes, size, output) for sorting, output in zip(sortings, outputs)]
+        return [future.result() for future in futures]
+
+def runFork(snapshot: gm.LineSnapshot, processes, sorting: gm.ISorting = None, size: int = None, output: str = None):
+    """Continúa la simulación de una instantánea con otro método de búsqueda de huecos u otro tamaño de memoria y obtiene sus métricas.
+    Las métricas solo cubren los instantes simulados desde la instantánea.
+
+    Args:
+        snapshot (LineSnapshot): Estado de la línea
+        processes (list | str): Lista de procesos de la traza completa, o nombre del archivo de la traza
+        sorting (ISorting, optional): Método de búsqueda de huecos. Defaults to el de la instantánea.
+        size (int, optional): Tamaño de la memoria. Defaults to el de la instantánea.
+        output (str, optional): Archivo donde escribir la línea temporal. Defaults to None, que no la escribe.
+
+    Returns:
+        dict: Métricas de la simulación, junto al nombre del método, el tamaño de memoria y los procesos rechazados
+    """
+    stream = trazas.openProcesses(processes) if isinstance(processes, str) else gm.ArrivalIndex(processes)
+    stream.advance(snapshot.cursor or 0)
+    sink = MetricsSink(gm.BufferedFileSink(output) if output is not None else None)
+    line = gm.ProcessLine.fromSnapshot(snapshot, sink=sink, sorting=sorting, size=size)
+    gm.runHeadless(line, stream)
+    stream.close()
+    line.close()
+    metrics = sink.getMetrics(line.size)
+    metrics["sorting"] = type(line.sorting).__name__
+    metrics["size"] = line.size
+    metrics["rejected"] = line.__rejected__
+    return metrics
+
+def forkSnapshot(snapshot: gm.LineSnapshot, processes, variants: list, workers: int = None):
+    """Continúa la misma instantánea con varias combinaciones de método de búsqueda y tamaño de memoria en paralelo, una por proceso del sistema.
+
+    Args:
+        snapshot (LineSnapshot): Estado de la línea
+        processes (list | str): Lista de procesos de la traza completa, o nombre del archivo de la traza
+        variants (list): Tuplas (método de búsqueda, tamaño). None en cualquiera de ellos mantiene el de la instantánea
+        workers (int, optional): Número de procesos. Defaults to el número de núcleos.
+
+    Returns:
+        list: Métricas de cada combinación, en el mismo orden que variants
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(runFork, snapshot, processes, sorting, size) for sorting, size in variants]
+        return [future.result() for future in futures]
+
+def formatMetrics(results: list):
+    """Genera una tabla con las métricas de cada método. Los métodos que rechazaron procesos se marcan con un asterisco,
+    ya que sus métricas no son comparables con las del resto
+
+    Args:
+        results (list): Métricas de cada método
+
+    Returns:
+        str: Tabla de texto
+    """
+    rows = [f"{'Método':<21} {'Tamaño':>7} {'Colocados':>10} {'Rechazados':>11} {'Makespan':>9} {'Espera media':>13} {'Fragmentación máx.':>19} {'Frag. interna':>14} {'Utilización':>12}"]
+    for result in results:
+        rows.append(f"{flagRejected(result['sorting'], result):<21} {result['size']:>7} {result['placed']:>10} {result['rejected']:>11} {result['makespan']:>9} {result['meanWait']:>13.2f} {result['peakFragmentation']:>19.2%} {result['internalFragmentation']:>14.2%} {result['utilization']:>12.2%}")
+    return "\n".join(rows + getRejectedNote(results))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compara los métodos de búsqueda de huecos sobre la misma traza")
+    parser.add_argument("file", nargs="?", default="samples/process.txt", help="Archivo de procesos, de texto o traza binaria")
+    parser.add_argument("--sorting", nargs="+", choices=list(gm.SORTINGS), default=list(gm.SORTINGS), help="Métodos de búsqueda de huecos a comparar")
+    parser.add_argument("--size", type=int, nargs="+", help="Tamaños de la memoria, se simula cada uno. Por defecto, el de ProcessLine o el de la instantánea")
+    parser.add_argument("--output-dir", help="Directorio donde escribir la línea temporal de cada método")
+    parser.add_argument("--workers", type=int, help="Número de procesos en paralelo")
+    parser.add_argument("--from-snapshot", help="Continúa la instantánea guardada con cada método y tamaño en lugar de simular la traza desde el principio")
+    parser.add_argument("--compaction", action="store_true", help="Compara la simulación sin compactación con la compactación por fragmentación y por espera")
+    parser.add_argument("--compaction-threshold", type=float, default=0.5, help="Fragmentación a partir de la que se compacta")
+    parser.add_argument("--compaction-wait", type=int, default=10, help="Espera a partir de la que se compacta")
+    parser.add_argument("--max-move", type=int, help="Memoria máxima que se mueve en cada intervalo al compactar")
+    parser.add_argument("--move-cost", type=float, default=0.0, help="Intervalos de retraso por unidad de memoria movida al compactar")
+    args = parser.parse_args()
+    sortings = [gm.SORTINGS[name]() for name in args.sorting]
+    if args.output_dir is not None and args.size is not None and len(args.size) > 1:
+        parser.error("--output-dir solo admite un --size, ya que cada método escribe un único archivo")
+    if args.compaction:
+        sizes = args.size if args.size is not None else [gm.ProcessLine.DEFAULT_SIZE]
+        compactions = [gm.FragmentationCompaction(args.compaction_threshold, args.max_move, args.move_cost), gm.AgeCompaction(args.compaction_wait, args.max_move, args.move_cost)]
+        processes = trazas.loadProcesses(args.file)
+        print(formatCompactions([result for size in sizes for result in compareCompactions(processes, compactions, size=size, workers=args.workers)]))
+    elif args.from_snapshot is not None:
+        sizes = args.size if args.size is not None else [None]
+        variants = [(gm.SORTINGS[name](), size) for size in sizes for name in args.sorting]
+        print(formatMetrics(forkSnapshot(gm.LineSnapshot.load(args.from_snapshot), args.file, variants, workers=args.workers)))
+    else:
+        sizes = args.size if args.size is not None else [gm.ProcessLine.DEFAULT_SIZE]
+        processes = trazas.loadProcesses(args.file)
+        print(formatMetrics([result for size in sizes for result in compareSortings(processes, sortings, size=size, outputDir=args.output_dir, workers=args.workers)]))
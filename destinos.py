@@ -0,0 +1,116 @@
+from abc import ABC, abstractmethod
+
+class ITimelineSink(ABC): #clase abstracta
+    """Clase abstracta que representa el destino de la línea temporal de la memoria que se genera en cada intervalo.
+    Nota: Hereda la clase ABC que indica que la clase es abstracta
+    """
+    @abstractmethod
+    def write(self, time: int, line: "ProcessLine"):
+        """Escribe el estado de la memoria en el instante dado
+
+        Args:
+            time (int): Instante de tiempo
+            line (ProcessLine): Línea de procesos de la que se escribe el estado
+        """
+        pass #abstract
+
+    def writeRepeated(self, start: int, end: int, line: "ProcessLine"):
+        """Escribe el mismo estado de la memoria para todos los instantes de un intervalo sin cambios
+
+        Args:
+            start (int): Primer instante
+            end (int): Instante siguiente al último
+            line (ProcessLine): Línea de procesos de la que se escribe el estado
+        """
+        for time in range(start, end):
+            self.write(time, line)
+
+    def close(self):
+        """Termina la escritura. Por defecto no hace nada
+        """
+        pass
+
+class TextFileSink(ITimelineSink):
+    """Clase que escribe la línea temporal en un archivo de texto, abriéndolo en cada escritura.
+    Vacía el archivo al construirse.
+
+    Attributes:
+        filename (str): Nombre del archivo de salida
+    """
+    def __init__(self, filename: str = "result.txt") -> None:
+        """Constructor de la clase, vacía el archivo de salida
+
+        Args:
+            filename (str, optional): Nombre del archivo de salida. Defaults to "result.txt".
+        """
+        self.filename = filename
+        open(filename, "w").close() #limpiar archivo resultado
+
+    def write(self, time: int, line: "ProcessLine"):
+        f = open(self.filename, "a")
+        f.write(f"{time}{line.getTimeline()}\n")
+        f.close()
+
+    def writeRepeated(self, start: int, end: int, line: "ProcessLine"):
+        timeline = line.getTimeline()
+        f = open(self.filename, "a")
+        f.writelines(f"{time}{timeline}\n" for time in range(start, end))
+        f.close()
+
+class BufferedFileSink(TextFileSink):
+    """Clase que escribe la línea temporal en un archivo de texto que se mantiene abierto con un buffer grande.
+    Es necesario llamar a close para que se escriba todo el contenido.
+
+    Attributes:
+        filename (str): Nombre del archivo de salida
+        bufferSize (int): Tamaño del buffer de escritura en bytes
+    """
+    def __init__(self, filename: str = "result.txt", bufferSize: int = 1 << 20) -> None:
+        """Constructor de la clase, abre el archivo de salida vaciándolo
+
+        Args:
+            filename (str, optional): Nombre del archivo de salida. Defaults to "result.txt".
+            bufferSize (int, optional): Tamaño del buffer de escritura en bytes. Defaults to 1 MiB.
+        """
+        self.filename = filename
+        self.bufferSize = bufferSize
+        self.__file__ = open(filename, "w", buffering=bufferSize)
+
+    def write(self, time: int, line: "ProcessLine"):
+        self.__file__.write(f"{time}{line.getTimeline()}\n")
+
+    def writeRepeated(self, start: int, end: int, line: "ProcessLine"):
+        timeline = line.getTimeline()
+        self.__file__.writelines(f"{time}{timeline}\n" for time in range(start, end))
+
+    def close(self):
+        self.__file__.close()
+
+class MemorySink(ITimelineSink):
+    """Clase que guarda la línea temporal en memoria
+
+    Attributes:
+        lines (list): Líneas escritas, con el mismo formato que el archivo de texto
+    """
+    def __init__(self) -> None:
+        self.lines = []
+
+    def write(self, time: int, line: "ProcessLine"):
+        self.lines.append(f"{time}{line.getTimeline()}\n")
+
+    def getvalue(self):
+        """Obtiene el contenido completo de la línea temporal
+
+        Returns:
+            str: Contenido igual al del archivo de texto
+        """
+        return "".join(self.lines)
+
+class NullSink(ITimelineSink):
+    """Clase que descarta la línea temporal, sin llegar a generarla. Útil para medir el rendimiento de la simulación
+    """
+    def write(self, time: int, line: "ProcessLine"):
+        pass
+
+    def writeRepeated(self, start: int, end: int, line: "ProcessLine"):
+        pass
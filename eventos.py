@@ -0,0 +1,239 @@
+from collections import deque
+from abc import ABC, abstractmethod
+
+class SimulationEvent: #struct
+    """Clase base de los eventos que emite la línea de procesos
+
+    Attributes:
+        time (int): Instante en el que ocurre el evento
+    """
+    __slots__ = ("time",)
+
+    def __init__(self, time: int) -> None:
+        self.time = time
+
+    def describe(self):
+        """Genera el mensaje del evento que se muestra por consola
+
+        Returns:
+            str: Mensaje del evento
+            None: en caso de que el evento no se muestre
+        """
+        return None
+
+class TickStartEvent(SimulationEvent):
+    """Evento de comienzo de un intervalo
+    """
+    __slots__ = ()
+
+    def describe(self):
+        return f"{self.time} -> {self.time+1}"
+
+class TickEndEvent(SimulationEvent):
+    """Evento de final de un intervalo
+    """
+    __slots__ = ()
+
+    def describe(self):
+        return "-------------------"
+
+class ArriveEvent(SimulationEvent):
+    """Evento de llegada de un proceso
+
+    Attributes:
+        process (Process): Proceso que llega
+    """
+    __slots__ = ("process",)
+
+    def __init__(self, time: int, process: "Process") -> None:
+        super().__init__(time)
+        self.process = process
+
+class PlaceEvent(SimulationEvent):
+    """Evento de entrada de un proceso en memoria
+
+    Attributes:
+        process (Process): Proceso que entra
+        position (int): Posición inicial del proceso en memoria
+        space (int): Memoria reservada para el proceso, ver ISorting.getAllocationSize
+    """
+    __slots__ = ("process", "position", "space")
+
+    def __init__(self, time: int, process: "Process", position: int, space: int = None) -> None:
+        super().__init__(time)
+        self.process = process
+        self.position = position
+        self.space = process.memory if space is None else space
+
+    def describe(self):
+        return f"Joining: {self.process} in space: Position:{self.position}-{self.position + self.process.memory - 1}, Process:[{self.process}]"
+
+class DeferEvent(SimulationEvent):
+    """Evento de paso de un proceso al buffer
+
+    Attributes:
+        process (Process): Proceso que pasa al buffer
+        reason (InsuficientFragmentSpaceError): Error de la búsqueda de hueco. None si la política de admisión no le deja intentarlo
+    """
+    __slots__ = ("process", "reason")
+
+    def __init__(self, time: int, process: "Process", reason: "InsuficientFragmentSpaceError" = None) -> None:
+        super().__init__(time)
+        self.process = process
+        self.reason = reason
+
+    def describe(self):
+        if self.reason is None:
+            return None
+        return f"Process: {self.process} {self.reason}"
+
+class RejectEvent(SimulationEvent):
+    """Evento de rechazo de un proceso que no cabe en la memoria
+
+    Attributes:
+        process (Process): Proceso rechazado
+        reason (NoMoreSpaceError): Error del rechazo
+    """
+    __slots__ = ("process", "reason")
+
+    def __init__(self, time: int, process: "Process", reason: "NoMoreSpaceError") -> None:
+        super().__init__(time)
+        self.process = process
+        self.reason = reason
+
+    def describe(self):
+        return f"Process: {self.process} {self.reason}"
+
+class DepartEvent(SimulationEvent):
+    """Evento de salida de un proceso de memoria
+
+    Attributes:
+        process (Process): Proceso que sale
+        position (int): Posición inicial que ocupaba el proceso
+    """
+    __slots__ = ("process", "position")
+
+    def __init__(self, time: int, process: "Process", position: int) -> None:
+        super().__init__(time)
+        self.process = process
+        self.position = position
+
+    def describe(self):
+        return f"Leaving: {self.process}"
+
+class CoalesceEvent(SimulationEvent):
+    """Evento de unión de huecos consecutivos
+
+    Attributes:
+        position (int): Posición inicial del hueco unido
+        space (int): Tamaño del hueco unido
+        merged (int): Número de huecos que se han unido al primero
+    """
+    __slots__ = ("position", "space", "merged")
+
+    def __init__(self, time: int, position: int, space: int, merged: int) -> None:
+        super().__init__(time)
+        self.position = position
+        self.space = space
+        self.merged = merged
+
+class MoveEvent(SimulationEvent):
+    """Evento de movimiento de un proceso al compactar la memoria
+
+    Attributes:
+        process (Process): Proceso movido
+        source (int): Posición inicial anterior
+        position (int): Posición inicial nueva
+        delay (int): Intervalos que se retrasa la salida del proceso
+    """
+    __slots__ = ("process", "source", "position", "delay")
+
+    def __init__(self, time: int, process: "Process", source: int, position: int, delay: int) -> None:
+        super().__init__(time)
+        self.process = process
+        self.source = source
+        self.position = position
+        self.delay = delay
+
+    def describe(self):
+        return f"Moving: {self.process} from: {self.source} to: {self.position}"
+
+class IEventListener(ABC): #clase abstracta
+    """Clase abstracta que representa un consumidor de los eventos de la línea de procesos.
+    Nota: Hereda la clase ABC que indica que la clase es abstracta
+    """
+    @abstractmethod
+    def onEvent(self, event: SimulationEvent):
+        """Recibe un evento
+
+        Args:
+            event (SimulationEvent): Evento emitido
+        """
+        pass #abstract
+
+class ConsoleLogger(IEventListener):
+    """Clase que muestra los eventos por consola con los mensajes de siempre
+
+    Attributes:
+        file (file): Archivo donde se escriben los mensajes. None para la salida estándar
+    """
+    def __init__(self, file = None) -> None:
+        """Constructor de la clase
+
+        Args:
+            file (file, optional): Archivo donde se escriben los mensajes. Defaults to None, la salida estándar.
+        """
+        self.file = file
+
+    def onEvent(self, event: SimulationEvent):
+        text = event.describe()
+        if text is not None:
+            print(text, file=self.file)
+
+class EventRecorder(IEventListener):
+    """Clase que guarda los eventos hasta que se consumen. Al recorrerla, saca los eventos guardados en orden
+    """
+    def __init__(self) -> None:
+        self.__events__ = deque()
+
+    def __len__(self) -> int:
+        return len(self.__events__)
+
+    def __iter__(self):
+        while self.__events__:
+            yield self.__events__.popleft()
+
+    def onEvent(self, event: SimulationEvent):
+        self.__events__.append(event)
+
+class EventSource:
+    """Clase base de las líneas de procesos que emiten eventos.
+    Los eventos solo se crean si hay algún consumidor, por lo que sin consumidores no tienen coste.
+
+    Attributes:
+        listeners (list): Consumidores de los eventos
+    """
+    def subscribe(self, listener: IEventListener):
+        """Añade un consumidor de los eventos
+
+        Args:
+            listener (IEventListener): Consumidor a añadir
+        """
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener: IEventListener):
+        """Quita un consumidor de los eventos
+
+        Args:
+            listener (IEventListener): Consumidor a quitar
+        """
+        self.listeners.remove(listener)
+
+    def __emit__(self, event: SimulationEvent):
+        """Envía un evento a todos los consumidores
+
+        Args:
+            event (SimulationEvent): Evento a enviar
+        """
+        for listener in self.listeners:
+            listener.onEvent(event)
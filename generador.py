@@ -0,0 +1,127 @@
+import math
+import random
+import argparse
+import gestormemoria as gm #modulo gestor
+
+ARRIVALS = ["poisson", "bursty"]
+SIZES = ["uniform", "lognormal", "bimodal"]
+
+def iterArrivals(rand: random.Random, kind: str, rate: float, burstSize: int = 20):
+    """Genera los instantes de llegada de los procesos, en orden creciente y empezando en 1
+
+    Args:
+        rand (Random): Generador aleatorio
+        kind (str): "poisson" para llegadas independientes, "bursty" para ráfagas de procesos que llegan en el mismo instante
+        rate (float): Media de procesos que llegan por intervalo
+        burstSize (int, optional): Con "bursty", media de procesos por ráfaga. Defaults to 20.
+
+    Raises:
+        ValueError: En caso de que el tipo de llegada no exista
+
+    Yields:
+        int: Instante de llegada del siguiente proceso
+    """
+    clock = 0.0
+    if kind == "poisson":
+        while True:
+            clock += rand.expovariate(rate)
+            yield 1 + int(clock)
+    elif kind == "bursty":
+        while True:
+            clock += rand.expovariate(rate / burstSize)
+            for _ in range(1 + int(rand.expovariate(1 / burstSize))):
+                yield 1 + int(clock)
+    else:
+        raise ValueError(f"Tipo de llegada no válido: {kind}")
+
+def randomMemory(rand: random.Random, kind: str, minMemory: int, maxMemory: int):
+    """Genera la memoria de un proceso
+
+    Args:
+        rand (Random): Generador aleatorio
+        kind (str): "uniform", "lognormal" (muchos procesos pequeños y pocos grandes) o "bimodal" (procesos pequeños y grandes, 80%/20%)
+        minMemory (int): Memoria mínima
+        maxMemory (int): Memoria máxima
+
+    Raises:
+        ValueError: En caso de que la distribución no exista
+
+    Returns:
+        int: Memoria del proceso, entre minMemory y maxMemory
+    """
+    if kind == "uniform":
+        return rand.randint(minMemory, maxMemory)
+    if kind == "lognormal":
+        memory = rand.lognormvariate(math.log(minMemory + (maxMemory - minMemory) / 8), 0.8)
+    elif kind == "bimodal":
+        low = minMemory + (maxMemory - minMemory) * (0.1 if rand.random() < 0.8 else 0.7)
+        memory = rand.gauss(low, (maxMemory - minMemory) / 20)
+    else:
+        raise ValueError(f"Distribución de memoria no válida: {kind}")
+    return min(maxMemory, max(minMemory, round(memory)))
+
+def generateWorkload(count: int, seed: int = 0, arrivals: str = "poisson", rate: float = 1.0, burstSize: int = 20, sizes: str = "uniform", minMemory: int = 1, maxMemory: int = None, minDuration: int = 1, maxDuration: int = 10, size: int = gm.ProcessLine.DEFAULT_SIZE):
+    """Genera una carga de trabajo sintética, reproducible a partir de la semilla
+
+    Args:
+        count (int): Número de procesos
+        seed (int, optional): Semilla del generador aleatorio. Defaults to 0.
+        arrivals (str, optional): Tipo de llegadas, ver iterArrivals. Defaults to "poisson".
+        rate (float, optional): Media de procesos que llegan por intervalo. Defaults to 1.0.
+        burstSize (int, optional): Con llegadas "bursty", media de procesos por ráfaga. Defaults to 20.
+        sizes (str, optional): Distribución de la memoria, ver randomMemory. Defaults to "uniform".
+        minMemory (int, optional): Memoria mínima de un proceso. Defaults to 1.
+        maxMemory (int, optional): Memoria máxima de un proceso. Defaults to size // 4.
+        minDuration (int, optional): Duración mínima de un proceso. Defaults to 1.
+        maxDuration (int, optional): Duración máxima de un proceso. Defaults to 10.
+        size (int, optional): Tamaño de la memoria simulada. Defaults to ProcessLine.DEFAULT_SIZE.
+
+    Raises:
+        ValueError: En caso de que los límites de memoria no sean válidos
+
+    Yields:
+        Process: Procesos ordenados por llegada
+    """
+    if maxMemory is None:
+        maxMemory = max(1, size // 4)
+    if not 1 <= minMemory <= maxMemory <= size:
+        raise ValueError("La memoria de los procesos debe cumplir 1 <= minMemory <= maxMemory <= size")
+    rand = random.Random(seed)
+    times = iterArrivals(rand, arrivals, rate, burstSize)
+    for i in range(count):
+        yield gm.Process(f"P{i + 1}", next(times), randomMemory(rand, sizes, minMemory, maxMemory), rand.randint(minDuration, maxDuration))
+
+def writeWorkload(filename: str, processes):
+    """Escribe los procesos en un archivo con el formato de samples/process.txt
+
+    Args:
+        filename (str): Nombre del archivo
+        processes (iterable): Procesos a escribir
+
+    Returns:
+        int: Número de procesos escritos
+    """
+    count = 0
+    with open(filename, 'w') as f:
+        for process in processes:
+            f.write(f"{process.name} {process.arribal} {process.memory} {process.execTime}\n")
+            count += 1
+    return count
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Genera una carga de trabajo sintética con el formato de samples/process.txt")
+    parser.add_argument("count", type=int, help="Número de procesos")
+    parser.add_argument("--output", default="workload.txt", help="Archivo de salida")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla del generador aleatorio")
+    parser.add_argument("--arrivals", choices=ARRIVALS, default="poisson", help="Tipo de llegadas")
+    parser.add_argument("--rate", type=float, default=1.0, help="Media de procesos que llegan por intervalo")
+    parser.add_argument("--burst-size", type=int, default=20, help="Con --arrivals bursty, media de procesos por ráfaga")
+    parser.add_argument("--sizes", choices=SIZES, default="uniform", help="Distribución de la memoria de los procesos")
+    parser.add_argument("--min-memory", type=int, default=1, help="Memoria mínima de un proceso")
+    parser.add_argument("--max-memory", type=int, help="Memoria máxima de un proceso. Por defecto, un cuarto de la memoria")
+    parser.add_argument("--min-duration", type=int, default=1, help="Duración mínima de un proceso")
+    parser.add_argument("--max-duration", type=int, default=10, help="Duración máxima de un proceso")
+    parser.add_argument("--size", type=int, default=gm.ProcessLine.DEFAULT_SIZE, help="Tamaño de la memoria simulada")
+    args = parser.parse_args()
+    processes = generateWorkload(args.count, args.seed, args.arrivals, args.rate, args.burst_size, args.sizes, args.min_memory, args.max_memory, args.min_duration, args.max_duration, args.size)
+    print(f"Se generaron {writeWorkload(args.output, processes)} procesos en {args.output}")
@@ -2,11 +2,26 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
 import platform
+import queue
+import time
 import gestormemoria as gm #modulo gestor
+import trazas #trazas binarias
 
 class MemoryManagerGUI:
-    """Clase que gestiona la interfaz gráfica del programa gestor de memoria
+    """Clase que gestiona la interfaz gráfica del programa gestor de memoria.
+    La simulación se ejecuta en otro hilo, que envía el estado de la memoria por una cola.
+    El hilo de la interfaz vacía la cola con root.after y solo dibuja el último estado, como mucho FRAME_RATE veces por segundo.
+    La simulación guarda un AllocationHistory, con el que la barra del historial muestra la memoria de cualquier instante pasado sin volver a simular.
     """
+    FRAME_RATE = 30 #redibujados por segundo
+    SPEEDS = ["0.25", "0.5", "1", "2", "4", "10", "100"] #multiplicadores de la velocidad
+    HOLE_COLOR = "#5c5c5c"
+    METHODS = {"Mejor Hueco": gm.BestFitSorting, "Peor Hueco": gm.WorstFitSorting, "Primer Hueco": gm.FirstFitSorting, "Siguiente Hueco": gm.NextFitSorting,
+               "Buddy": gm.BuddySorting, "Listas Segregadas": gm.SegregatedFitSorting} #métodos del desplegable
+    ADMISSIONS = {"Reintento (lineal)": gm.RetryAdmission, "Más antiguo que cabe (log)": gm.FirstFitAdmission,
+                  "Más grande que cabe (log)": gm.LargestFitAdmission, "Orden de llegada (log)": gm.FifoAdmission} #políticas de admisión del desplegable, con su coste por intervalo
+    PROCESS_COLORS = ["#4e79a7", "#f28e2b", "#e15759", "#76b7b2", "#59a14f", "#edc948", "#b07aa1", "#ff9da7", "#9c755f", "#bab0ac"]
+
     def __init__(self, root):
         """Constructor de la clase, añade el widget base.
 
@@ -18,10 +33,22 @@ class MemoryManagerGUI:
         self.process_line = None
         self.process_queue = []
         self.simulation_running = False
+        self.simulation_thread = None #hilo de la simulación en curso o detenida
         self.sleep_seconds = 1  # Default sleep time
+        self.scheduler = None #ritmo de la simulación en curso
+        self.events = queue.Queue() #mensajes del hilo de simulación
+        self.rows = {} #filas de la tabla por proceso
+        self.memory_state = []
+        self.live_state = [] #último estado recibido del hilo de simulación
+        self.memory_size = gm.ProcessLine.DEFAULT_SIZE
+        self.history = None #historial de la simulación
+        self.latest_time = 0 #último instante simulado
+        self.scrub_time = None #instante del historial que se muestra, None para el estado actual
+        self.updating_scale = False
 
         # Widgets principales
         self.createWidgets()
+        self.root.after(1000 // self.FRAME_RATE, self.pollEvents)
 
     def createWidgets(self):
         """Método que crea los widgets de la interfaz y le aplica estilos.
@@ -37,9 +64,16 @@ class MemoryManagerGUI:
 
         self.method_var = tk.StringVar(value="Mejor Hueco")
         self.method_dropdown = ttk.Combobox(frame_top, textvariable=self.method_var, state="readonly")
-        self.method_dropdown["values"] = ["Mejor Hueco", "Peor Hueco"]
+        self.method_dropdown["values"] = list(self.METHODS)
         self.method_dropdown.pack(side=tk.LEFT, padx=5)
 
+        ttk.Label(frame_top, text="Admisión:").pack(side=tk.LEFT, padx=5)
+
+        self.admission_var = tk.StringVar(value="Reintento (lineal)")
+        self.admission_dropdown = ttk.Combobox(frame_top, textvariable=self.admission_var, state="readonly", width=26)
+        self.admission_dropdown["values"] = list(self.ADMISSIONS)
+        self.admission_dropdown.pack(side=tk.LEFT, padx=5)
+
         self.load_button = ttk.Button(frame_top, text="Cargar Procesos", command=self.loadProcesses)
         self.load_button.pack(side=tk.LEFT, padx=5)
 
@@ -57,6 +91,36 @@ class MemoryManagerGUI:
         self.stop_button.pack(side=tk.LEFT, padx=5)
         self.stop_button["state"] = "disabled"
 
+        # Panel de control del ritmo
+        frame_control = ttk.Frame(self.root, padding=(10, 0))
+        frame_control.pack(side=tk.TOP, fill=tk.X)
+
+        ttk.Label(frame_control, text="Velocidad:").pack(side=tk.LEFT, padx=5)
+
+        self.speed_var = tk.StringVar(value="1")
+        self.speed_dropdown = ttk.Combobox(frame_control, textvariable=self.speed_var, values=self.SPEEDS, width=5)
+        self.speed_dropdown.pack(side=tk.LEFT, padx=5)
+        self.speed_dropdown.bind("<<ComboboxSelected>>", lambda event: self.changeSpeed())
+        self.speed_dropdown.bind("<Return>", lambda event: self.changeSpeed())
+
+        self.pause_button = ttk.Button(frame_control, text="Pausar", command=self.togglePause)
+        self.pause_button.pack(side=tk.LEFT, padx=5)
+
+        self.step_button = ttk.Button(frame_control, text="Paso", command=self.stepSimulation)
+        self.step_button.pack(side=tk.LEFT, padx=5)
+
+        ttk.Label(frame_control, text="Hasta el instante:").pack(side=tk.LEFT, padx=5)
+
+        self.until_entry = ttk.Entry(frame_control, width=7)
+        self.until_entry.pack(side=tk.LEFT, padx=5)
+
+        self.until_button = ttk.Button(frame_control, text="Ejecutar", command=self.runUntil)
+        self.until_button.pack(side=tk.LEFT, padx=5)
+
+        self.time_label = ttk.Label(frame_control, text="Instante: -")
+        self.time_label.pack(side=tk.LEFT, padx=5)
+        self.setControlsState("disabled")
+
         # Tabla de procesos
         self.tree = ttk.Treeview(self.root, columns=("ID", "Memoria", "Posición", "Duración"), show="headings")
         self.tree.heading("ID", text="ID")
@@ -65,6 +129,23 @@ class MemoryManagerGUI:
         self.tree.heading("Duración", text="Duración")
         self.tree.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=10)
 
+        # Mapa de memoria
+        self.memory_canvas = tk.Canvas(self.root, height=40, bg="#464646", highlightthickness=0)
+        self.memory_canvas.pack(side=tk.TOP, fill=tk.X, padx=10)
+        self.memory_canvas.bind("<Configure>", lambda event: self.drawMemory())
+
+        # Barra del historial
+        frame_history = ttk.Frame(self.root, padding=(10, 5))
+        frame_history.pack(side=tk.TOP, fill=tk.X)
+
+        ttk.Label(frame_history, text="Historial:").pack(side=tk.LEFT, padx=5)
+
+        self.history_scale = ttk.Scale(frame_history, from_=1, to=1, orient=tk.HORIZONTAL, command=self.scrubHistory)
+        self.history_scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
+        self.live_button = ttk.Button(frame_history, text="En vivo", command=self.showLive)
+        self.live_button.pack(side=tk.LEFT, padx=5)
+
         # Botón de salida
         self.exit_button = ttk.Button(self.root, text="Salir", command=self.root.quit)
         self.exit_button.pack(side=tk.BOTTOM, pady=10)
@@ -72,13 +153,23 @@ class MemoryManagerGUI:
     def loadProcesses(self):
         """Carga los procesos que se cargan desde el sistema de archivos.
         """
-        file_path = filedialog.askopenfilename(filetypes=[("Archivos de texto", "*.txt")])
+        file_path = filedialog.askopenfilename(filetypes=[("Archivos de procesos", "*.txt *.trace"), ("Archivos de texto", "*.txt"), ("Trazas binarias", "*.trace")])
         if not file_path:
             return
         try:
             self.resetSimulation()  # Limpia cualquier dato previo
-            self.process_queue = gm.generateProcessFromFile(file_path)
-            messagebox.showinfo("Carga Exitosa", f"Se cargaron {len(self.process_queue)} procesos.")
+            self.history = None
+            self.latest_time = 0
+            self.scrub_time = None
+            self.setScale(1)
+            if trazas.isBinaryTrace(file_path):
+                self.process_queue = trazas.openProcesses(file_path)
+                count = len(self.process_queue.trace)
+            else:
+                processes = gm.generateProcessFromFile(file_path)
+                count = len(processes)
+                self.process_queue = gm.ArrivalIndex(processes)
+            messagebox.showinfo("Carga Exitosa", f"Se cargaron {count} procesos.")
             self.start_button["state"] = "normal"
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo cargar el archivo: {e}")
@@ -100,13 +191,17 @@ class MemoryManagerGUI:
         if self.process_line is None:
             # Inicializar según el método seleccionado
             method = self.method_var.get()
-            if method == "Mejor Hueco":
-                self.process_line = gm.ProcessLine(gm.BestFitSorting())
-            elif method == "Peor Hueco":
-                self.process_line = gm.ProcessLine(gm.WorstFitSorting())
-            else:
+            if method not in self.METHODS:
                 messagebox.showerror("Error", "Método de asignación no válido.")
                 return
+            admission = self.admission_var.get()
+            if admission not in self.ADMISSIONS:
+                messagebox.showerror("Error", "Política de admisión no válida.")
+                return
+            self.history = gm.AllocationHistory()
+            self.process_line = gm.ProcessLine(self.METHODS[method](), admission=self.ADMISSIONS[admission](), listeners=[self.history])
+            self.memory_size = self.process_line.size
+            self.scrub_time = None
         try:
             self.sleep_seconds = float(self.sleep_entry.get())
             if self.sleep_seconds < 0:
@@ -114,67 +209,315 @@ class MemoryManagerGUI:
         except ValueError:
             messagebox.showerror("Error", "El tiempo de sleep debe ser un número positivo.")
             return
+        speed = self.getSpeed()
+        if speed is None:
+            return
 
+        self.joinSimulation()
+        self.scheduler = gm.TickScheduler(self.sleep_seconds, speed)
+        self.scheduler.start(self.process_line.__time__)
         self.simulation_running = True
         self.start_button["state"] = "disabled"
         self.stop_button["state"] = "normal"
+        self.pause_button["text"] = "Pausar"
+        self.setControlsState("normal")
 
         self.simulation_thread = threading.Thread(target=self.runSimulation, daemon=True)
         self.simulation_thread.start()
 
+    def runSimulationStep(self):
+        """Avanza la simulación un intervalo. Se ejecuta en el hilo de simulación.
+
+        Returns:
+            bool: True si quedan procesos por simular
+        """
+        ready_processes = gm.getProcessesToAdd(self.process_queue, self.process_line.__time__)
+        self.process_line.update(processes=ready_processes)
+        return not self.process_queue.isEmpty() or len(self.process_line.__buff__) > 0 or not self.process_line.isEmpty()
+
     def stopSimulation(self):
-        """Detiene la simulación y establece los parámetros necesarios para su detención
+        """Detiene la simulación y establece los parámetros necesarios para su detención.
+        La espera del intervalo actual se interrumpe en el momento, pero el botón de iniciar no se activa
+        hasta que el hilo de simulación termina el intervalo en curso y avisa con el mensaje "stopped"
         """
         self.simulation_running = False
-        self.start_button["state"] = "normal"
+        if self.scheduler is not None:
+            self.scheduler.cancel()
+        self.start_button["state"] = "disabled"
         self.stop_button["state"] = "disabled"
+        self.setControlsState("disabled")
+
+    def joinSimulation(self):
+        """Detiene el hilo de simulación anterior y espera a que termine, para que nunca haya dos hilos actualizando la misma línea de procesos
+        """
+        if self.simulation_thread is None:
+            return
+        self.simulation_running = False
+        if self.scheduler is not None:
+            self.scheduler.cancel()
+        self.simulation_thread.join()
+        self.simulation_thread = None
+
+    def setControlsState(self, state: str):
+        """Activa o desactiva los controles del ritmo de la simulación
+
+        Args:
+            state (str): "normal" o "disabled"
+        """
+        for widget in (self.pause_button, self.step_button, self.until_button):
+            widget["state"] = state
+
+    def getSpeed(self):
+        """Lee el multiplicador de la velocidad
+
+        Returns:
+            float: Multiplicador
+            None: en caso de que no sea un número positivo, tras mostrar el error
+        """
+        try:
+            speed = float(self.speed_var.get())
+            if speed <= 0:
+                raise ValueError("La velocidad debe ser positiva.")
+        except ValueError:
+            messagebox.showerror("Error", "La velocidad debe ser un número positivo.")
+            return None
+        return speed
+
+    def changeSpeed(self):
+        """Cambia la velocidad de la simulación en curso
+        """
+        speed = self.getSpeed()
+        if speed is not None and self.scheduler is not None:
+            self.scheduler.setSpeed(speed)
+
+    def togglePause(self):
+        """Pausa o reanuda la simulación en curso
+        """
+        if self.scheduler is None:
+            return
+        if self.scheduler.isPaused():
+            self.scheduler.resume()
+            self.pause_button["text"] = "Pausar"
+        else:
+            self.scheduler.pause()
+            self.pause_button["text"] = "Reanudar"
+
+    def stepSimulation(self):
+        """Pausa la simulación en curso y avanza un intervalo
+        """
+        if self.scheduler is None:
+            return
+        self.scheduler.step()
+        self.pause_button["text"] = "Reanudar"
+
+    def runUntil(self):
+        """Continúa la simulación en curso hasta el instante indicado, incluido, y la pausa
+        """
+        if self.scheduler is None:
+            return
+        try:
+            tick = int(self.until_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "El instante debe ser un número entero.")
+            return
+        self.scheduler.runUntil(tick)
+        self.pause_button["text"] = "Reanudar" if self.scheduler.isPaused() else "Pausar"
 
     def runSimulation(self):
-        """Metodo que controla la actualización de la línea de procesos en cada intervalo de tiempo.
-        Cuando termina anuncia con un mensaje, su finalización.
-        En caso de error finaliza la simulación y anuncia el error
+        """Metodo que controla la actualización de la línea de procesos en cada intervalo de tiempo, al ritmo que marca el TickScheduler.
+        Se ejecuta en el hilo de simulación, por lo que no toca la interfaz: envía a la cola el estado de la memoria,
+        como mucho FRAME_RATE veces por segundo salvo en pausa, y el final de la simulación o el error producido.
         """
+        last_frame = 0
+        scheduler = self.scheduler
         try:
-            while (len(self.process_queue) > 0 or len(self.process_line.__buff__.processList) > 0 or not all(ps.process is None for ps in self.process_line.processList)) and self.simulation_running:
-                ready_processes = gm.getProcessesToAdd(self.process_queue, self.process_line.__time__)
-                self.process_line.update(processes=ready_processes)
-                self.updateTree()
-                if not self.simulation_running:
-                    break
-                threading.Event().wait(self.sleep_seconds)
-
-            if self.simulation_running:
-                messagebox.showinfo("Simulación Completa", "Todos los procesos se han ejecutado correctamente.")
-                self.resetSimulation()
+            running = True
+            while running and self.simulation_running and scheduler.wait():
+                running = self.runSimulationStep()
+                now = time.monotonic()
+                if now - last_frame >= 1 / self.FRAME_RATE or not running or scheduler.isPaused():
+                    self.events.put(("state", self.getMemoryState(), self.process_line.__time__ - 1))
+                    last_frame = now
+
+            if not running:
+                self.events.put(("complete",))
         except Exception as e:
-            messagebox.showerror("Error", str(e))
+            self.events.put(("error", str(e)))
         finally:
-            self.simulation_running = False
-            self.start_button["state"] = "normal"
-            self.stop_button["state"] = "disabled"
+            if self.scheduler is scheduler: # una simulación detenida no toca la que se haya iniciado después
+                self.simulation_running = False
+                self.events.put(("stopped",))
 
-    def updateTree(self):
-        """Gestiona los elementos de la tabla
+    def getMemoryState(self):
+        """Copia el estado de la memoria para enviarlo al hilo de la interfaz
+
+        Returns:
+            list: Tuplas (posición inicial, posición final, tamaño, nombre, memoria, duración restante) de cada fragmento. Nombre None en los huecos
         """
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        state = []
         for page in self.process_line.processList:
             process = page.process
-            if process:
-                self.tree.insert("", tk.END, values=(
-                    process.name,
-                    process.memory,
-                    f"{page.start_position} - {page.end_position}",
-                    process.execTime
-                ))
+            if process is None:
+                state.append((page.start_position, page.end_position, page.space, None, None, None))
+            else:
+                state.append((page.start_position, page.end_position, page.space, process.name, process.memory, self.process_line.getRemainingTime(page)))
+        return state
+
+    def pollEvents(self):
+        """Vacía la cola de mensajes del hilo de simulación y redibuja el último estado recibido.
+        Se vuelve a programar con root.after para ejecutarse FRAME_RATE veces por segundo.
+        """
+        state = None
+        try:
+            while True:
+                event = self.events.get_nowait()
+                if event[0] == "state":
+                    state = event[1]
+                    self.latest_time = event[2]
+                elif event[0] == "complete":
+                    messagebox.showinfo("Simulación Completa", "Todos los procesos se han ejecutado correctamente.")
+                    self.resetSimulation()
+                    state = None
+                elif event[0] == "error":
+                    messagebox.showerror("Error", event[1])
+                elif event[0] == "stopped" and not self.simulation_running: # el aviso de un hilo anterior no toca la simulación nueva
+                    self.start_button["state"] = "normal"
+                    self.stop_button["state"] = "disabled"
+                    self.setControlsState("disabled")
+        except queue.Empty:
+            pass
+        if state is not None:
+            self.live_state = state
+            self.history_scale.configure(to=max(1, self.latest_time))
+            if self.scrub_time is None:
+                self.showLive()
+        self.root.after(1000 // self.FRAME_RATE, self.pollEvents)
+
+    def showState(self, state: list, label: str):
+        """Muestra un estado de la memoria en la tabla y en el mapa
+
+        Args:
+            state (list): Estado de la memoria, ver getMemoryState
+            label (str): Texto del instante mostrado
+        """
+        self.memory_state = state
+        self.time_label["text"] = label
+        self.updateTree()
+        self.drawMemory()
+
+    def setScale(self, time: int):
+        """Mueve la barra del historial sin tratarlo como un movimiento del usuario
+
+        Args:
+            time (int): Instante
+        """
+        self.updating_scale = True
+        try:
+            self.history_scale.set(time)
+        finally:
+            self.updating_scale = False
+
+    def showLive(self):
+        """Vuelve a mostrar el último estado de la simulación, con la barra del historial al final
+        """
+        self.scrub_time = None
+        self.setScale(max(1, self.latest_time))
+        self.showState(self.live_state, f"Instante: {self.latest_time}" if self.latest_time else "Instante: -")
+
+    def scrubHistory(self, value):
+        """Muestra la memoria en el instante de la barra del historial. Al llegar al final, vuelve al último estado
+
+        Args:
+            value (str): Posición de la barra
+        """
+        if self.updating_scale or self.history is None:
+            return
+        time = round(float(value))
+        if time >= self.latest_time:
+            if self.scrub_time is not None:
+                self.showLive()
+            return
+        if time == self.scrub_time:
+            return
+        self.scrub_time = time
+        self.showState(self.getHistoryState(time), f"Instante: {time} (historial)")
+
+    def getHistoryState(self, time: int):
+        """Obtiene el estado de la memoria al final de un instante pasado a partir del historial,
+        como el que envía el hilo de simulación: sin los procesos que salen en ese instante
+
+        Args:
+            time (int): Instante
+
+        Returns:
+            list: Tuplas como las de getMemoryState. La duración restante es "-" para los procesos que siguen en memoria
+        """
+        state = []
+        position = 0
+        for allocation in self.history.getMemoryAt(time):
+            if allocation.end is not None and allocation.end <= time + 1:
+                continue
+            if allocation.position > position:
+                state.append((position, allocation.position - 1, allocation.position - position, None, None, None))
+            remaining = "-" if allocation.end is None else allocation.end - time - 1
+            state.append((allocation.position, allocation.position + allocation.space - 1, allocation.space, allocation.name, allocation.memory, remaining))
+            position = allocation.position + allocation.space
+        if position < self.memory_size:
+            state.append((position, self.memory_size - 1, self.memory_size - position, None, None, None))
+        return state
+
+    def updateTree(self):
+        """Gestiona los elementos de la tabla. Solo añade, quita o modifica las filas de los procesos que han cambiado
+        """
+        rows = {}
+        for start, end, space, name, memory, remaining in self.memory_state:
+            if name is not None:
+                rows[f"{name}@{start}"] = (name, memory, f"{start} - {end}", remaining)
+        for item in self.rows.keys() - rows.keys():
+            self.tree.delete(item)
+        for item, values in rows.items():
+            if item not in self.rows:
+                self.tree.insert("", tk.END, iid=item, values=values)
+            elif self.rows[item] != values:
+                self.tree.item(item, values=values)
+        self.rows = rows
+
+    def drawMemory(self):
+        """Dibuja el mapa de memoria, con un rectángulo por fragmento. Los huecos se dibujan en gris
+        """
+        self.memory_canvas.delete("all")
+        if len(self.memory_state) == 0:
+            return
+        width = self.memory_canvas.winfo_width()
+        height = self.memory_canvas.winfo_height()
+        scale = width / self.memory_size
+        for start, end, space, name, memory, remaining in self.memory_state:
+            x0 = start * scale
+            x1 = (start + space) * scale
+            if x1 - x0 < 0.5:
+                continue
+            color = self.HOLE_COLOR if name is None else self.PROCESS_COLORS[hash(name) % len(self.PROCESS_COLORS)]
+            self.memory_canvas.create_rectangle(x0, 0, x1, height, fill=color, outline="#464646")
+            if name is not None and x1 - x0 > 8 * len(name):
+                self.memory_canvas.create_text((x0 + x1) / 2, height / 2, text=name, fill="white")
 
     def resetSimulation(self):
-        """Reinicia la simulación, establece la linea de procesos y la cola de procesos a nulo y elimina todos los elementos visibles de la tabla
+        """Reinicia la simulación, establece la linea de procesos y la cola de procesos a nulo y elimina todos los elementos visibles de la tabla.
+        Antes espera a que termine el hilo de simulación, que podría estar usando la línea
         """
+        self.joinSimulation()
+        if self.process_line is not None:
+            self.process_line.close()
         self.process_line = None #elimina la cola de procesos
+        if isinstance(self.process_queue, gm.ProcessStream):
+            self.process_queue.close() #cierra la traza binaria que no se haya agotado
         self.process_queue = []
         for item in self.tree.get_children():
             self.tree.delete(item) #Elimina cualquier dato en la tabla
+        self.rows = {}
+        self.memory_state = []
+        self.live_state = []
+        self.memory_canvas.delete("all")
 
 
 if __name__ == "__main__":
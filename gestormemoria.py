@@ -1,6 +1,18 @@
 import sys
+import math
 import time
+import pickle
+import argparse
+from bisect import bisect_left, insort
+from collections import deque
+from heapq import heappush, heappop, heapify
 from abc import ABC, abstractmethod
+from destinos import ITimelineSink, TextFileSink, BufferedFileSink, MemorySink, NullSink #destinos de la línea temporal
+from metricas import TickMetrics, PlacementMetrics, IMetricsHook, CallbackMetricsHook, CsvMetricsHook, JsonMetricsHook #métricas de la simulación
+from eventos import (SimulationEvent, TickStartEvent, TickEndEvent, ArriveEvent, PlaceEvent, DeferEvent, RejectEvent, DepartEvent, CoalesceEvent, MoveEvent,
+                     IEventListener, ConsoleLogger, EventRecorder, EventSource) #eventos de la línea de procesos
+from asignaciones import Allocation, AllocationHistory #historial de la memoria
+from planificador import TickScheduler #ritmo de la simulación en tiempo real
 
 class Process: #struct
     """
@@ -12,6 +24,8 @@ class Process: #struct
         memory (int): Memoria que ocupa el proceso
         execTime (int): Duración del proceso en memoria
     """
+    __slots__ = ("name", "execTime", "memory", "arribal")
+
     def __init__(self, name: str, arribalTime: int, memory: int, execTime: int):
         """Constructor general del proceso
         
@@ -34,35 +48,288 @@ class Process: #struct
         """
         return f"ID:{self.name}, Memory:{self.memory}, Time:{self.arribal}, Duration:{self.execTime}"
 
+class IAdmission(ABC): #clase abstracta
+    """Clase abstracta que representa la política de admisión de los procesos que esperan en el buffer.
+    El coste por intervalo de cada política se indica en su clase, con B procesos en el buffer y M el tamaño del mayor de ellos:
+    RetryAdmission es lineal en B y el resto son logarítmicas, O(log M) por proceso admitido.
+    Nota: Hereda la clase ABC que indica que la clase es abstracta
+
+    Attributes:
+        ROTATES (bool): Indica si la línea reintenta cada proceso del buffer una vez por intervalo y devuelve al final los que no puede colocar,
+            en lugar de admitir procesos mientras quepan (ver ProcessLine.retryBuffered)
+    """
+    ROTATES = False #admite mientras quepan
+
+    @abstractmethod
+    def selectProcess(self, buffer: "ProcessBuffer", maxSpace, time: int):
+        """Saca del buffer el siguiente proceso que debe entrar en memoria
+
+        Args:
+            buffer (ProcessBuffer): Buffer de procesos
+            maxSpace (int): espacio máximo que se puede añadir en el proceso
+            time (int): Instante de tiempo actual
+
+        Returns:
+            Process: proceso que se puede añadir
+            None: en caso de que no se pueda añadir ninguno
+        """
+        pass #abstract
+
+    def admitsArrival(self, buffer: "ProcessBuffer", time: int):
+        """Indica si un proceso que llega puede intentar entrar en memoria antes que los que esperan en el buffer.
+        Por defecto sí puede.
+
+        Args:
+            buffer (ProcessBuffer): Buffer de procesos
+            time (int): Instante de tiempo actual
+
+        Returns:
+            bool: True si el proceso puede intentar entrar directamente
+        """
+        return True
+
+class RetryAdmission(IAdmission):
+    """Clase que representa la admisión del simulador original, la política por defecto: en cada intervalo se reintenta cada proceso del buffer una vez.
+    En cada intento entra el más antiguo que ocupa como mucho el fragmento más grande de la memoria, esté ocupado o no,
+    y si el método de búsqueda no lo puede colocar vuelve al final del buffer.
+    Coste por intervalo: O(B log M) más una búsqueda de hueco por proceso reintentado, ya que reintenta todo el buffer.
+    Con buffers grandes FirstFitAdmission es mucho más rápida, aunque el orden de entrada cambia
+    """
+    ROTATES = True #reintenta y rota
+
+    def selectProcess(self, buffer: "ProcessBuffer", maxSpace, time: int):
+        return buffer.popOldest(maxSpace)
+
+class FirstFitAdmission(IAdmission):
+    """Clase que representa la admisión del proceso más antiguo que cabe en algún hueco según el método de búsqueda.
+    A diferencia de RetryAdmission, ningún proceso vuelve al final del buffer.
+    Coste por intervalo: O(log M) por proceso admitido más una consulta que no encuentra ninguno, sin depender de B
+    """
+    def selectProcess(self, buffer: "ProcessBuffer", maxSpace, time: int):
+        return buffer.popOldest(maxSpace)
+
+class LargestFitAdmission(IAdmission):
+    """Clase que representa la admisión del proceso más grande que cabe.
+    Coste por intervalo: O(log M) por proceso admitido, descendiendo por el árbol de tamaños del buffer
+    """
+    def selectProcess(self, buffer: "ProcessBuffer", maxSpace, time: int):
+        return buffer.popLargest(maxSpace)
+
+class FifoAdmission(IAdmission):
+    """Clase que representa la admisión en orden estricto de llegada al buffer.
+    Si el proceso más antiguo no cabe, no entra ninguno, y los procesos que llegan esperan detrás de él.
+    Coste por intervalo: O(1) para ver el más antiguo y O(log M) por proceso admitido
+    """
+    def selectProcess(self, buffer: "ProcessBuffer", maxSpace, time: int):
+        oldest = buffer.peekOldest()
+        if oldest is None or oldest.memory > maxSpace:
+            return None
+        return buffer.popOldest(maxSpace)
+
+    def admitsArrival(self, buffer: "ProcessBuffer", time: int):
+        return len(buffer) == 0
+
+class AgingAdmission(IAdmission):
+    """Clase que representa la admisión del proceso más antiguo que cabe, salvo que el más antiguo del buffer
+    lleve esperando maxWait intervalos o más. En ese caso, no entra ningún otro proceso hasta que entre él.
+    Coste por intervalo: O(log M) por proceso admitido, como FirstFitAdmission y FifoAdmission
+
+    Attributes:
+        maxWait (int): Espera a partir de la cual un proceso bloquea la entrada del resto
+    """
+    def __init__(self, maxWait: int) -> None:
+        """Constructor de la clase
+
+        Args:
+            maxWait (int): Espera a partir de la cual un proceso bloquea la entrada del resto
+        """
+        self.maxWait = maxWait
+
+    def isStarving(self, buffer: "ProcessBuffer", time: int):
+        """Indica si el proceso más antiguo del buffer ha superado la espera máxima
+
+        Args:
+            buffer (ProcessBuffer): Buffer de procesos
+            time (int): Instante de tiempo actual
+
+        Returns:
+            bool: True si ha superado la espera máxima
+        """
+        return len(buffer) != 0 and time - buffer.getOldestTime() >= self.maxWait
+
+    def selectProcess(self, buffer: "ProcessBuffer", maxSpace, time: int):
+        if self.isStarving(buffer, time):
+            return FifoAdmission().selectProcess(buffer, maxSpace, time)
+        return buffer.popOldest(maxSpace)
+
+    def admitsArrival(self, buffer: "ProcessBuffer", time: int):
+        return not self.isStarving(buffer, time)
+
 class ProcessBuffer:
     """Clase que representa un buffer de procesos.
     Generalmente, esta clase se usa para procesos que no han podido entrar y se quedan en cola.
-    
+    Los procesos se guardan en una cola por cada tamaño y un árbol de segmentos disperso sobre el tamaño
+    guarda el proceso más antiguo de cada rango, por lo que las búsquedas por tamaño son logarítmicas.
+
     Attributes:
-        processList (list): Lista de procesos en el buffer
+        processList (list): Lista de procesos en el buffer, del más antiguo al más reciente
+        admission (IAdmission): Política de admisión de los procesos del buffer
+        __queues__ (dict): Cola de entradas (orden, instante, proceso) de cada tamaño de proceso
+        __tree__ (dict): Árbol de segmentos con la entrada (orden, tamaño) más antigua de cada rango de tamaños
+        __leaves__ (int): Número de hojas del árbol, potencia de 2 mayor que el tamaño máximo
+        lastTime (int): Instante de entrada en el buffer del último proceso sacado
     """
-    def __init__(self, procList: list = []) -> None:
+    def __init__(self, procList: list = [], admission: IAdmission = None) -> None:
         """Constructor general de la clase, añade procesos al buffer en caso de ser necesario
 
         Args:
             procList (list, optional): Lista de procesos a añadir a la cola. Defaults to [].
+            admission (IAdmission, optional): Política de admisión. Defaults to RetryAdmission().
         """
-        self.processList = []
+        self.admission = admission if admission is not None else RetryAdmission()
+        self.__queues__ = {}
+        self.__tree__ = {}
+        self.__leaves__ = 1
+        self.__order__ = 0
+        self.__count__ = 0
+        self.lastTime = None
         for process in procList:
             self.addToBuffer(process)
 
-    def addToBuffer(self, process: Process):
+    def __len__(self) -> int:
+        return self.__count__
+
+    @property
+    def processList(self):
+        """Lista de procesos en el buffer, del más antiguo al más reciente.
+        Se genera ordenando todas las entradas en cada llamada, por lo que solo debe usarse para mostrar el buffer, nunca en cada intervalo.
+
+        Returns:
+            list: Lista de procesos
+        """
+        return [process for _, _, process in self.getEntries()]
+
+    def getEntries(self):
+        """Obtiene las entradas del buffer, de la más antigua a la más reciente. Ordena todas las entradas, ver processList
+
+        Returns:
+            list: Tuplas (orden, instante de entrada, proceso)
+        """
+        return sorted(entry for queue in self.__queues__.values() for entry in queue)
+
+    def addToBuffer(self, process: Process, time: int = 0):
         """Método para añadir un proceso al buffer
 
         Args:
             process (Process): proceso a ser añadido
+            time (int, optional): Instante en el que entra en el buffer. Defaults to 0.
         """
-        self.processList.append(process)
+        while process.memory >= self.__leaves__:
+            self.__grow__()
+        queue = self.__queues__.setdefault(process.memory, deque())
+        queue.append((self.__order__, time, process))
+        self.__order__ += 1
+        self.__count__ += 1
+        if len(queue) == 1:
+            self.__updateLeaf__(process.memory)
 
-    def getNextProcess(self, maxSpace):
-        """Detecta el proceso que debe de ser añadido como siguiente
+    def getNextProcess(self, maxSpace, time: int = 0):
+        """Detecta el proceso que debe de ser añadido como siguiente según la política de admisión
         debido a que este puede ser que no quepa en la cola dada
 
+        Args:
+            maxSpace (int): espacio máximo que se puede añadir en el proceso
+            time (int, optional): Instante de tiempo actual. Defaults to 0.
+
+        Returns:
+            Process: proceso que se puede añadir
+            None: en caso de que no se pueda añadir ninguno
+        """
+        return self.admission.selectProcess(self, maxSpace, time)
+
+    def admitsArrival(self, time: int = 0):
+        """Indica si un proceso que llega puede intentar entrar en memoria antes que los del buffer
+
+        Args:
+            time (int, optional): Instante de tiempo actual. Defaults to 0.
+
+        Returns:
+            bool: True si el proceso puede intentar entrar directamente
+        """
+        return self.admission.admitsArrival(self, time)
+
+    def skipRetries(self, maxSpace, rounds: int):
+        """Reordena el buffer como si RetryAdmission hubiese reintentado añadir sus procesos durante varios intervalos sin éxito.
+        En cada intervalo, cada proceso que ocupa como mucho maxSpace se saca y se vuelve a añadir al final,
+        por lo que estos quedan detrás del resto y rotan entre ellos. Conservan su instante de entrada.
+
+        Args:
+            maxSpace (int): espacio máximo que se puede añadir en el proceso
+            rounds (int): número de intervalos saltados
+        """
+        fits = sorted(entry for memory, queue in self.__queues__.items() if memory <= maxSpace for entry in queue)
+        if rounds <= 0 or len(fits) == 0:
+            return
+        shift = (rounds * self.__count__) % len(fits)
+        for memory in [memory for memory in self.__queues__ if memory <= maxSpace]:
+            del self.__queues__[memory]
+            self.__updateLeaf__(memory)
+        self.__count__ -= len(fits)
+        for _, time, process in fits[shift:] + fits[:shift]:
+            self.addToBuffer(process, time)
+
+    def peekOldest(self):
+        """Obtiene el proceso más antiguo del buffer sin sacarlo
+
+        Returns:
+            Process: proceso más antiguo
+            None: en caso de que el buffer esté vacío
+        """
+        if self.__count__ == 0:
+            return None
+        return self.__queues__[self.__tree__[1][1]][0][2]
+
+    def getOldestTime(self):
+        """Obtiene el instante en el que entró en el buffer el proceso más antiguo.
+        Con RetryAdmission es el del primer proceso del buffer, que puede haber entrado después que otros que han vuelto al final
+
+        Returns:
+            int: Instante de entrada
+            None: en caso de que el buffer esté vacío
+        """
+        if self.__count__ == 0:
+            return None
+        return self.__queues__[self.__tree__[1][1]][0][1]
+
+    def popOldest(self, maxSpace):
+        """Saca el proceso más antiguo de entre los que ocupan como mucho maxSpace
+
+        Args:
+            maxSpace (int): espacio máximo que se puede añadir en el proceso
+
+        Returns:
+            Process: proceso que se puede añadir
+            None: en caso de que no se pueda añadir ninguno
+        """
+        if maxSpace < 0 or self.__count__ == 0:
+            return None
+        best = None
+        low = self.__leaves__
+        high = min(maxSpace, self.__leaves__ - 1) + self.__leaves__ + 1
+        while low < high:
+            if low & 1:
+                best = min(best, self.__tree__.get(low), key=self.__entryKey__)
+                low += 1
+            if high & 1:
+                high -= 1
+                best = min(best, self.__tree__.get(high), key=self.__entryKey__)
+            low //= 2
+            high //= 2
+        return None if best is None else self.__pop__(best[1])
+
+    def popLargest(self, maxSpace):
+        """Saca el proceso más grande de entre los que ocupan como mucho maxSpace. Si hay varios, el más antiguo
+
         Args:
             maxSpace (int): espacio máximo que se puede añadir en el proceso
 
@@ -70,9 +337,80 @@ class ProcessBuffer:
             Process: proceso que se puede añadir
             None: en caso de que no se pueda añadir ninguno
         """
-        for i, process in enumerate(self.processList):
-            if process.memory <= maxSpace:
-                return self.processList.pop(i)
+        if maxSpace < 0 or self.__count__ == 0:
+            return None
+        memory = self.__largest__(1, 0, self.__leaves__, maxSpace)
+        return None if memory is None else self.__pop__(memory)
+
+    def __largest__(self, node: int, low: int, high: int, maxSpace):
+        """Busca en el árbol el mayor tamaño con procesos que no supere maxSpace
+
+        Args:
+            node (int): Nodo del árbol
+            low (int): Primer tamaño del rango del nodo
+            high (int): Tamaño siguiente al último del rango del nodo
+            maxSpace (int): espacio máximo que se puede añadir en el proceso
+
+        Returns:
+            int: Tamaño encontrado. None si no hay ninguno
+        """
+        if low > maxSpace or node not in self.__tree__:
+            return None
+        if high - low == 1:
+            return low
+        middle = (low + high) // 2
+        memory = self.__largest__(2 * node + 1, middle, high, maxSpace)
+        return memory if memory is not None else self.__largest__(2 * node, low, middle, maxSpace)
+
+    def __pop__(self, memory: int):
+        """Saca el proceso más antiguo de un tamaño
+
+        Args:
+            memory (int): Tamaño del proceso
+
+        Returns:
+            Process: proceso sacado del buffer
+        """
+        queue = self.__queues__[memory]
+        _, self.lastTime, process = queue.popleft()
+        if len(queue) == 0:
+            del self.__queues__[memory]
+        self.__count__ -= 1
+        self.__updateLeaf__(memory)
+        return process
+
+    @staticmethod
+    def __entryKey__(entry):
+        return (float("inf"),) if entry is None else entry
+
+    def __updateLeaf__(self, memory: int):
+        """Actualiza la hoja de un tamaño y los nodos del árbol por encima de ella
+
+        Args:
+            memory (int): Tamaño de la hoja
+        """
+        node = memory + self.__leaves__
+        queue = self.__queues__.get(memory)
+        if queue:
+            self.__tree__[node] = (queue[0][0], memory)
+        else:
+            self.__tree__.pop(node, None)
+        node //= 2
+        while node >= 1:
+            best = min(self.__tree__.get(2 * node), self.__tree__.get(2 * node + 1), key=self.__entryKey__)
+            if best is None:
+                self.__tree__.pop(node, None)
+            else:
+                self.__tree__[node] = best
+            node //= 2
+
+    def __grow__(self):
+        """Duplica el número de hojas del árbol y vuelve a generarlo
+        """
+        self.__leaves__ *= 2
+        self.__tree__ = {}
+        for memory in self.__queues__:
+            self.__updateLeaf__(memory)
 
 class InsuficientFragmentSpaceError(Exception): #exception
     """Error que ocurre cuando no se ha podido añadir el proceso por falta de espacio
@@ -89,7 +427,12 @@ class PageSpace:
         process (Process): Proceso que está en este espacio de memoria. Defaults to None.
         start_position (int): Posición incial de memoria. Defaults to 0.
         end_position (int): Posición final de memoria 
+        prev (PageSpace): Fragmento anterior en memoria. Defaults to None.
+        next (PageSpace): Fragmento siguiente en memoria. Defaults to None.
+        finish_time (int): Instante en el que sale de memoria el proceso. Defaults to None.
     """
+    __slots__ = ("process", "space", "end_position", "start_position", "prev", "next", "finish_time")
+
     def __init__(self, space, process = None) -> None:
         """Constructor de la clase. Genera el espacio de memoria, en caso de que sea necesario, 
         se le puede añadir un proceso durante la construcción
@@ -102,6 +445,9 @@ class PageSpace:
         self.space = space
         self.end_position = space-1
         self.start_position = 0
+        self.prev = None
+        self.next = None
+        self.finish_time = None
     
     def __str__(self) -> str:
         """Método que devuelve una cadena de texto descriptivo del espacio de memoria
@@ -111,11 +457,13 @@ class PageSpace:
         """
         return f"Position:{self.start_position}-{self.end_position}, Process:[{self.process}]"
 
-    def insertProcess(self, process: Process):
+    def insertProcess(self, process: Process, fragment: "PageSpace" = None, space: int = None):
         """Método que inserta un proceso y genera el fragmento necesario para contenerlo a partir de este.
 
         Args:
             process (Process): Proceso a añadir
+            fragment (PageSpace, optional): Fragmento sin uso que se reutiliza para la memoria restante. Defaults to None, que crea uno nuevo.
+            space (int, optional): Memoria reservada para el proceso, al menos la del proceso. Defaults to None, la memoria del proceso.
 
         Raises:
             InsuficientFragmentSpaceError: En caso de que el proceso ocupe más memoria que este fragmento
@@ -123,14 +471,32 @@ class PageSpace:
         Returns:
             PageSpace: Un fragmento de memoria vacío con la memoria restante después de añadir el proceso
         """
-        if process.memory > self.space:
+        space = process.memory if space is None else space
+        if space > self.space:
             raise InsuficientFragmentSpaceError()
+        fragment = self.split(space, fragment)
         self.process = process
-        fragment = PageSpace(self.space - process.memory, None)
-        fragment.start_position = self.start_position + process.memory
+        return fragment
+
+    def split(self, space: int, fragment: "PageSpace" = None):
+        """Método que divide el fragmento en dos, dejando en este el espacio dado y el resto en un hueco a continuación
+
+        Args:
+            space (int): Espacio que se queda en este fragmento
+            fragment (PageSpace, optional): Fragmento sin uso que se reutiliza para la memoria restante. Defaults to None, que crea uno nuevo.
+
+        Returns:
+            PageSpace: Un fragmento de memoria vacío con la memoria restante
+        """
+        if fragment is None:
+            fragment = PageSpace(self.space - space, None)
+        else:
+            fragment.process = None
+            fragment.resize(self.space - space)
+        fragment.start_position = self.start_position + space
         fragment.end_position = self.end_position
-        self.end_position = process.memory + self.start_position -1
-        self.resize(process.memory)
+        self.end_position = space + self.start_position -1
+        self.resize(space)
         return fragment
 
     def resize(self, space):
@@ -147,212 +513,1591 @@ class NoMoreSpaceError(Exception): #excepcion
     """
     def __init__(self) -> None:
         super().__init__("No more space remaining")
-        
-class ISorting(ABC): #clase abstracta
-    """Clase abstracta que representa los métodos de uso de memoria, o Mejor Hueco o Peor Hueco.
-    Nota: Hereda la clase ABC que indica que la clase es abstracta
+
+class SegmentList:
+    """Lista doblemente enlazada de fragmentos de memoria ordenados por posición inicial.
+    Permite dividir un fragmento o quitar uno ya unido a su vecino en O(1), sin recorrer ni reordenar la lista.
+    Se puede recorrer como una lista normal; el acceso por índice recorre la lista.
+
+    Attributes:
+        head (PageSpace): Primer fragmento de la memoria
+        tail (PageSpace): Último fragmento de la memoria
+        count (int): Número de fragmentos
     """
-    @abstractmethod
-    def searchPage(self, pageList, processSize):
-        """Método de busqueda del Mejor Hueco o Peor Hueco para el proceso que viene
+    def __init__(self, pages: list = []) -> None:
+        """Constructor de la clase, enlaza los fragmentos dados en el mismo orden
 
         Args:
-            pageList (list): Lista de procesos
-            processSize (int): Tamaño del proceso
-            
+            pages (list, optional): Fragmentos ordenados por posición inicial. Defaults to [].
+        """
+        self.head = None
+        self.tail = None
+        self.count = 0
+        for page in pages:
+            self.insertAfter(self.tail, page)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        page = self.head
+        while page is not None:
+            yield page
+            page = page.next
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self.count
+        for i, page in enumerate(self):
+            if i == index:
+                return page
+        raise IndexError("SegmentList index out of range")
+
+    def index(self, page: PageSpace):
+        """Obtiene la posición de un fragmento en la lista
+
+        Args:
+            page (PageSpace): Fragmento a buscar
+
         Raises:
-            InsuficientFragmentSpaceError: En caso de que el proceso ocupe más memoria que este fragmento
-            
+            ValueError: En caso de que el fragmento no esté en la lista
+
         Returns:
-            int: Índice del fragmento que se adecue al método
+            int: Posición del fragmento
         """
-        pass #abstract
+        for i, other in enumerate(self):
+            if other is page:
+                return i
+        raise ValueError("PageSpace is not in SegmentList")
 
-class BestFitSorting(ISorting):
-    """Clase que representa el método de Mejor Hueco
-    """
-    def searchPage(self, pageList: list, processSize):
-        emptySpaces = [page for page in pageList if page.process is None]
-        if min(emptySpaces, key=lambda page: page.space).space < processSize:
-            raise InsuficientFragmentSpaceError()
-        if len(pageList) == 1:
-            return 0
-        bestSize = 0
-        copypages = pageList.copy()
-        copypages.sort(key=lambda p: p.space)
-        for i, page in enumerate(copypages):
-            if page.process is not None:
-                continue
-            if processSize <= page.space:
-                bestSize = pageList.index(copypages[i])
-        return bestSize
+    def copy(self):
+        """Copia los fragmentos en una lista normal
 
-class WorstFitSorting(ISorting):
-    """Clase que representa el método de Peor Hueco
-    """
-    def searchPage(self, pageList: list, processSize):
-        emptySpaces = [page for page in pageList if page.process is None]
-        if min(emptySpaces, key=lambda page: page.space).space < processSize:
-            raise InsuficientFragmentSpaceError()
-        if len(pageList) == 1:
-            return 0
-        bestSize = 0
-        copypages = sorted(pageList, key=lambda p: p.space, reverse=True)
-        for i, page in enumerate(copypages):
-            if page.process is not None:
-                continue
-            if processSize <= page.space:
-                bestSize = pageList.index(copypages[i])
-        return bestSize
+        Returns:
+            list: Fragmentos en orden
+        """
+        return list(self)
 
-class ProcessLine:
-    """Clase que representa la línea de procesos, esta clase contiene métodos para gestionar la memoria de manera eficiente según el método
-    que se le indique 
+    def insertAfter(self, page: PageSpace, fragment: PageSpace):
+        """Inserta un fragmento justo después de otro
 
-    Attributes:
-        DEFAULT_SIZE (int): Tamaño por defecto de la memoria
-        processList (list): Lista de procesos de la memoria
-        __time__ (int): Instante de tiempo en el que se encuentra la línea. Defaults to 1
-        __buff__ (ProcessBuffer): Buffer de procesos donde se hayan los procesos que no han podido ser añadidos por primera vez
-        sorting (ISorting): Método de busqueda del Mejor/Peor hueco
-        size (int): Tamaño de la línea de procesos
-    """
-    DEFAULT_SIZE = 2000 #memory defaultspace
+        Args:
+            page (PageSpace): Fragmento tras el que se inserta. None para insertarlo al principio
+            fragment (PageSpace): Fragmento a insertar
+        """
+        fragment.prev = page
+        fragment.next = self.head if page is None else page.next
+        if fragment.next is None:
+            self.tail = fragment
+        else:
+            fragment.next.prev = fragment
+        if page is None:
+            self.head = fragment
+        else:
+            page.next = fragment
+        self.count += 1
 
-    def __init__(self, sorting: ISorting, size = DEFAULT_SIZE):
-        """Constructor de la clase genera la lista vacía con un buffer de espera y determina el método de busqueda de huecos.
+    def remove(self, page: PageSpace):
+        """Quita un fragmento de la lista
 
         Args:
-            sorting (ISorting): Método de búsqueda de huecos a usar
-            size (int, optional): Tamaño máximo de memoria. Defaults to DEFAULT_SIZE.
+            page (PageSpace): Fragmento a quitar
         """
-        f = open("result.txt", "w").close() #limpiar archivo resultado
-        self.size = size
-        self.__buff__ = ProcessBuffer()
-        self.processList = []
-        self.processList.append(PageSpace(size))
-        self.sorting = sorting
-        self.__time__ = 1
-        
+        if page.prev is None:
+            self.head = page.next
+        else:
+            page.prev.next = page.next
+        if page.next is None:
+            self.tail = page.prev
+        else:
+            page.next.prev = page.prev
+        page.prev = None
+        page.next = None
+        self.count -= 1
 
-    def insertProcess(self, process: Process):
-        """Método para introducir procesos a la memoria. Busca entre todos los huecos el que más se adecue según el método empleado.
-        Añade el proceso a un buffer secundario en caso de que no se pueda añadir.
+class FreeHoleIndex:
+    """Índice de huecos libres ordenado por tamaño.
+    Cada hueco se guarda con la clave (tamaño, posición inicial), de forma que los empates
+    se resuelven igual que recorriendo la memoria en orden.
+    Las búsquedas son O(log n), pero add y remove insertan y borran en listas ordenadas, lo que desplaza O(n) referencias en memoria.
+    Ese desplazamiento es muy barato y no domina hasta cientos de miles de huecos, ver benchmarks/bench_huecos.py.
 
-        Args:
-            process (Process): Proceso a añadir
+    Attributes:
+        keys (list): Claves (tamaño, posición inicial) ordenadas de menor a mayor
+        pages (list): Huecos en el mismo orden que las claves
+    """
+    def __init__(self, pageList: list = []) -> None:
+        """Constructor de la clase, indexa los huecos de la lista dada
 
-        Raises:
-            err (InsuficientFragmentSpaceError): Error en caso de que no haya fragmento adecuado para introducir el proceso 
+        Args:
+            pageList (list, optional): Lista de fragmentos de memoria. Defaults to [].
         """
-        if process is None:
-            return
-        if process.memory > self.size:
-            raise NoMoreSpaceError()
-        try:
-            index = self.sorting.searchPage(self.processList, process.memory)
-            page = self.processList[index].insertProcess(process)
-            self.processList.append(page)
-            print("Joining:", process, "in space:", self.processList[index])
-        except InsuficientFragmentSpaceError as err:
-            print("Process:", process, err)
-            self.__buff__.addToBuffer(process)
-            raise err
+        self.rebuild(pageList)
 
-    def insertProcesses(self, processes: list):
-        """Método para añadir varios procesos a la linea de procesos.
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def rebuild(self, pageList: list):
+        """Vuelve a generar el índice a partir de la lista de fragmentos
 
         Args:
-            processes (list): Lista de procesos a añadir.
+            pageList (list): Lista de fragmentos de memoria
         """
-        for process in processes:
-            try:
-                self.insertProcess(process)
-            except InsuficientFragmentSpaceError as err:
-                continue
-            except NoMoreSpaceError as err:
-                print("Process:", process, err)
-                continue
+        entries = sorted((((page.space, page.start_position), page) for page in pageList if page.process is None), key=lambda entry: entry[0])
+        self.keys = [key for key, _ in entries]
+        self.pages = [page for _, page in entries]
+        self.__keyOf__ = {page: key for key, page in entries}
 
-    def update(self, processes: list = []):
-        """Método que gestiona lo que ocurre en memoria cuando se pasa al siguiente intervalo.
-        Escribe en el archivo de salida "result.txt" informando de los cambios
+    def add(self, page: PageSpace):
+        """Añade un hueco al índice. El hueco no debe cambiar de tamaño ni de posición mientras esté en el índice.
+        Busca la posición en O(log n), pero la inserción desplaza las listas en O(n)
 
         Args:
-            processes (list, optional): Lista de procesos a añadir durante la ejecución. Defaults to [].
+            page (PageSpace): Hueco a añadir
         """
-        print(f"{self.__time__} -> {self.__time__+1}")
-        f = open("result.txt", "a")
-        f.write(f"{self.__time__}")
-        if len(processes) != 0:
-            self.insertProcesses(processes)
-        if len(self.__buff__.processList) != 0:
-            for _ in range(len(self.__buff__.processList)):
-                self.insertProcesses([self.__buff__.getNextProcess(self.getMaxPageSize())])
-        for process in self.processList:
-            if process.process is None:
-                if process.start_position != self.size or process.space == self.size:
-                    f.write(f" [{process.start_position} hueco {process.space}]")
-                continue
-            f.write(f" [{process.start_position} {process.process.name} {process.space}]")
-            process.process.execTime -= 1
-            if process.process.execTime <= 0:
-                print("Leaving:", process.process)
-                process.process = None
-        self.__time__ += 1
-        self.recalculateSpace()
-        print("-------------------")
-        f.write("\n")
-        f.close()
+        key = (page.space, page.start_position)
+        i = bisect_left(self.keys, key)
+        self.keys.insert(i, key)
+        self.pages.insert(i, page)
+        self.__keyOf__[page] = key
 
-    def __str__(self) -> str:
-        retstr = "List of process:\n"
-        for process in self.processList:
-            retstr += process + '\n'
-        return retstr
+    def remove(self, page: PageSpace):
+        """Elimina un hueco del índice. Busca la posición en O(log n), pero el borrado desplaza las listas en O(n)
 
-    def recalculateSpace(self):
-        """Método para recalcular el espacio en caso de haber dos (o más) huecos vacíos consecutivos y 
-        ordenar los fragmentos dentro de la memoria por posición inicial.
-        """
-        i = 0
-        while i < len(self.processList) - 1:
-            current_page = self.processList[i]
-            next_page = self.processList[i + 1]
-            if current_page.process is None and next_page.process is None:
-                current_page.resize(current_page.space + next_page.space)
-                current_page.end_position = next_page.end_position
-                del self.processList[i + 1]
-            else:
-                i += 1  # Solo avanzamos si no se han combinado los fragmentos
-        self.processList.sort(key=lambda p: p.start_position) # Ordenar los fragmentos por posición incial
+        Args:
+            page (PageSpace): Hueco a eliminar
+        """
+        i = bisect_left(self.keys, self.__keyOf__.pop(page))
+        while self.pages[i] is not page:
+            i += 1
+        del self.keys[i]
+        del self.pages[i]
 
-    def getMaxPageSize(self):
-        """Obtiene el espacio más grande de memoria dentro de la lista
+    def smallest(self):
+        """Obtiene el hueco más pequeño. En caso de empate, el último en memoria
+
+        Raises:
+            InsuficientFragmentSpaceError: En caso de que no haya huecos
 
         Returns:
-            int: Tamaño del fragmento más grande
+            PageSpace: Hueco más pequeño
         """
-        bigger = -1
-        for page in self.processList:
-            if bigger < page.space:
-                bigger = page.space
+        if len(self.keys) == 0:
+            raise InsuficientFragmentSpaceError()
+        return self.pages[bisect_left(self.keys, (self.keys[0][0] + 1, -1)) - 1]
+
+    def largest(self):
+        """Obtiene el hueco más grande. En caso de empate, el último en memoria
+
+        Raises:
+            InsuficientFragmentSpaceError: En caso de que no haya huecos
+
+        Returns:
+            PageSpace: Hueco más grande
+        """
+        if len(self.keys) == 0:
+            raise InsuficientFragmentSpaceError()
+        return self.pages[-1]
+
+    def countFrom(self, space: int):
+        """Cuenta los huecos de al menos el tamaño dado
+
+        Args:
+            space (int): Tamaño mínimo
+
+        Returns:
+            int: Número de huecos
+        """
+        return len(self.keys) - bisect_left(self.keys, (space, -1))
+
+    def min(self):
+        """Obtiene el tamaño del hueco más pequeño
+
+        Returns:
+            int: Tamaño del hueco
+        """
+        return self.keys[0][0]
+
+    def max(self):
+        """Obtiene el tamaño del hueco más grande
+
+        Returns:
+            int: Tamaño del hueco
+        """
+        return self.keys[-1][0]
+
+class BuddyHoleIndex(FreeHoleIndex):
+    """Índice de huecos libres que además guarda las listas libres por orden de un sistema Buddy binario.
+    Cada hueco se descompone en los bloques alineados más grandes que contiene, de izquierda a derecha. Mientras los procesos
+    ocupen bloques alineados, son los mismos bloques libres que tendría un Buddy que une cada bloque con su compañero al liberarlo:
+    al unir dos huecos vecinos, solo los bloques compañeros libres forman un bloque mayor, y el resto quedan como estaban.
+    Sobre una memoria que no es potencia de 2, la memoria se reparte en los bloques alineados que caben, por lo que el bloque
+    más grande es la mayor potencia de 2 que no supera el tamaño de la memoria.
+
+    Attributes:
+        orders (list): Posiciones iniciales ordenadas de los bloques libres de cada orden. El orden k tiene bloques de 2^k
+        blocks (dict): Hueco que contiene cada bloque libre, por posición inicial
+    """
+    def rebuild(self, pageList: list):
+        super().rebuild(pageList)
+        self.orders = []
+        self.blocks = {}
+        self.__blocksOf__ = {}
+        for page in self.pages:
+            self.__addBlocks__(page)
+
+    def add(self, page: PageSpace):
+        super().add(page)
+        self.__addBlocks__(page)
+
+    def remove(self, page: PageSpace):
+        super().remove(page)
+        for start, order in self.__blocksOf__.pop(page):
+            blocks = self.orders[order]
+            del blocks[bisect_left(blocks, start)]
+            del self.blocks[start]
+
+    def __addBlocks__(self, page: PageSpace):
+        """Añade a las listas libres los bloques de un hueco
+
+        Args:
+            page (PageSpace): Hueco
+        """
+        self.__blocksOf__[page] = blocks = self.getBlocks(page.start_position, page.space)
+        for start, order in blocks:
+            while len(self.orders) <= order:
+                self.orders.append([])
+            insort(self.orders[order], start)
+            self.blocks[start] = page
+
+    @staticmethod
+    def getBlocks(start: int, space: int):
+        """Descompone un hueco en los bloques alineados más grandes que contiene, de izquierda a derecha
+
+        Args:
+            start (int): Posición inicial del hueco
+            space (int): Tamaño del hueco
+
+        Returns:
+            list: Tuplas (posición inicial, orden) de cada bloque
+        """
+        blocks = []
+        end = start + space
+        while start < end:
+            block = start & -start if start != 0 else 1 << ((end - start).bit_length() - 1)
+            while start + block > end:
+                block >>= 1
+            blocks.append((start, block.bit_length() - 1))
+            start += block
+        return blocks
+
+    def getFreeBlock(self, order: int):
+        """Obtiene el bloque libre del menor orden que sea al menos el dado. En caso de empate, el de menor posición
+
+        Args:
+            order (int): Orden mínimo
+
+        Returns:
+            tuple: Posición inicial y orden del bloque
+            None: en caso de que no haya ningún bloque suficiente
+        """
+        for k in range(order, len(self.orders)):
+            if self.orders[k]:
+                return self.orders[k][0], k
+        return None
+
+    def getMaxOrder(self):
+        """Obtiene el orden del bloque libre más grande
+
+        Returns:
+            int: Orden del bloque. -1 si no hay bloques libres
+        """
+        for k in range(len(self.orders) - 1, -1, -1):
+            if self.orders[k]:
+                return k
+        return -1
+
+class ISorting(ABC): #clase abstracta
+    """Clase abstracta que representa los métodos de uso de memoria: Mejor Hueco, Peor Hueco, Primer Hueco, Siguiente Hueco, Buddy o listas segregadas.
+    searchHole recibe la memoria reservada para el proceso (ver getAllocationSize), que puede ser mayor que el proceso.
+    Nota: Hereda la clase ABC que indica que la clase es abstracta
+
+    Attributes:
+        COMPACTABLE (bool): Indica si el método admite compactación, que mueve los procesos a cualquier posición
+    """
+    COMPACTABLE = True #admite compactación
+    @abstractmethod
+    def searchPage(self, pageList, processSize):
+        """Método de busqueda del Mejor Hueco o Peor Hueco para el proceso que viene
+
+        Args:
+            pageList (list): Lista de procesos
+            processSize (int): Tamaño del proceso
+            
+        Raises:
+            InsuficientFragmentSpaceError: En caso de que el proceso ocupe más memoria que este fragmento
+            
+        Returns:
+            int: Índice del fragmento que se adecue al método
+        """
+        pass #abstract
+
+    def searchHole(self, pageList: list, holes: FreeHoleIndex, processSize):
+        """Método de busqueda del hueco usando el índice de huecos libres.
+        Por defecto recorre la lista completa con searchPage.
+
+        Args:
+            pageList (list): Lista de procesos
+            holes (FreeHoleIndex): Índice de huecos libres de la lista
+            processSize (int): Tamaño del proceso
+
+        Raises:
+            InsuficientFragmentSpaceError: En caso de que el proceso ocupe más memoria que este fragmento
+
+        Returns:
+            PageSpace: Fragmento que se adecue al método
+        """
+        return pageList[self.searchPage(pageList, processSize)]
+
+    def createHoleIndex(self, pageList: list):
+        """Crea el índice de huecos libres que la línea de procesos mantiene y pasa a searchHole.
+        Por defecto, un FreeHoleIndex.
+
+        Args:
+            pageList (list): Lista de fragmentos de memoria
+
+        Returns:
+            FreeHoleIndex: Índice de huecos libres
+        """
+        return FreeHoleIndex(pageList)
+
+    def getFitLimit(self, holeSizes):
+        """Obtiene el tamaño del proceso más grande que el método puede colocar con los huecos dados.
+        Por defecto, el tamaño del hueco más grande.
+
+        Args:
+            holeSizes (FreeHoleIndex): Índice de huecos libres
+
+        Returns:
+            int: Tamaño máximo. -1 si no hay huecos
+        """
+        return holeSizes.max() if len(holeSizes) != 0 else -1
+
+    def getAllocationSize(self, processSize):
+        """Obtiene la memoria que el método reserva para un proceso. La diferencia con el tamaño del proceso es fragmentación interna.
+        Por defecto, el tamaño del proceso.
+
+        Args:
+            processSize (int): Tamaño del proceso
+
+        Returns:
+            int: Memoria reservada
+        """
+        return processSize
+
+    def getOffset(self, hole: PageSpace, space: int):
+        """Obtiene la distancia desde el principio del hueco a la que se coloca el bloque reservado.
+        Por defecto, el bloque se coloca al principio del hueco.
+
+        Args:
+            hole (PageSpace): Hueco elegido por searchHole
+            space (int): Memoria reservada, ver getAllocationSize
+
+        Returns:
+            int: Distancia desde el principio del hueco
+        """
+        return 0
+
+class BestFitSorting(ISorting):
+    """Clase que representa el método de Mejor Hueco
+    """
+    def searchPage(self, pageList: list, processSize):
+        emptySpaces = [page for page in pageList if page.process is None]
+        if min(emptySpaces, key=lambda page: page.space).space < processSize:
+            raise InsuficientFragmentSpaceError()
+        if len(pageList) == 1:
+            return 0
+        bestSize = 0
+        copypages = pageList.copy()
+        copypages.sort(key=lambda p: p.space)
+        for i, page in enumerate(copypages):
+            if page.process is not None:
+                continue
+            if processSize <= page.space:
+                bestSize = pageList.index(copypages[i])
+        return bestSize
+
+    def getFitLimit(self, holeSizes):
+        """Solo se coloca el proceso si cabe en todos los huecos, es decir, en el hueco más pequeño
+        """
+        return holeSizes.min() if len(holeSizes) != 0 else -1
+
+    def searchHole(self, pageList: list, holes: FreeHoleIndex, processSize):
+        if holes.smallest().space < processSize:
+            raise InsuficientFragmentSpaceError()
+        return holes.largest()
+
+class WorstFitSorting(ISorting):
+    """Clase que representa el método de Peor Hueco
+    """
+    def searchPage(self, pageList: list, processSize):
+        emptySpaces = [page for page in pageList if page.process is None]
+        if min(emptySpaces, key=lambda page: page.space).space < processSize:
+            raise InsuficientFragmentSpaceError()
+        if len(pageList) == 1:
+            return 0
+        bestSize = 0
+        copypages = sorted(pageList, key=lambda p: p.space, reverse=True)
+        for i, page in enumerate(copypages):
+            if page.process is not None:
+                continue
+            if processSize <= page.space:
+                bestSize = pageList.index(copypages[i])
+        return bestSize
+
+    def getFitLimit(self, holeSizes):
+        """Solo se coloca el proceso si cabe en todos los huecos, es decir, en el hueco más pequeño
+        """
+        return holeSizes.min() if len(holeSizes) != 0 else -1
+
+    def searchHole(self, pageList: list, holes: FreeHoleIndex, processSize):
+        page = holes.smallest()
+        if page.space < processSize:
+            raise InsuficientFragmentSpaceError()
+        return page
+
+class FirstFitSorting(ISorting):
+    """Clase que representa el método de Primer Hueco: el hueco de menor posición en el que cabe el proceso.
+    El índice de huecos está ordenado por tamaño, por lo que searchHole recorre todos los huecos suficientes para quedarse con el de menor posición:
+    es lineal en el número de huecos en el peor caso, aunque evita recorrer los procesos
+    """
+    def searchPage(self, pageList: list, processSize):
+        for i, page in enumerate(pageList):
+            if page.process is None and processSize <= page.space:
+                return i
+        raise InsuficientFragmentSpaceError()
+
+    def searchHole(self, pageList: list, holes: FreeHoleIndex, processSize):
+        i = bisect_left(holes.keys, (processSize, -1))
+        if i == len(holes.keys):
+            raise InsuficientFragmentSpaceError()
+        return min(holes.pages[i:], key=lambda page: page.start_position)
+
+class NextFitSorting(ISorting):
+    """Clase que representa el método de Siguiente Hueco: como Primer Hueco, pero empezando a buscar donde terminó la última colocación
+    y volviendo al principio de la memoria al llegar al final.
+    Como en Primer Hueco, searchHole recorre todos los huecos suficientes, por lo que es lineal en el número de huecos en el peor caso.
+
+    Attributes:
+        rover (int): Posición desde la que empieza la siguiente búsqueda
+    """
+    def __init__(self) -> None:
+        """Constructor de la clase, empieza a buscar desde el principio de la memoria
+        """
+        self.rover = 0
+
+    def searchPage(self, pageList: list, processSize):
+        first = None
+        for i, page in enumerate(pageList):
+            if page.process is None and processSize <= page.space:
+                if page.start_position >= self.rover:
+                    first = i
+                    break
+                if first is None:
+                    first = i
+        if first is None:
+            raise InsuficientFragmentSpaceError()
+        self.rover = pageList[first].start_position + processSize
+        return first
+
+    def searchHole(self, pageList: list, holes: FreeHoleIndex, processSize):
+        i = bisect_left(holes.keys, (processSize, -1))
+        if i == len(holes.keys):
+            raise InsuficientFragmentSpaceError()
+        after = [page for page in holes.pages[i:] if page.start_position >= self.rover]
+        page = min(after if after else holes.pages[i:], key=lambda page: page.start_position)
+        self.rover = page.start_position + processSize
+        return page
+
+class BuddySorting(ISorting):
+    """Clase que representa el método Buddy binario: cada proceso ocupa un bloque de tamaño potencia de 2, alineado a su tamaño.
+    Se toma el bloque libre del menor orden suficiente, el de menor posición en caso de empate, y se divide por la mitad hasta el tamaño del proceso.
+    Al salir un proceso, su bloque se une con su compañero mientras este esté libre.
+    Las listas libres por orden las mantiene el índice de huecos (ver BuddyHoleIndex), por lo que la búsqueda es logarítmica en el número de huecos.
+    La memoria del bloque que no usa el proceso es fragmentación interna.
+    No admite compactación, ya que los bloques movidos dejarían de estar alineados a su tamaño.
+    """
+    COMPACTABLE = False #la compactación desalinea los bloques
+
+    def getAllocationSize(self, processSize):
+        """El tamaño del proceso redondeado a la siguiente potencia de 2
+        """
+        return 1 << max(processSize - 1, 0).bit_length()
+
+    def createHoleIndex(self, pageList: list):
+        return BuddyHoleIndex(pageList)
+
+    @staticmethod
+    def getBestBlock(blocks: list, processSize):
+        """Obtiene el bloque del menor orden suficiente de una lista de bloques. En caso de empate, el de menor posición
+
+        Args:
+            blocks (list): Tuplas (posición inicial, orden) de los bloques, ver BuddyHoleIndex.getBlocks
+            processSize (int): Memoria reservada, potencia de 2
+
+        Returns:
+            tuple: Posición inicial y orden del bloque
+            None: en caso de que ningún bloque sea suficiente
+        """
+        order = processSize.bit_length() - 1
+        candidates = [(k, start) for start, k in blocks if k >= order]
+        if not candidates:
+            return None
+        k, start = min(candidates)
+        return start, k
+
+    def searchPage(self, pageList: list, processSize):
+        blocks = []
+        owners = {}
+        for i, page in enumerate(pageList):
+            if page.process is None:
+                for start, order in BuddyHoleIndex.getBlocks(page.start_position, page.space):
+                    blocks.append((start, order))
+                    owners[start] = i
+        block = self.getBestBlock(blocks, processSize)
+        if block is None:
+            raise InsuficientFragmentSpaceError()
+        return owners[block[0]]
+
+    def searchHole(self, pageList: list, holes: BuddyHoleIndex, processSize):
+        block = holes.getFreeBlock(processSize.bit_length() - 1)
+        if block is None:
+            raise InsuficientFragmentSpaceError()
+        return holes.blocks[block[0]]
+
+    def getOffset(self, hole: PageSpace, space: int):
+        """La distancia hasta el bloque elegido, que es el mejor bloque del hueco
+        """
+        return self.getBestBlock(BuddyHoleIndex.getBlocks(hole.start_position, hole.space), space)[0] - hole.start_position
+
+    def getFitLimit(self, holeSizes):
+        """El tamaño del bloque libre más grande
+        """
+        order = holeSizes.getMaxOrder()
+        return 1 << order if order >= 0 else -1
+
+class SegregatedFitSorting(ISorting):
+    """Clase que representa el método de listas segregadas: la memoria de cada proceso se redondea a una clase de tamaño,
+    con CLASSES clases entre cada potencia de 2, y se coloca en el hueco más pequeño de la primera clase con huecos suficientes.
+    Las listas de cada clase son tramos consecutivos del índice de huecos, por lo que la búsqueda es logarítmica.
+    La memoria redondeada que no usa el proceso es fragmentación interna, como mucho 1 / CLASSES del proceso.
+
+    Attributes:
+        classes (int): Número de clases de tamaño entre cada potencia de 2
+    """
+    CLASSES = 4 #clases por potencia de 2
+
+    def __init__(self, classes: int = CLASSES) -> None:
+        """Constructor de la clase
+
+        Args:
+            classes (int, optional): Número de clases de tamaño entre cada potencia de 2. Defaults to CLASSES.
+        """
+        self.classes = classes
+
+    def getGranularity(self, space: int):
+        """Obtiene la distancia entre las clases de tamaño de la potencia de 2 de un tamaño
+
+        Args:
+            space (int): Tamaño
+
+        Returns:
+            int: Distancia entre clases
+        """
+        return max(1, (1 << (space.bit_length() - 1)) // self.classes)
+
+    def getAllocationSize(self, processSize):
+        """El tamaño del proceso redondeado a la siguiente clase de tamaño
+        """
+        if processSize <= 0:
+            return processSize
+        step = self.getGranularity(processSize)
+        return -(-processSize // step) * step
+
+    def searchPage(self, pageList: list, processSize):
+        best = None
+        for i, page in enumerate(pageList):
+            if page.process is None and processSize <= page.space and (best is None or page.space < pageList[best].space):
+                best = i
+        if best is None:
+            raise InsuficientFragmentSpaceError()
+        return best
+
+    def searchHole(self, pageList: list, holes: FreeHoleIndex, processSize):
+        i = bisect_left(holes.keys, (processSize, -1))
+        if i == len(holes.keys):
+            raise InsuficientFragmentSpaceError()
+        return holes.pages[i]
+
+    def getFitLimit(self, holeSizes):
+        """El tamaño de proceso más grande cuya clase cabe en el hueco más grande
+        """
+        if len(holeSizes) == 0 or holeSizes.max() <= 0:
+            return -1
+        space = holeSizes.max()
+        step = self.getGranularity(space)
+        return space // step * step
+
+SORTINGS = {"worst": WorstFitSorting, "best": BestFitSorting, "first": FirstFitSorting, "next": NextFitSorting, "buddy": BuddySorting, "segregated": SegregatedFitSorting}
+
+class ICompaction(ABC): #clase abstracta
+    """Clase abstracta que representa la política de compactación de la memoria.
+    La compactación desliza los procesos hacia el principio de la memoria para juntar los huecos en uno al final.
+    Solo se considera cuando hay procesos en el buffer y la memoria libre está repartida en varios huecos.
+    Una vez empieza, continúa en los intervalos siguientes hasta que la memoria queda compactada.
+    Nota: Hereda la clase ABC que indica que la clase es abstracta
+
+    Attributes:
+        maxMove (int): Memoria máxima que se mueve en cada intervalo, aunque siempre se mueve al menos un proceso. None para compactar de una vez
+        moveCost (float): Intervalos que se retrasa la salida de un proceso por cada unidad de memoria que se le mueve, redondeando hacia arriba
+    """
+    def __init__(self, maxMove: int = None, moveCost: float = 0.0) -> None:
+        """Constructor de la clase
+
+        Args:
+            maxMove (int, optional): Memoria máxima que se mueve en cada intervalo. Defaults to None, sin límite.
+            moveCost (float, optional): Intervalos de retraso por unidad de memoria movida. Defaults to 0.0.
+        """
+        self.maxMove = maxMove
+        self.moveCost = moveCost
+
+    @abstractmethod
+    def isTriggered(self, line: "ProcessLine"):
+        """Indica si debe empezar la compactación
+
+        Args:
+            line (ProcessLine): Línea de procesos, con procesos en el buffer y la memoria libre repartida en varios huecos
+
+        Returns:
+            bool: True si debe compactarse
+        """
+        pass #abstract
+
+    def nextTriggerTime(self, line: "ProcessLine"):
+        """Obtiene el instante en el que empezará la compactación si la memoria no cambia.
+        Por defecto la condición solo cambia con la memoria, por lo que no hay ninguno
+
+        Args:
+            line (ProcessLine): Línea de procesos, con procesos en el buffer y la memoria libre repartida en varios huecos
+
+        Returns:
+            int: Instante de la compactación
+            None: en caso de que no vaya a empezar sin cambios en la memoria
+        """
+        return None
+
+    def getDelay(self, space: int):
+        """Obtiene el retraso que sufre un proceso al moverlo
+
+        Args:
+            space (int): Memoria del proceso
+
+        Returns:
+            int: Intervalos de retraso
+        """
+        return math.ceil(space * self.moveCost)
+
+class FragmentationCompaction(ICompaction):
+    """Clase que representa la compactación cuando la fragmentación externa (1 - hueco más grande / memoria libre) alcanza un umbral
+
+    Attributes:
+        threshold (float): Fragmentación a partir de la que se compacta
+    """
+    def __init__(self, threshold: float = 0.5, maxMove: int = None, moveCost: float = 0.0) -> None:
+        """Constructor de la clase
+
+        Args:
+            threshold (float, optional): Fragmentación a partir de la que se compacta. Defaults to 0.5.
+            maxMove (int, optional): Memoria máxima que se mueve en cada intervalo. Defaults to None, sin límite.
+            moveCost (float, optional): Intervalos de retraso por unidad de memoria movida. Defaults to 0.0.
+        """
+        super().__init__(maxMove, moveCost)
+        self.threshold = threshold
+
+    def isTriggered(self, line: "ProcessLine"):
+        return 1 - line.__holes__.max() / line.__free__ >= self.threshold
+
+class AgeCompaction(ICompaction):
+    """Clase que representa la compactación cuando el proceso más antiguo del buffer lleva esperando maxWait intervalos o más
+
+    Attributes:
+        maxWait (int): Espera a partir de la que se compacta
+    """
+    def __init__(self, maxWait: int = 10, maxMove: int = None, moveCost: float = 0.0) -> None:
+        """Constructor de la clase
+
+        Args:
+            maxWait (int, optional): Espera a partir de la que se compacta. Defaults to 10.
+            maxMove (int, optional): Memoria máxima que se mueve en cada intervalo. Defaults to None, sin límite.
+            moveCost (float, optional): Intervalos de retraso por unidad de memoria movida. Defaults to 0.0.
+        """
+        super().__init__(maxMove, moveCost)
+        self.maxWait = maxWait
+
+    def isTriggered(self, line: "ProcessLine"):
+        return line.__time__ - line.__buff__.getOldestTime() >= self.maxWait
+
+    def nextTriggerTime(self, line: "ProcessLine"):
+        return line.__buff__.getOldestTime() + self.maxWait
+
+class CompactionStats: #struct
+    """Clase que representa el coste acumulado de la compactación de una línea de procesos
+
+    Attributes:
+        compactions (int): Número de compactaciones empezadas
+        moves (int): Número de procesos movidos
+        movedMemory (int): Memoria total movida
+        delay (int): Intervalos de retraso total de los procesos movidos
+    """
+    __slots__ = ("compactions", "moves", "movedMemory", "delay")
+
+    def __init__(self) -> None:
+        self.compactions = 0
+        self.moves = 0
+        self.movedMemory = 0
+        self.delay = 0
+
+    def asDict(self):
+        """Convierte el coste en un diccionario
+
+        Returns:
+            dict: Coste por nombre
+        """
+        return {field: getattr(self, field) for field in self.__slots__}
+
+class SnapshotSizeError(Exception): #exception
+    """Error que ocurre cuando los procesos de una instantánea no caben en el nuevo tamaño de memoria
+    """
+    def __init__(self, *args: object) -> None:
+        super().__init__("Resident processes do not fit in the new memory size")
+
+class LineSnapshot: #struct
+    """Clase que representa el estado completo de una línea de procesos en un instante.
+    Los procesos se guardan como tuplas (nombre, llegada, memoria, duración) para que ocupe poco y se cargue rápido.
+
+    Attributes:
+        size (int): Tamaño de la memoria
+        sorting (ISorting): Método de búsqueda de huecos
+        admission (IAdmission): Política de admisión del buffer
+        time (int): Instante de la línea
+        changed (bool): Indica si la memoria cambió en el último intervalo
+        order (int): Contador de entradas de procesos en memoria, que desempata las salidas
+        segments (list): Tuplas (tamaño, proceso, instante de salida, orden) de cada fragmento en orden. Proceso None en los huecos
+        buffer (list): Tuplas (instante de entrada, proceso) del buffer, de la más antigua a la más reciente
+        cursor (int): Número de procesos leídos del flujo de llegadas. None si no se indicó el flujo
+        compacting (bool): Indica si hay una compactación a medias
+        compactionStats (tuple): Coste acumulado de la compactación, en el orden de CompactionStats.__slots__
+    """
+    __slots__ = ("size", "sorting", "admission", "time", "changed", "order", "segments", "buffer", "cursor", "compacting", "compactionStats")
+
+    def __init__(self, size: int, sorting: ISorting, admission: IAdmission, time: int, changed: bool, order: int, segments: list, buffer: list, cursor: int = None,
+                 compacting: bool = False, compactionStats: tuple = None):
+        self.size = size
+        self.sorting = sorting
+        self.admission = admission
+        self.time = time
+        self.changed = changed
+        self.order = order
+        self.segments = segments
+        self.buffer = buffer
+        self.cursor = cursor
+        self.compacting = compacting
+        self.compactionStats = compactionStats
+
+    def save(self, filename: str):
+        """Guarda la instantánea en un archivo. El método de búsqueda y la política de admisión se guardan por nombre de clase,
+        para que el archivo se pueda cargar tanto desde este módulo como desde los que lo importan
+
+        Args:
+            filename (str): Nombre del archivo
+        """
+        state = [getattr(self, field) for field in self.__slots__]
+        state[1] = (type(self.sorting).__name__, vars(self.sorting))
+        state[2] = (type(self.admission).__name__, vars(self.admission))
+        with open(filename, "wb") as f:
+            pickle.dump(tuple(state), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load(filename: str):
+        """Carga una instantánea de un archivo
+
+        Args:
+            filename (str): Nombre del archivo
+
+        Returns:
+            LineSnapshot: Instantánea guardada
+        """
+        with open(filename, "rb") as f:
+            state = list(pickle.load(f))
+        for i in (1, 2):
+            name, attributes = state[i]
+            policy = globals()[name].__new__(globals()[name])
+            policy.__dict__.update(attributes)
+            state[i] = policy
+        return LineSnapshot(*state)
+
+class ProcessLine(EventSource):
+    """Clase que representa la línea de procesos, esta clase contiene métodos para gestionar la memoria de manera eficiente según el método
+    que se le indique 
+
+    Attributes:
+        DEFAULT_SIZE (int): Tamaño por defecto de la memoria
+        processList (SegmentList): Lista de fragmentos de la memoria, ordenados por posición inicial
+        __time__ (int): Instante de tiempo en el que se encuentra la línea. Defaults to 1
+        __buff__ (ProcessBuffer): Buffer de procesos donde se hayan los procesos que no han podido ser añadidos por primera vez
+        __holes__ (FreeHoleIndex): Índice de huecos libres de la memoria ordenado por tamaño, creado por el método de búsqueda
+        __changed__ (bool): Indica si la memoria ha cambiado en el último intervalo
+        __pool__ (list): Fragmentos eliminados al unir huecos, que se reutilizan al dividir fragmentos
+        __residents__ (int): Número de procesos en memoria
+        __occupied__ (dict): Número de fragmentos ocupados de cada tamaño. Puede contener tamaños ya sin fragmentos
+        __largest__ (list): Montículo de los tamaños de __occupied__, negados para sacar el mayor
+        __departures__ (list): Montículo de salidas (instante de salida, posición inicial, orden, fragmento)
+        sorting (ISorting): Método de busqueda del Mejor/Peor hueco
+        __free__ (int): Memoria libre total
+        __wasted__ (int): Memoria reservada para los procesos en memoria que estos no usan
+        __rejected__ (int): Número de procesos rechazados por no caber en la memoria
+        __searches__ (int): Búsquedas de hueco del intervalo actual, solo si hay observadores de métricas
+        __searchTime__ (float): Tiempo de las búsquedas de hueco del intervalo actual, solo si hay observadores de métricas
+        sorting (ISorting): Método de busqueda del Mejor/Peor hueco
+        size (int): Tamaño de la línea de procesos
+        sink (ITimelineSink): Destino de la línea temporal de la memoria
+        hooks (list): Observadores de las métricas de la simulación
+        listeners (list): Consumidores de los eventos de la simulación
+        compaction (ICompaction): Política de compactación. None para no compactar
+        compactionStats (CompactionStats): Coste acumulado de la compactación
+        __compacting__ (bool): Indica si hay una compactación a medias
+    """
+    DEFAULT_SIZE = 2000 #memory defaultspace
+
+    def __init__(self, sorting: ISorting, size = DEFAULT_SIZE, sink: ITimelineSink = None, admission: IAdmission = None, hooks: list = None, listeners: list = None, compaction: ICompaction = None):
+        """Constructor de la clase genera la lista vacía con un buffer de espera y determina el método de busqueda de huecos.
+
+        Args:
+            sorting (ISorting): Método de búsqueda de huecos a usar
+            size (int, optional): Tamaño máximo de memoria. Defaults to DEFAULT_SIZE.
+            sink (ITimelineSink, optional): Destino de la línea temporal. Defaults to TextFileSink("result.txt").
+            admission (IAdmission, optional): Política de admisión del buffer. Defaults to RetryAdmission().
+            hooks (list, optional): Observadores de las métricas (IMetricsHook). Defaults to None.
+            listeners (list, optional): Consumidores de los eventos (IEventListener), por ejemplo ConsoleLogger. Defaults to None, sin mensajes.
+            compaction (ICompaction, optional): Política de compactación. Defaults to None, sin compactación.
+
+        Raises:
+            ValueError: En caso de que el método de búsqueda no admita compactación, ver ISorting.COMPACTABLE
+        """
+        if compaction is not None and not sorting.COMPACTABLE:
+            raise ValueError(f"{type(sorting).__name__} no admite compactación")
+        self.sink = sink if sink is not None else TextFileSink()
+        self.compaction = compaction
+        self.compactionStats = CompactionStats()
+        self.__compacting__ = False
+        self.hooks = list(hooks) if hooks is not None else []
+        self.listeners = list(listeners) if listeners is not None else []
+        self.size = size
+        self.__buff__ = ProcessBuffer(admission=admission)
+        self.processList = SegmentList([PageSpace(size)])
+        self.__holes__ = sorting.createHoleIndex(self.processList)
+        self.__pool__ = []
+        self.__residents__ = 0
+        self.__occupied__ = {}
+        self.__largest__ = []
+        self.__departures__ = []
+        self.__order__ = 0
+        self.__free__ = size
+        self.__wasted__ = 0
+        self.__rejected__ = 0
+        self.__searches__ = 0
+        self.__searchTime__ = 0.0
+        self.sorting = sorting
+        self.__time__ = 1
+        self.__changed__ = True
+
+    def addHook(self, hook: IMetricsHook):
+        """Añade un observador de las métricas de la simulación
+
+        Args:
+            hook (IMetricsHook): Observador a añadir
+        """
+        self.hooks.append(hook)
+
+    def getMetrics(self, ticks: int = 1):
+        """Calcula las métricas actuales de la memoria, con las búsquedas de hueco hechas desde las últimas métricas
+
+        Args:
+            ticks (int, optional): Número de instantes iguales que representan las métricas. Defaults to 1.
+
+        Returns:
+            TickMetrics: Métricas de la memoria
+        """
+        oldest = self.__buff__.getOldestTime()
+        metrics = TickMetrics(self.__time__, ticks, self.__holes__.countFrom(1), self.__free__, self.__holes__.max() if len(self.__holes__.keys) != 0 else 0,
+                              self.size, len(self.__buff__), 0 if oldest is None else self.__time__ - oldest, self.__searches__, self.__searchTime__, self.__wasted__)
+        self.__searches__ = 0
+        self.__searchTime__ = 0.0
+        return metrics
+
+    def __notifyTick__(self, ticks: int = 1):
+        """Envía las métricas actuales a los observadores
+
+        Args:
+            ticks (int, optional): Número de instantes iguales que representan las métricas. Defaults to 1.
+        """
+        metrics = self.getMetrics(ticks)
+        for hook in self.hooks:
+            hook.onTick(metrics)
+
+    def insertProcess(self, process: Process, bufferTime: int = None):
+        """Método para introducir procesos a la memoria. Busca entre todos los huecos el que más se adecue según el método empleado.
+        Añade el proceso a un buffer secundario en caso de que no se pueda añadir.
+
+        Args:
+            process (Process): Proceso a añadir
+            bufferTime (int, optional): Instante de entrada en el buffer si el proceso vuelve a él. Defaults to None, el instante actual.
+
+        Raises:
+            err (InsuficientFragmentSpaceError): Error en caso de que no haya fragmento adecuado para introducir el proceso 
+        """
+        if process is None:
+            return
+        space = self.sorting.getAllocationSize(process.memory)
+        if space > self.size:
+            raise NoMoreSpaceError()
+        try:
+            if self.hooks:
+                start = time.perf_counter()
+                try:
+                    hole = self.sorting.searchHole(self.processList, self.__holes__, space)
+                finally:
+                    searchTime = time.perf_counter() - start
+                    self.__searches__ += 1
+                    self.__searchTime__ += searchTime
+            else:
+                hole = self.sorting.searchHole(self.processList, self.__holes__, space)
+            self.__holes__.remove(hole)
+            offset = self.sorting.getOffset(hole, space)
+            if offset != 0:
+                page = hole.split(offset, self.__pool__.pop() if self.__pool__ else None)
+                self.processList.insertAfter(hole, page)
+                self.__holes__.add(hole)
+                hole = page
+            page = hole.insertProcess(process, self.__pool__.pop() if self.__pool__ else None, space)
+            self.processList.insertAfter(hole, page)
+            self.__holes__.add(page)
+            self.__residents__ += 1
+            self.__occupy__(space)
+            hole.finish_time = self.__time__ + max(process.execTime, 1) - 1
+            heappush(self.__departures__, (hole.finish_time, hole.start_position, self.__order__, hole))
+            self.__order__ += 1
+            self.__free__ -= space
+            self.__wasted__ += space - process.memory
+            self.__changed__ = True
+            if self.hooks:
+                metrics = PlacementMetrics(self.__time__, process, hole.start_position, searchTime)
+                for hook in self.hooks:
+                    hook.onPlacement(metrics)
+            if self.listeners:
+                self.__emit__(PlaceEvent(self.__time__, process, hole.start_position, space))
+        except InsuficientFragmentSpaceError as err:
+            if self.listeners:
+                self.__emit__(DeferEvent(self.__time__, process, err))
+            self.__buff__.addToBuffer(process, self.__time__ if bufferTime is None else bufferTime)
+            raise err
+
+    def insertProcesses(self, processes: list):
+        """Método para añadir varios procesos a la linea de procesos.
+        Si la política de admisión no deja pasar a un proceso por delante de los del buffer, se añade al buffer.
+
+        Args:
+            processes (list): Lista de procesos a añadir.
+        """
+        for process in processes:
+            if self.listeners:
+                self.__emit__(ArriveEvent(self.__time__, process))
+            try:
+                if self.__buff__.admitsArrival(self.__time__):
+                    self.insertProcess(process)
+                elif self.sorting.getAllocationSize(process.memory) > self.size:
+                    raise NoMoreSpaceError()
+                else:
+                    if self.listeners:
+                        self.__emit__(DeferEvent(self.__time__, process))
+                    self.__buff__.addToBuffer(process, self.__time__)
+            except InsuficientFragmentSpaceError as err:
+                continue
+            except NoMoreSpaceError as err:
+                self.__rejected__ += 1
+                if self.listeners:
+                    self.__emit__(RejectEvent(self.__time__, process, err))
+                continue
+
+    def admitBuffered(self):
+        """Método para añadir a la memoria los procesos del buffer que quepan, en el orden que indique la política de admisión.
+        Si la política reintenta y rota los procesos, ver retryBuffered.
+        """
+        if self.__buff__.admission.ROTATES:
+            self.retryBuffered()
+            return
+        while len(self.__buff__) != 0:
+            process = self.__buff__.getNextProcess(self.sorting.getFitLimit(self.__holes__), self.__time__)
+            if process is None:
+                return
+            try:
+                self.insertProcess(process)
+            except InsuficientFragmentSpaceError:
+                return
+
+    def retryBuffered(self):
+        """Método que reintenta añadir a la memoria cada proceso del buffer una vez, como el simulador original.
+        Solo se elige un proceso que ocupe como mucho el fragmento más grande de la memoria, esté ocupado o no,
+        y si el método de búsqueda no lo puede colocar vuelve al final del buffer con su instante de entrada.
+        """
+        for _ in range(len(self.__buff__)):
+            process = self.__buff__.getNextProcess(self.getMaxPageSize(), self.__time__)
+            if process is None:
+                return
+            try:
+                self.insertProcess(process, self.__buff__.lastTime)
+            except InsuficientFragmentSpaceError:
+                continue
+
+    def update(self, processes: list = []):
+        """Método que gestiona lo que ocurre en memoria cuando se pasa al siguiente intervalo.
+        Escribe en el destino de la línea temporal (por defecto "result.txt") informando de los cambios
+
+        Args:
+            processes (list, optional): Lista de procesos a añadir durante la ejecución. Defaults to [].
+        """
+        if self.listeners:
+            self.__emit__(TickStartEvent(self.__time__))
+        self.__changed__ = False
+        if len(processes) != 0:
+            self.insertProcesses(processes)
+        self.admitBuffered()
+        if self.compaction is not None and (self.__compacting__ or self.isCompactionDue()):
+            self.compact()
+            self.admitBuffered()
+        self.sink.write(self.__time__, self)
+        if self.hooks:
+            self.__notifyTick__()
+        while len(self.__departures__) != 0 and self.__departures__[0][0] <= self.__time__:
+            page = heappop(self.__departures__)[3]
+            if self.listeners:
+                self.__emit__(DepartEvent(self.__time__, page.process, page.start_position))
+            self.releasePage(page)
+        if self.listeners:
+            self.__emit__(TickEndEvent(self.__time__))
+        self.__time__ += 1
+
+    def close(self):
+        """Termina la escritura de la línea temporal y de las métricas
+        """
+        self.sink.close()
+        for hook in self.hooks:
+            hook.close()
+
+    def getTimeline(self):
+        """Genera la descripción de la memoria que se escribe en cada línea del archivo de salida
+
+        Returns:
+            str: Fragmentos de la memoria con el formato " [inicio nombre tamaño]" o " [inicio hueco tamaño]"
+        """
+        timeline = ""
+        for process in self.processList:
+            if process.process is None:
+                if process.start_position != self.size or process.space == self.size:
+                    timeline += f" [{process.start_position} hueco {process.space}]"
+                continue
+            timeline += f" [{process.start_position} {process.process.name} {process.space}]"
+        return timeline
+
+    def isEmpty(self):
+        """Indica si no queda ningún proceso en memoria
+
+        Returns:
+            bool: True si todos los fragmentos son huecos
+        """
+        return self.__residents__ == 0
+
+    def nextEventTime(self):
+        """Obtiene el siguiente instante en el que la memoria puede cambiar sin que lleguen procesos nuevos.
+        Es el instante actual si la memoria cambió en el último intervalo y hay procesos en el buffer, ya que estos pueden entrar ahora;
+        en otro caso, el instante en el que sale el siguiente proceso.
+
+        Returns:
+            int: Instante del siguiente evento
+            None: en caso de que la memoria esté vacía
+        """
+        if self.__changed__ and len(self.__buff__) != 0 or self.__compacting__:
+            return self.__time__
+        departure = self.__departures__[0][0] if len(self.__departures__) != 0 else None
+        if self.compaction is not None and self.isFragmented() and len(self.__buff__) != 0:
+            trigger = self.compaction.nextTriggerTime(self)
+            if trigger is not None:
+                trigger = max(trigger, self.__time__)
+                return trigger if departure is None else min(trigger, departure)
+        return departure
+
+    def isFragmented(self):
+        """Indica si la memoria libre está repartida en varios huecos
+
+        Returns:
+            bool: True si el hueco más grande es menor que la memoria libre
+        """
+        return len(self.__holes__.keys) != 0 and self.__holes__.max() < self.__free__
+
+    def isCompactionDue(self):
+        """Indica si debe empezar una compactación: hay procesos en el buffer, la memoria está fragmentada y se cumple la condición de la política
+
+        Returns:
+            bool: True si debe compactarse
+        """
+        return len(self.__buff__) != 0 and self.isFragmented() and self.compaction.isTriggered(self)
+
+    def compact(self):
+        """Desliza los procesos hacia el principio de la memoria, moviendo el primer hueco hacia el final y uniéndolo con los que encuentra.
+        Mueve como mucho compaction.maxMove de memoria, salvo el primer proceso, y retrasa la salida de cada proceso movido según compaction.getDelay.
+        Si no termina, continúa en el siguiente intervalo.
+
+        Returns:
+            int: Memoria movida
+        """
+        if not self.__compacting__:
+            self.__compacting__ = True
+            self.compactionStats.compactions += 1
+        maxMove = self.compaction.maxMove
+        moved = 0
+        hole = self.processList.head
+        while hole is not None and (hole.process is not None or hole.space == 0):
+            hole = hole.next
+        while hole is not None and hole.next is not None:
+            page = hole.next
+            if moved != 0 and maxMove is not None and moved + page.space > maxMove:
+                break
+            source = page.start_position
+            delay = self.compaction.getDelay(page.space)
+            self.__holes__.remove(hole)
+            self.processList.remove(hole)
+            self.processList.insertAfter(page, hole)
+            page.start_position = hole.start_position
+            page.end_position = page.start_position + page.space - 1
+            hole.start_position = page.end_position + 1
+            hole.end_position = hole.start_position + hole.space - 1
+            page.finish_time += delay
+            while hole.next is not None and hole.next.process is None:
+                self.__holes__.remove(hole.next)
+                hole = self.mergePages(hole, hole.next)
+            self.__holes__.add(hole)
+            moved += page.space
+            self.compactionStats.moves += 1
+            self.compactionStats.movedMemory += page.space
+            self.compactionStats.delay += delay
+            if self.listeners:
+                self.__emit__(MoveEvent(self.__time__, page.process, source, page.start_position, delay))
+        if hole is None or hole.next is None:
+            self.__compacting__ = False
+        if moved != 0:
+            self.__departures__ = [(page.finish_time, page.start_position, order, page) for _, _, order, page in self.__departures__]
+            heapify(self.__departures__)
+            self.__changed__ = True
+        return moved
+
+    def getRemainingTime(self, page: PageSpace):
+        """Obtiene el tiempo que le queda en memoria al proceso de un fragmento, contando el instante actual
+
+        Args:
+            page (PageSpace): Fragmento del proceso
+
+        Returns:
+            int: Tiempo restante
+            None: en caso de que el fragmento sea un hueco
+        """
+        if page.finish_time is None:
+            return None
+        return page.finish_time - self.__time__ + 1
+
+    def skipTo(self, time: int, writeIdle: bool = True):
+        """Avanza la línea hasta el instante dado sin recorrer los intervalos intermedios, en los que no ocurre nada.
+        El instante dado no debe superar nextEventTime ni la siguiente llegada de procesos.
+        Si la política de admisión reintenta y rota los procesos, el buffer queda en el orden de haberlos reintentado, pero sin generar sus eventos.
+
+        Args:
+            time (int): Instante al que avanzar
+            writeIdle (bool, optional): Escribe en el destino de la línea temporal una línea por cada intervalo saltado. Defaults to True.
+        """
+        ticks = time - self.__time__
+        if ticks <= 0:
+            return
+        if writeIdle:
+            self.sink.writeRepeated(self.__time__, time, self)
+        if self.hooks:
+            self.__notifyTick__(ticks)
+        if self.__buff__.admission.ROTATES and len(self.__buff__) != 0:
+            self.__buff__.skipRetries(self.getMaxPageSize(), ticks)
+        self.__time__ = time
+
+    def snapshot(self, processes = None):
+        """Guarda el estado completo de la línea. Los destinos de la línea temporal, las métricas y los eventos no forman parte del estado
+
+        Args:
+            processes (ProcessStream, optional): Flujo de llegadas del que se guarda el número de procesos leídos. Defaults to None.
+
+        Returns:
+            LineSnapshot: Estado de la línea
+        """
+        orders = {id(page): order for _, _, order, page in self.__departures__}
+        segments = []
+        for page in self.processList:
+            if page.process is None:
+                segments.append((page.space, None, None, None))
+            else:
+                process = page.process
+                segments.append((page.space, (process.name, process.arribal, process.memory, process.execTime), page.finish_time, orders[id(page)]))
+        buffer = [(time, (process.name, process.arribal, process.memory, process.execTime)) for _, time, process in self.__buff__.getEntries()]
+        cursor = processes.getCursor() if isinstance(processes, ProcessStream) else None
+        stats = tuple(getattr(self.compactionStats, field) for field in CompactionStats.__slots__)
+        return LineSnapshot(self.size, self.sorting, self.__buff__.admission, self.__time__, self.__changed__, self.__order__, segments, buffer, cursor,
+                            self.__compacting__, stats)
+
+    @classmethod
+    def fromSnapshot(cls, snapshot: LineSnapshot, sink: ITimelineSink = None, hooks: list = None, listeners: list = None, sorting: ISorting = None, size: int = None, admission: IAdmission = None, compaction: ICompaction = None):
+        """Crea una línea de procesos con el estado de una instantánea, que puede continuar con otro método de búsqueda,
+        otro tamaño de memoria u otra política de admisión.
+        Al cambiar el tamaño, cambia el último hueco de la memoria, y se descartan los procesos del buffer que ya no caben, que cuentan como rechazados.
+        Una compactación a medias solo continúa si se indica una política de compactación.
+
+        Args:
+            snapshot (LineSnapshot): Estado de la línea
+            sink (ITimelineSink, optional): Destino de la línea temporal. Defaults to TextFileSink("result.txt").
+            hooks (list, optional): Observadores de las métricas. Defaults to None.
+            listeners (list, optional): Consumidores de los eventos. Defaults to None.
+            sorting (ISorting, optional): Método de búsqueda de huecos. Defaults to el de la instantánea.
+            size (int, optional): Tamaño de la memoria. Defaults to el de la instantánea.
+            admission (IAdmission, optional): Política de admisión del buffer. Defaults to la de la instantánea.
+            compaction (ICompaction, optional): Política de compactación. Defaults to None, sin compactación.
+
+        Raises:
+            SnapshotSizeError: En caso de que los procesos en memoria no quepan en el nuevo tamaño
+            ValueError: En caso de que el método de búsqueda no admita compactación, ver ISorting.COMPACTABLE
+
+        Returns:
+            ProcessLine: Línea de procesos restaurada
+        """
+        size = snapshot.size if size is None else size
+        line = cls(snapshot.sorting if sorting is None else sorting, size, sink, snapshot.admission if admission is None else admission, hooks, listeners, compaction)
+        segments = list(snapshot.segments)
+        delta = size - snapshot.size
+        if delta != 0:
+            space, process, finish, order = segments[-1]
+            if process is None and space + delta >= 0:
+                segments[-1] = (space + delta, None, None, None)
+            elif process is not None and delta > 0:
+                segments.append((delta, None, None, None))
+            else:
+                raise SnapshotSizeError()
+        pages = []
+        departures = []
+        position = 0
+        for space, process, finish, order in segments:
+            page = PageSpace(space, None if process is None else Process(*process))
+            page.start_position = position
+            page.end_position = position + space - 1
+            position += space
+            if process is not None:
+                page.finish_time = finish
+                departures.append((finish, page.start_position, order, page))
+                line.__free__ -= space
+                line.__wasted__ += space - page.process.memory
+                line.__occupy__(space)
+            pages.append(page)
+        heapify(departures)
+        line.processList = SegmentList(pages)
+        line.__holes__ = line.sorting.createHoleIndex(line.processList)
+        line.__departures__ = departures
+        line.__residents__ = len(departures)
+        line.__order__ = snapshot.order
+        line.__time__ = snapshot.time
+        line.__changed__ = snapshot.changed
+        line.__compacting__ = snapshot.compacting and compaction is not None
+        if snapshot.compactionStats is not None:
+            for field, value in zip(CompactionStats.__slots__, snapshot.compactionStats):
+                setattr(line.compactionStats, field, value)
+        for time, process in snapshot.buffer:
+            if line.sorting.getAllocationSize(process[2]) <= size:
+                line.__buff__.addToBuffer(Process(*process), time)
+            else:
+                line.__rejected__ += 1
+        return line
+
+    def __str__(self) -> str:
+        retstr = "List of process:\n"
+        for process in self.processList:
+            retstr += process + '\n'
+        return retstr
+
+    def releasePage(self, page: PageSpace):
+        """Saca el proceso de un fragmento y une el hueco resultante con los huecos vecinos.
+        El hueco unido conserva la posición inicial del primero y los fragmentos sobrantes se guardan para reutilizarlos.
+
+        Args:
+            page (PageSpace): Fragmento del proceso que sale de memoria
+        """
+        self.__wasted__ -= page.space - page.process.memory
+        page.process = None
+        page.finish_time = None
+        self.__residents__ -= 1
+        self.__vacate__(page.space)
+        self.__free__ += page.space
+        self.__changed__ = True
+        merged = 0
+        if page.prev is not None and page.prev.process is None:
+            self.__holes__.remove(page.prev)
+            page = self.mergePages(page.prev, page)
+            merged += 1
+        if page.next is not None and page.next.process is None:
+            self.__holes__.remove(page.next)
+            page = self.mergePages(page, page.next)
+            merged += 1
+        self.__holes__.add(page)
+        if merged != 0 and self.listeners:
+            self.__emit__(CoalesceEvent(self.__time__, page.start_position, page.space, merged))
+
+    def mergePages(self, page: PageSpace, next_page: PageSpace):
+        """Une dos huecos consecutivos en el primero de ellos
+
+        Args:
+            page (PageSpace): Primer hueco
+            next_page (PageSpace): Hueco siguiente, que se quita de la lista
+
+        Returns:
+            PageSpace: Hueco unido
+        """
+        page.resize(page.space + next_page.space)
+        page.end_position = next_page.end_position
+        self.processList.remove(next_page)
+        self.__pool__.append(next_page)
+        return page
+
+    def __occupy__(self, space: int):
+        """Cuenta un fragmento ocupado del tamaño dado
+
+        Args:
+            space (int): Tamaño del fragmento
+        """
+        if space not in self.__occupied__:
+            heappush(self.__largest__, -space)
+            self.__occupied__[space] = 0
+        self.__occupied__[space] += 1
+
+    def __vacate__(self, space: int):
+        """Descuenta un fragmento ocupado del tamaño dado. El tamaño se saca del montículo cuando llega a la cima sin fragmentos
+
+        Args:
+            space (int): Tamaño del fragmento
+        """
+        self.__occupied__[space] -= 1
+
+    def getMaxPageSize(self):
+        """Obtiene el espacio más grande de memoria dentro de la lista, esté ocupado o no
+
+        Returns:
+            int: Tamaño del fragmento más grande
+        """
+        while self.__largest__ and self.__occupied__[-self.__largest__[0]] == 0:
+            del self.__occupied__[-heappop(self.__largest__)]
+        bigger = -self.__largest__[0] if self.__largest__ else -1
+        if len(self.__holes__) != 0:
+            bigger = max(bigger, self.__holes__.max())
         return bigger
 
 def getProcessesToAdd(processes, time):
     """Obtiene los procesos a añadir en el tiempo dado. A la vez los saca de la lista de procesos.
 
     Args:
-        processes (list): Lista de todos los procesos que van a ser añadidos
+        processes (list | ProcessStream): Lista de todos los procesos que van a ser añadidos
         time (int): Instante de tiempo actual
 
     Returns:
         list: Lista de procesos que se pueden añadir en el intervalo dado 
     """
+    if isinstance(processes, ProcessStream):
+        return processes.getArrivals(time)
     ready_processes = [process for process in processes if process.arribal == time]
     processes[:] = [process for process in processes if process.arribal != time]
     return ready_processes
 
+class UnsortedTraceError(Exception): #exception
+    """Error que ocurre cuando un flujo de procesos no está ordenado por momento de llegada
+    """
+    def __init__(self, *args: object) -> None:
+        super().__init__("Trace is not sorted by arrival time")
+
+class ProcessStream:
+    """Clase que representa un flujo de procesos ordenado por momento de llegada.
+    Los procesos se leen de la fuente según se necesitan, por lo que solo se guarda en memoria el siguiente proceso.
+
+    Attributes:
+        __source__ (iterator): Fuente de procesos ordenada por llegada
+        __head__ (Process): Siguiente proceso de la fuente. None si se ha agotado
+        __cursor__ (int): Número de procesos sacados del flujo
+    """
+    def __init__(self, processes) -> None:
+        """Constructor de la clase
+
+        Args:
+            processes (iterable): Procesos ordenados por momento de llegada
+        """
+        self.__source__ = iter(processes)
+        self.__head__ = next(self.__source__, None)
+        self.__cursor__ = 0
+
+    def __bool__(self) -> bool:
+        return not self.isEmpty()
+
+    def isEmpty(self):
+        """Indica si quedan procesos por llegar
+
+        Returns:
+            bool: True si no quedan procesos
+        """
+        return self.__head__ is None
+
+    def nextArrival(self):
+        """Obtiene el momento de llegada del siguiente proceso
+
+        Returns:
+            int: Momento de llegada
+            None: en caso de que no queden procesos
+        """
+        return None if self.__head__ is None else self.__head__.arribal
+
+    def getArrivals(self, time):
+        """Saca del flujo los procesos que llegan en el instante dado.
+        Los procesos con llegada anterior que no se hayan pedido se descartan.
+
+        Args:
+            time (int): Instante de tiempo actual
+
+        Raises:
+            UnsortedTraceError: En caso de que la fuente no esté ordenada por llegada
+
+        Returns:
+            list: Lista de procesos que llegan en el instante dado
+        """
+        ready_processes = []
+        while self.__head__ is not None and self.__head__.arribal <= time:
+            process = self.__head__
+            self.__head__ = next(self.__source__, None)
+            self.__cursor__ += 1
+            if self.__head__ is not None and self.__head__.arribal < process.arribal:
+                raise UnsortedTraceError()
+            if process.arribal == time:
+                ready_processes.append(process)
+        return ready_processes
+
+    def getCursor(self):
+        """Obtiene el número de procesos sacados del flujo, que sirve para continuar una simulación desde una instantánea
+
+        Returns:
+            int: Número de procesos sacados
+        """
+        return self.__cursor__
+
+    def advance(self, count: int):
+        """Saca del flujo los siguientes procesos sin devolverlos
+
+        Args:
+            count (int): Número de procesos a sacar
+        """
+        while count > 0 and self.__head__ is not None:
+            self.__head__ = next(self.__source__, None)
+            self.__cursor__ += 1
+            count -= 1
+
+    def close(self):
+        """Libera la fuente del flujo. Por defecto no hace nada, ver trazas.TraceStream
+        """
+        pass
+
+class ArrivalIndex(ProcessStream):
+    """Flujo de procesos construido a partir de una lista en cualquier orden.
+    Ordena los procesos por llegada una sola vez, manteniendo el orden original entre los que llegan a la vez.
+    """
+    def __init__(self, processes: list) -> None:
+        """Constructor de la clase
+
+        Args:
+            processes (list): Lista de procesos
+        """
+        super().__init__(sorted(processes, key=lambda process: process.arribal))
+
+def runHeadless(line: ProcessLine, processes, writeIdle: bool = True, until: int = None):
+    """Ejecuta la simulación sin esperas, saltando directamente al siguiente instante en el que llega o sale un proceso.
+    La línea temporal resultante es la misma que avanzando intervalo a intervalo.
+
+    Args:
+        line (ProcessLine): Línea de procesos a simular
+        processes (list | ProcessStream): Procesos que van a ser añadidos
+        writeIdle (bool, optional): Escribe también las líneas de los intervalos saltados. Defaults to True.
+        until (int, optional): Instante en el que se detiene la simulación, antes de simularlo. Defaults to None, hasta el final.
+    """
+    for _ in iterHeadless(line, processes, writeIdle, until):
+        pass
+
+def iterEvents(line: ProcessLine, processes, writeIdle: bool = True):
+    """Ejecuta la simulación sin esperas como runHeadless, devolviendo los eventos según se producen
+
+    Args:
+        line (ProcessLine): Línea de procesos a simular
+        processes (list | ProcessStream): Procesos que van a ser añadidos
+        writeIdle (bool, optional): Escribe también las líneas de los intervalos saltados. Defaults to True.
+
+    Yields:
+        SimulationEvent: Siguiente evento de la simulación
+    """
+    recorder = EventRecorder()
+    line.subscribe(recorder)
+    try:
+        for _ in iterHeadless(line, processes, writeIdle):
+            yield from recorder
+    finally:
+        line.unsubscribe(recorder)
+
+def iterHeadless(line: ProcessLine, processes, writeIdle: bool = True, until: int = None):
+    """Ejecuta la simulación sin esperas como runHeadless, deteniéndose tras cada intervalo simulado
+
+    Args:
+        line (ProcessLine): Línea de procesos a simular
+        processes (list | ProcessStream): Procesos que van a ser añadidos
+        writeIdle (bool, optional): Escribe también las líneas de los intervalos saltados. Defaults to True.
+        until (int, optional): Instante en el que se detiene la simulación, antes de simularlo. Defaults to None, hasta el final.
+
+    Yields:
+        int: Instante simulado
+    """
+    if not isinstance(processes, ProcessStream):
+        processes = ArrivalIndex(processes)
+    while not processes.isEmpty() or len(line.__buff__) != 0 or not line.isEmpty():
+        processes.getArrivals(line.__time__ - 1) # descarta los procesos que ya no pueden llegar
+        arrival = processes.nextArrival()
+        nextTime = min((t for t in (arrival, line.nextEventTime()) if t is not None), default=None)
+        if nextTime is None: # solo quedan procesos con llegada anterior al instante actual
+            break
+        if until is not None and nextTime >= until:
+            line.skipTo(until, writeIdle)
+            break
+        line.skipTo(nextTime, writeIdle)
+        line.update(processes=processes.getArrivals(line.__time__))
+        yield nextTime
+
 def generateProcessFromFile(filename = "samples/process.txt"):
     """Genera la lista de procesos según el archivo dado
 
@@ -362,28 +2107,122 @@ def generateProcessFromFile(filename = "samples/process.txt"):
     Returns:
         list: Lista de procesos del archivo
     """
-    processes = []
-    f = open(filename, 'r')
-    for line in f:
-        data = line.split(" ")
-        processes.append(Process(data[0], int(data[1]), int(data[2]), int(data[3])))
-    f.close()
-    return processes
+    return list(iterProcessesFromFile(filename))
+
+def iterProcessesFromFile(filename = "samples/process.txt"):
+    """Lee los procesos del archivo dado de uno en uno, sin cargar el archivo completo en memoria
+
+    Args:
+        filename (str, optional): Nombre del archivo para cargar los datos. Defaults to "samples/process.txt".
+
+    Yields:
+        Process: Siguiente proceso del archivo
+    """
+    with open(filename, 'r') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            data = line.split(" ")
+            yield Process(data[0], int(data[1]), int(data[2]), int(data[3]))
 
 if __name__ == '__main__':
-    print("Elige metodo:", "1) Peor hueco", "2) Mejor Hueco", "q) Salir", sep='\n')
-    answ = input()
-    if answ == '1':
-        line = ProcessLine(WorstFitSorting())
-    elif answ == '2':
-        line = ProcessLine(BestFitSorting())
+    parser = argparse.ArgumentParser(description="Simulador de gestión de memoria")
+    parser.add_argument("file", nargs="?", default="samples/process.txt", help="Archivo de procesos, de texto o traza binaria (ver trazas.py)")
+    parser.add_argument("--headless", action="store_true", help="Simula sin esperas, saltando los intervalos sin eventos")
+    parser.add_argument("--interval", type=float, default=1.0, help="Sin --headless, segundos por intervalo")
+    parser.add_argument("--speed", type=float, default=1.0, help="Sin --headless, multiplicador de la velocidad")
+    parser.add_argument("--sparse", action="store_true", help="Con --headless, no escribe las líneas de los intervalos saltados")
+    parser.add_argument("--stream", action="store_true", help="Lee el archivo según avanza la simulación. El archivo debe estar ordenado por llegada")
+    parser.add_argument("--output", default="result.txt", help="Archivo de salida de la línea temporal")
+    parser.add_argument("--sink", choices=["text", "buffered", "null"], default="text", help="Forma de escribir la línea temporal")
+    parser.add_argument("--admission", choices=["retry", "first", "largest", "fifo", "aging"], default="retry",
+                        help="Política de admisión de los procesos del buffer. retry es la del simulador original y su coste por intervalo es lineal en la longitud del buffer; "
+                             "first, largest, fifo y aging son logarítmicas. Con buffers grandes usa first")
+    parser.add_argument("--max-wait", type=int, default=10, help="Con --admission aging, espera a partir de la cual un proceso bloquea al resto")
+    parser.add_argument("--compaction", choices=["none", "frag", "age"], default="none", help="Compacta la memoria con procesos bloqueados: por fragmentación o por la espera del más antiguo")
+    parser.add_argument("--compaction-threshold", type=float, default=0.5, help="Con --compaction frag, fragmentación a partir de la que se compacta")
+    parser.add_argument("--compaction-wait", type=int, default=10, help="Con --compaction age, espera a partir de la que se compacta")
+    parser.add_argument("--max-move", type=int, help="Memoria máxima que se mueve en cada intervalo al compactar")
+    parser.add_argument("--move-cost", type=float, default=0.0, help="Intervalos de retraso por unidad de memoria movida al compactar")
+    parser.add_argument("--quiet", action="store_true", help="No muestra los eventos de la simulación por consola")
+    parser.add_argument("--metrics", help="Archivo donde escribir las métricas de cada intervalo, en CSV si termina en .csv y en JSON Lines si no")
+    parser.add_argument("--history", help="Archivo donde guardar el historial de las estancias de los procesos en memoria, ver historial.py")
+    parser.add_argument("--snapshot", help="Archivo donde guardar el estado de la simulación al llegar a --snapshot-at")
+    parser.add_argument("--snapshot-at", type=int, help="Instante en el que se guarda el estado y se detiene la simulación")
+    parser.add_argument("--restore", help="Continúa la simulación desde un estado guardado, con su método de búsqueda y su política de admisión")
+    args = parser.parse_args()
+    if args.snapshot is not None and args.snapshot_at is None:
+        parser.error("--snapshot necesita --snapshot-at")
+    if args.restore is None:
+        print("Elige metodo:", "1) Peor hueco", "2) Mejor Hueco", "3) Primer hueco", "4) Siguiente hueco", "5) Buddy", "6) Listas segregadas", "q) Salir", sep='\n')
+        answ = input()
+        if answ in ('1', '2', '3', '4', '5', '6'):
+            sorting = list(SORTINGS.values())[int(answ) - 1]()
+        else:
+            exit(0)
+        if args.compaction != "none" and not sorting.COMPACTABLE:
+            parser.error(f"--compaction no se puede usar con {type(sorting).__name__}")
+    if args.sink == "buffered":
+        sink = BufferedFileSink(args.output)
+    elif args.sink == "null":
+        sink = NullSink()
     else:
-        exit(0)
-    try:
-        processes = generateProcessFromFile(sys.argv[1])
-    except:
-        processes = generateProcessFromFile()
-    while len(processes) != 0 or len(line.__buff__.processList) != 0 or not all(ps.process is None for ps in line.processList):
-        line.update(processes=getProcessesToAdd(processes, line.__time__))
-        time.sleep(1)
+        sink = TextFileSink(args.output)
+    if args.admission == "first":
+        admission = FirstFitAdmission()
+    elif args.admission == "largest":
+        admission = LargestFitAdmission()
+    elif args.admission == "fifo":
+        admission = FifoAdmission()
+    elif args.admission == "aging":
+        admission = AgingAdmission(args.max_wait)
+    else:
+        admission = RetryAdmission()
+    hooks = []
+    if args.metrics is not None:
+        hooks.append(CsvMetricsHook(args.metrics) if args.metrics.endswith(".csv") else JsonMetricsHook(args.metrics))
+    listeners = [] if args.quiet else [ConsoleLogger()]
+    history = AllocationHistory() if args.history is not None else None
+    if history is not None:
+        listeners.append(history)
+    compaction = None
+    if args.compaction == "frag":
+        compaction = FragmentationCompaction(args.compaction_threshold, args.max_move, args.move_cost)
+    elif args.compaction == "age":
+        compaction = AgeCompaction(args.compaction_wait, args.max_move, args.move_cost)
+    import trazas #trazas binarias, importa este módulo
+    if trazas.isBinaryTrace(args.file):
+        processes = trazas.openProcesses(args.file)
+    elif args.stream:
+        processes = ProcessStream(iterProcessesFromFile(args.file))
+    else:
+        try:
+            processes = ArrivalIndex(generateProcessFromFile(args.file))
+        except:
+            processes = ArrivalIndex(generateProcessFromFile())
+    if args.restore is not None:
+        snapshot = LineSnapshot.load(args.restore)
+        if compaction is not None and not snapshot.sorting.COMPACTABLE:
+            parser.error(f"--compaction no se puede usar con {type(snapshot.sorting).__name__}")
+        line = ProcessLine.fromSnapshot(snapshot, sink=sink, hooks=hooks, listeners=listeners, compaction=compaction)
+        if history is not None:
+            history.addResidents(line)
+        processes.advance(snapshot.cursor or 0)
+    else:
+        line = ProcessLine(sorting, sink=sink, admission=admission, hooks=hooks, listeners=listeners, compaction=compaction)
+    if args.headless:
+        runHeadless(line, processes, writeIdle=not args.sparse, until=args.snapshot_at)
+    else:
+        scheduler = TickScheduler(args.interval, args.speed)
+        scheduler.start(line.__time__)
+        try:
+            while (not processes.isEmpty() or len(line.__buff__) != 0 or not line.isEmpty()) and (args.snapshot_at is None or line.__time__ < args.snapshot_at) and scheduler.wait():
+                line.update(processes=processes.getArrivals(line.__time__))
+        except KeyboardInterrupt:
+            scheduler.cancel()
+    if args.snapshot is not None:
+        line.snapshot(processes).save(args.snapshot)
+    if history is not None:
+        history.save(args.history)
+    line.close()
 
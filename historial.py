@@ -0,0 +1,49 @@
+import argparse
+import gestormemoria as gm #modulo gestor
+
+def formatMemory(history: gm.AllocationHistory, time: int, size: int = None):
+    """Genera un texto con la memoria en un instante, con el formato de la línea temporal
+
+    Args:
+        history (AllocationHistory): Historial de la simulación
+        time (int): Instante
+        size (int, optional): Tamaño de la memoria, para mostrar el último hueco. Defaults to None, que no lo muestra.
+
+    Returns:
+        str: Línea con un fragmento [posición nombre tamaño] por proceso o hueco
+    """
+    parts = [str(time)]
+    position = 0
+    for allocation in history.getMemoryAt(time):
+        if allocation.position > position:
+            parts.append(f"[{position} hueco {allocation.position - position}]")
+        parts.append(f"[{allocation.position} {allocation.name} {allocation.space}]")
+        position = allocation.position + allocation.space
+    if size is not None and position < size:
+        parts.append(f"[{position} hueco {size - position}]")
+    return " ".join(parts)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Consulta el historial guardado con gestormemoria.py --history sin volver a simular")
+    parser.add_argument("file", help="Archivo del historial")
+    commands = parser.add_subparsers(dest="command", required=True)
+    at = commands.add_parser("at", help="Muestra la memoria en uno o varios instantes")
+    at.add_argument("times", type=int, nargs="+", help="Instantes")
+    at.add_argument("--size", type=int, help="Tamaño de la memoria, para mostrar el último hueco")
+    process = commands.add_parser("process", help="Muestra dónde y cuándo estuvo cada proceso en memoria")
+    process.add_argument("names", nargs="+", help="Nombres de los procesos")
+    between = commands.add_parser("range", help="Muestra las estancias que coinciden con un rango de instantes")
+    between.add_argument("start", type=int, help="Primer instante")
+    between.add_argument("end", type=int, help="Último instante, incluido")
+    args = parser.parse_args()
+    history = gm.AllocationHistory.load(args.file)
+    if args.command == "at":
+        for time in args.times:
+            print(formatMemory(history, time, args.size))
+    elif args.command == "process":
+        for name in args.names:
+            allocations = history.getProcess(name)
+            print(f"{name}: " + (", ".join(str(allocation) for allocation in allocations) if allocations else "no ha estado en memoria"))
+    else:
+        for allocation in history.query(args.start, args.end + 1):
+            print(allocation)
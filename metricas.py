@@ -0,0 +1,192 @@
+import csv
+import json
+from abc import ABC, abstractmethod
+
+class TickMetrics: #struct
+    """Clase que representa las métricas de la memoria en uno o varios intervalos iguales.
+    Se toman tras añadir los procesos del intervalo y antes de sacar los que terminan, igual que la línea temporal.
+
+    Attributes:
+        time (int): Primer instante
+        ticks (int): Número de instantes iguales, más de uno cuando se saltan intervalos sin eventos
+        holes (int): Número de huecos libres, sin contar los de tamaño 0
+        freeSpace (int): Memoria libre total
+        largestHole (int): Tamaño del hueco libre más grande
+        fragmentation (float): Fragmentación externa, 1 - largestHole / freeSpace. 0 si no hay memoria libre
+        utilization (float): Proporción de la memoria reservada para procesos
+        internalFragmentation (int): Memoria reservada para procesos que estos no usan, ver ISorting.getAllocationSize
+        bufferLength (int): Número de procesos esperando en el buffer
+        oldestWait (int): Tiempo que lleva en el buffer el proceso más antiguo. 0 si está vacío
+        searches (int): Búsquedas de hueco hechas en el intervalo, incluidas las que fallan
+        searchTime (float): Tiempo total en segundos de las búsquedas de hueco del intervalo
+    """
+    __slots__ = ("time", "ticks", "holes", "freeSpace", "largestHole", "fragmentation", "utilization", "internalFragmentation", "bufferLength", "oldestWait", "searches", "searchTime")
+    FIELDS = __slots__
+
+    def __init__(self, time: int, ticks: int, holes: int, freeSpace: int, largestHole: int, size: int, bufferLength: int, oldestWait: int, searches: int, searchTime: float, internalFragmentation: int = 0):
+        self.time = time
+        self.ticks = ticks
+        self.holes = holes
+        self.freeSpace = freeSpace
+        self.largestHole = largestHole
+        self.fragmentation = 1 - largestHole / freeSpace if freeSpace > 0 else 0.0
+        self.utilization = (size - freeSpace) / size
+        self.internalFragmentation = internalFragmentation
+        self.bufferLength = bufferLength
+        self.oldestWait = oldestWait
+        self.searches = searches
+        self.searchTime = searchTime
+
+    def asDict(self):
+        """Convierte las métricas en un diccionario
+
+        Returns:
+            dict: Métricas por nombre
+        """
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+class PlacementMetrics: #struct
+    """Clase que representa las métricas de la colocación de un proceso en memoria
+
+    Attributes:
+        time (int): Instante de la colocación
+        name (str): Nombre del proceso
+        memory (int): Memoria del proceso
+        position (int): Posición inicial del proceso en memoria
+        wait (int): Tiempo desde la llegada del proceso hasta su colocación
+        searchTime (float): Tiempo en segundos de la búsqueda del hueco
+    """
+    __slots__ = ("time", "name", "memory", "position", "wait", "searchTime")
+    FIELDS = __slots__
+
+    def __init__(self, time: int, process: "Process", position: int, searchTime: float):
+        self.time = time
+        self.name = process.name
+        self.memory = process.memory
+        self.position = position
+        self.wait = time - process.arribal
+        self.searchTime = searchTime
+
+    def asDict(self):
+        """Convierte las métricas en un diccionario
+
+        Returns:
+            dict: Métricas por nombre
+        """
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+class IMetricsHook(ABC): #clase abstracta
+    """Clase abstracta que representa un observador de las métricas de la simulación.
+    Si una línea de procesos no tiene observadores, no mide ni calcula ninguna métrica.
+    Nota: Hereda la clase ABC que indica que la clase es abstracta
+    """
+    @abstractmethod
+    def onTick(self, metrics: TickMetrics):
+        """Recibe las métricas de uno o varios intervalos iguales
+
+        Args:
+            metrics (TickMetrics): Métricas de la memoria
+        """
+        pass #abstract
+
+    def onPlacement(self, metrics: PlacementMetrics):
+        """Recibe las métricas de la colocación de un proceso. Por defecto no hace nada
+
+        Args:
+            metrics (PlacementMetrics): Métricas de la colocación
+        """
+        pass
+
+    def close(self):
+        """Termina la exportación de las métricas. Por defecto no hace nada
+        """
+        pass
+
+class CallbackMetricsHook(IMetricsHook):
+    """Clase que envía las métricas a funciones, por ejemplo para mostrarlas en vivo
+
+    Attributes:
+        tickCallback (function): Función que recibe cada TickMetrics
+        placementCallback (function): Función que recibe cada PlacementMetrics. None para ignorarlas
+    """
+    def __init__(self, tickCallback, placementCallback = None) -> None:
+        """Constructor de la clase
+
+        Args:
+            tickCallback (function): Función que recibe cada TickMetrics
+            placementCallback (function, optional): Función que recibe cada PlacementMetrics. Defaults to None.
+        """
+        self.tickCallback = tickCallback
+        self.placementCallback = placementCallback
+
+    def onTick(self, metrics: TickMetrics):
+        self.tickCallback(metrics)
+
+    def onPlacement(self, metrics: PlacementMetrics):
+        if self.placementCallback is not None:
+            self.placementCallback(metrics)
+
+class CsvMetricsHook(IMetricsHook):
+    """Clase que escribe las métricas en archivos CSV, uno para los intervalos y otro opcional para las colocaciones
+
+    Attributes:
+        filename (str): Archivo de las métricas de los intervalos
+        placementsFilename (str): Archivo de las métricas de las colocaciones. None si no se escriben
+    """
+    def __init__(self, filename: str = "metrics.csv", placementsFilename: str = None) -> None:
+        """Constructor de la clase, abre los archivos y escribe las cabeceras
+
+        Args:
+            filename (str, optional): Archivo de las métricas de los intervalos. Defaults to "metrics.csv".
+            placementsFilename (str, optional): Archivo de las métricas de las colocaciones. Defaults to None.
+        """
+        self.filename = filename
+        self.placementsFilename = placementsFilename
+        self.__file__ = open(filename, "w", newline="")
+        self.__writer__ = csv.writer(self.__file__)
+        self.__writer__.writerow(TickMetrics.FIELDS)
+        self.__placementsFile__ = None
+        if placementsFilename is not None:
+            self.__placementsFile__ = open(placementsFilename, "w", newline="")
+            self.__placementsWriter__ = csv.writer(self.__placementsFile__)
+            self.__placementsWriter__.writerow(PlacementMetrics.FIELDS)
+
+    def onTick(self, metrics: TickMetrics):
+        self.__writer__.writerow([getattr(metrics, field) for field in TickMetrics.FIELDS])
+
+    def onPlacement(self, metrics: PlacementMetrics):
+        if self.__placementsFile__ is not None:
+            self.__placementsWriter__.writerow([getattr(metrics, field) for field in PlacementMetrics.FIELDS])
+
+    def close(self):
+        self.__file__.close()
+        if self.__placementsFile__ is not None:
+            self.__placementsFile__.close()
+
+class JsonMetricsHook(IMetricsHook):
+    """Clase que escribe las métricas en un archivo JSON Lines, un objeto por línea con el campo "type" a "tick" o "placement"
+
+    Attributes:
+        filename (str): Archivo de salida
+        placements (bool): Indica si se escriben las colocaciones
+    """
+    def __init__(self, filename: str = "metrics.jsonl", placements: bool = True) -> None:
+        """Constructor de la clase, abre el archivo de salida
+
+        Args:
+            filename (str, optional): Archivo de salida. Defaults to "metrics.jsonl".
+            placements (bool, optional): Escribe también las colocaciones. Defaults to True.
+        """
+        self.filename = filename
+        self.placements = placements
+        self.__file__ = open(filename, "w")
+
+    def onTick(self, metrics: TickMetrics):
+        self.__file__.write(json.dumps({"type": "tick", **metrics.asDict()}) + "\n")
+
+    def onPlacement(self, metrics: PlacementMetrics):
+        if self.placements:
+            self.__file__.write(json.dumps({"type": "placement", **metrics.asDict()}) + "\n")
+
+    def close(self):
+        self.__file__.close()
@@ -0,0 +1,172 @@
+import time
+import threading
+
+class TickScheduler:
+    """Clase que marca el ritmo de la simulación en tiempo real. Cada intervalo tiene un instante límite absoluto,
+    el anterior más el periodo, medido con time.monotonic, por lo que el tiempo de cada intervalo no se acumula en los siguientes.
+    Si un intervalo se retrasa más de un periodo, el siguiente se cuenta desde ahora en lugar de ejecutar los atrasados seguidos.
+    Las órdenes (pausa, paso, velocidad, cancelar) se pueden dar desde otro hilo y despiertan la espera en el momento.
+
+    Attributes:
+        interval (float): Segundos por intervalo a velocidad 1
+        speed (float): Multiplicador de la velocidad
+        tick (int): Siguiente intervalo a ejecutar
+        until (int): Intervalo tras el que se pausa. None para no pausar
+        overruns (int): Número de veces que un intervalo se ha retrasado más de un periodo
+    """
+    def __init__(self, interval: float = 1.0, speed: float = 1.0) -> None:
+        """Constructor de la clase
+
+        Args:
+            interval (float, optional): Segundos por intervalo a velocidad 1. Defaults to 1.0.
+            speed (float, optional): Multiplicador de la velocidad. Defaults to 1.0.
+
+        Raises:
+            ValueError: En caso de que el intervalo sea negativo o la velocidad no sea positiva
+        """
+        if interval < 0 or speed <= 0:
+            raise ValueError("El intervalo no puede ser negativo y la velocidad debe ser positiva")
+        self.interval = interval
+        self.speed = speed
+        self.tick = 1
+        self.until = None
+        self.overruns = 0
+        self.__condition__ = threading.Condition()
+        self.__deadline__ = None
+        self.__paused__ = False
+        self.__steps__ = 0
+        self.__cancelled__ = False
+
+    def getPeriod(self):
+        """Obtiene los segundos reales entre dos intervalos
+
+        Returns:
+            float: Intervalo entre la velocidad
+        """
+        return self.interval / self.speed
+
+    def start(self, tick: int = 1):
+        """Empieza a contar desde el intervalo dado, que se ejecuta sin esperar
+
+        Args:
+            tick (int, optional): Siguiente intervalo a ejecutar, normalmente el instante de la línea de procesos. Defaults to 1.
+        """
+        with self.__condition__:
+            self.tick = tick
+            self.__deadline__ = None
+            self.__condition__.notify_all()
+
+    def wait(self):
+        """Espera hasta que toque ejecutar el siguiente intervalo. Mientras está en pausa solo deja pasar los pasos pedidos
+
+        Returns:
+            bool: True si hay que ejecutar el intervalo, False si se ha cancelado
+        """
+        with self.__condition__:
+            while True:
+                if self.__cancelled__:
+                    return False
+                if self.__paused__:
+                    if self.__steps__ > 0:
+                        self.__steps__ -= 1
+                        break
+                    self.__condition__.wait()
+                    continue
+                now = time.monotonic()
+                if self.__deadline__ is None:
+                    self.__deadline__ = now
+                remaining = self.__deadline__ - now
+                if remaining > 0:
+                    self.__condition__.wait(remaining)
+                    continue
+                period = self.getPeriod()
+                if period > 0 and -remaining > period:
+                    self.overruns += 1
+                    self.__deadline__ = now
+                self.__deadline__ += period
+                break
+            tick = self.tick
+            self.tick += 1
+            if self.until is not None and tick >= self.until:
+                self.until = None
+                self.__paused__ = True
+            return True
+
+    def pause(self):
+        """Pausa la simulación al terminar el intervalo actual
+        """
+        with self.__condition__:
+            self.__paused__ = True
+            self.__steps__ = 0
+            self.__condition__.notify_all()
+
+    def resume(self):
+        """Continúa la simulación, empezando por un intervalo sin esperar
+        """
+        with self.__condition__:
+            self.__paused__ = False
+            self.__deadline__ = None
+            self.__condition__.notify_all()
+
+    def step(self, count: int = 1):
+        """Pausa la simulación y deja pasar los intervalos dados sin esperar
+
+        Args:
+            count (int, optional): Número de intervalos. Defaults to 1.
+        """
+        with self.__condition__:
+            self.__paused__ = True
+            self.__steps__ += count
+            self.__condition__.notify_all()
+
+    def runUntil(self, tick: int):
+        """Continúa la simulación y la pausa después de ejecutar el intervalo dado
+
+        Args:
+            tick (int): Último intervalo a ejecutar
+        """
+        with self.__condition__:
+            self.until = tick
+            self.__paused__ = tick < self.tick
+            self.__deadline__ = None
+            self.__condition__.notify_all()
+
+    def setSpeed(self, speed: float):
+        """Cambia la velocidad. El siguiente intervalo se cuenta desde el anterior con el nuevo periodo
+
+        Args:
+            speed (float): Multiplicador de la velocidad
+
+        Raises:
+            ValueError: En caso de que la velocidad no sea positiva
+        """
+        if speed <= 0:
+            raise ValueError("La velocidad debe ser positiva")
+        with self.__condition__:
+            if self.__deadline__ is not None:
+                self.__deadline__ += self.interval / speed - self.getPeriod()
+            self.speed = speed
+            self.__condition__.notify_all()
+
+    def cancel(self):
+        """Cancela la simulación. La espera actual y las siguientes devuelven False en el momento
+        """
+        with self.__condition__:
+            self.__cancelled__ = True
+            self.__condition__.notify_all()
+
+    def isPaused(self):
+        """Indica si la simulación está en pausa
+
+        Returns:
+            bool: True si está en pausa
+        """
+        return self.__paused__
+
+    def isCancelled(self):
+        """Indica si la simulación se ha cancelado
+
+        Returns:
+            bool: True si se ha cancelado
+        """
+        return self.__cancelled__
@@ -0,0 +1,38 @@
+import os
+import sys
+import random
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import gestormemoria as gm #modulo gestor
+import generador as gen #generador de cargas
+
+def runTicks(line: gm.ProcessLine, processes: gm.ProcessStream, until: int = None):
+    """Simula intervalo a intervalo, como la interfaz gráfica, hasta que no queden procesos o hasta un instante
+
+    Args:
+        line (ProcessLine): Línea de procesos
+        processes (ProcessStream): Flujo de procesos
+        until (int, optional): Instante en el que se para. Defaults to None, hasta el final.
+    """
+    while (not processes.isEmpty() or len(line.__buff__) != 0 or not line.isEmpty()) and (until is None or line.__time__ < until):
+        line.update(processes=gm.getProcessesToAdd(processes, line.__time__))
+
+@pytest.fixture(params=range(8))
+def trace(request):
+    """Carga aleatoria, distinta para cada semilla, como tuplas (nombre, llegada, memoria, duración) para poder repetirla
+    """
+    rand = random.Random(request.param)
+    processes = gen.generateWorkload(rand.randint(20, 120), request.param, rand.choice(gen.ARRIVALS), rand.choice([0.5, 1.0, 3.0]), sizes=rand.choice(gen.SIZES))
+    return [(process.name, process.arribal, process.memory, process.execTime) for process in processes]
+
+def openTrace(trace: list):
+    """Crea un flujo nuevo con los procesos de una carga
+
+    Args:
+        trace (list): Tuplas (nombre, llegada, memoria, duración)
+
+    Returns:
+        ArrivalIndex: Flujo de procesos
+    """
+    return gm.ArrivalIndex([gm.Process(*data) for data in trace])
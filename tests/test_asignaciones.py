@@ -0,0 +1,62 @@
+import re
+import pytest
+import gestormemoria as gm #modulo gestor
+from conftest import openTrace
+
+SEGMENT = re.compile(r"\[(\d+) (\S+) (\d+)\]") #fragmento [posición nombre tamaño] de la línea temporal
+
+def simulate(trace: list, sorting: str, compaction: gm.ICompaction = None):
+    """Simula una carga guardando el historial
+
+    Returns:
+        tuple: Historial y líneas de la línea temporal
+    """
+    history = gm.AllocationHistory()
+    sink = gm.MemorySink()
+    gm.runHeadless(gm.ProcessLine(gm.SORTINGS[sorting](), sink=sink, listeners=[history], compaction=compaction), openTrace(trace))
+    return history, sink.getvalue().splitlines()
+
+def assertMatchesTimeline(history: gm.AllocationHistory, timeline: list):
+    """Comprueba que la memoria del historial en cada instante es la de la línea temporal
+    """
+    for row in timeline:
+        time = int(row.split(" ", 1)[0])
+        expected = [(int(position), name, int(space)) for position, name, space in SEGMENT.findall(row) if name != "hueco"]
+        assert [(allocation.position, allocation.name, allocation.space) for allocation in history.getMemoryAt(time)] == expected
+
+@pytest.mark.parametrize("sorting", ["best", "next", "buddy", "segregated"])
+def test_memory_at_matches_timeline(trace, sorting):
+    assertMatchesTimeline(*simulate(trace, sorting))
+
+def test_memory_at_matches_timeline_with_compaction(trace):
+    assertMatchesTimeline(*simulate(trace, "best", gm.FragmentationCompaction(0.3, 100, 0.01)))
+
+def test_range_query_is_union_of_instants(trace):
+    history, _ = simulate(trace, "best", gm.FragmentationCompaction(0.3, 100))
+    for start in range(1, history.lastTime + 1, 7):
+        end = start + 5
+        instants = set()
+        for time in range(start, end):
+            instants |= {(allocation.name, allocation.start) for allocation in history.query(time)}
+        assert {(allocation.name, allocation.start) for allocation in history.query(start, end)} == instants
+
+def test_process_allocations_are_contiguous(trace):
+    history, _ = simulate(trace, "best", gm.FragmentationCompaction(0.3, 100))
+    for name, *_ in trace:
+        allocations = history.getProcess(name)
+        assert all(allocation.start <= allocation.end for allocation in allocations if allocation.end is not None) # vacío si se movió al entrar
+        assert all(previous.end == following.start for previous, following in zip(allocations, allocations[1:]))
+    assert history.getProcess("no existe") == []
+
+def test_save_load_round_trip(trace, tmp_path):
+    history, timeline = simulate(trace, "best", gm.FragmentationCompaction(0.3, 100))
+    history.save(tmp_path / "historial.bin")
+    loaded = gm.AllocationHistory.load(tmp_path / "historial.bin")
+    assert len(loaded) == len(history) and loaded.lastTime == history.lastTime
+    assertMatchesTimeline(loaded, timeline)
+    assert [str(allocation) for allocation in loaded.query(1, history.lastTime + 1)] == [str(allocation) for allocation in history.query(1, history.lastTime + 1)]
+
+def test_load_rejects_other_files(tmp_path):
+    (tmp_path / "otro.bin").write_bytes(b"not a history file")
+    with pytest.raises(ValueError):
+        gm.AllocationHistory.load(tmp_path / "otro.bin")
@@ -0,0 +1,38 @@
+import pytest
+import gestormemoria as gm #modulo gestor
+from conftest import runTicks, openTrace
+
+ADMISSIONS = [gm.RetryAdmission, gm.FirstFitAdmission, gm.LargestFitAdmission, gm.FifoAdmission]
+
+def simulate(trace: list, sorting: str, admission, headless: bool, compaction: gm.ICompaction = None):
+    """Simula una carga y devuelve la línea temporal. Los mensajes de consola no se comparan, ya que sin esperas no se emiten los intervalos saltados
+    """
+    sink = gm.MemorySink()
+    line = gm.ProcessLine(gm.SORTINGS[sorting](), sink=sink, admission=admission(), compaction=compaction)
+    if headless:
+        gm.runHeadless(line, openTrace(trace))
+    else:
+        runTicks(line, openTrace(trace))
+    return sink.getvalue()
+
+@pytest.mark.parametrize("sorting", list(gm.SORTINGS))
+@pytest.mark.parametrize("admission", ADMISSIONS)
+def test_headless_matches_ticks(trace, sorting, admission):
+    assert simulate(trace, sorting, admission, True) == simulate(trace, sorting, admission, False)
+
+def test_headless_matches_ticks_with_compaction(trace):
+    def compaction():
+        return gm.FragmentationCompaction(0.3, 100, 0.01)
+    assert simulate(trace, "best", gm.RetryAdmission, True, compaction()) == simulate(trace, "best", gm.RetryAdmission, False, compaction())
+
+@pytest.mark.parametrize("sorting", ["best", "buddy"])
+def test_headless_until_resumes(trace, sorting):
+    expected = simulate(trace, sorting, gm.RetryAdmission, True)
+    sink = gm.MemorySink()
+    line = gm.ProcessLine(gm.SORTINGS[sorting](), sink=sink)
+    processes = openTrace(trace)
+    for until in (3, 10, 25):
+        gm.runHeadless(line, processes, until=until)
+        assert line.__time__ <= until or processes.isEmpty()
+    gm.runHeadless(line, processes)
+    assert sink.getvalue() == expected
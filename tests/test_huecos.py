@@ -0,0 +1,68 @@
+import random
+import pytest
+import gestormemoria as gm #modulo gestor
+from conftest import openTrace
+
+def makeHoles(rand: random.Random, count: int):
+    """Crea huecos sueltos de tamaño aleatorio en posiciones distintas
+    """
+    holes = []
+    for i in range(count):
+        page = gm.PageSpace(rand.randint(0, 50))
+        page.start_position = i * 100
+        page.end_position = page.start_position + page.space - 1
+        holes.append(page)
+    return holes
+
+def test_index_matches_sorted_reference():
+    rand = random.Random(0)
+    index = gm.FreeHoleIndex()
+    inside = []
+    for page in makeHoles(rand, 400):
+        if inside and rand.random() < 0.4:
+            removed = inside.pop(rand.randrange(len(inside)))
+            index.remove(removed)
+        index.add(page)
+        inside.append(page)
+        expected = sorted(inside, key=lambda hole: (hole.space, hole.start_position))
+        assert index.pages == expected
+        assert index.keys == [(hole.space, hole.start_position) for hole in expected]
+        assert index.min() == expected[0].space and index.max() == expected[-1].space
+        assert index.largest() is expected[-1]
+        assert index.smallest() is [hole for hole in expected if hole.space == expected[0].space][-1]
+        space = rand.randint(0, 50)
+        assert index.countFrom(space) == sum(hole.space >= space for hole in inside)
+
+def test_empty_index_raises():
+    index = gm.FreeHoleIndex()
+    with pytest.raises(gm.InsuficientFragmentSpaceError):
+        index.smallest()
+    with pytest.raises(gm.InsuficientFragmentSpaceError):
+        index.largest()
+
+def assertIndexMatches(line: gm.ProcessLine):
+    """Comprueba que el índice de huecos de la línea es igual a uno generado desde cero con sus fragmentos
+    """
+    expected = line.sorting.createHoleIndex(line.processList)
+    assert line.__holes__.keys == expected.keys
+    assert all(page is other for page, other in zip(line.__holes__.pages, expected.pages))
+    if isinstance(expected, gm.BuddyHoleIndex):
+        orders = len(expected.orders) # las listas de los órdenes más altos pueden quedarse vacías
+        assert line.__holes__.orders[:orders] == expected.orders and not any(line.__holes__.orders[orders:])
+        assert line.__holes__.blocks.keys() == expected.blocks.keys()
+        assert all(line.__holes__.blocks[start] is page for start, page in expected.blocks.items())
+
+@pytest.mark.parametrize("sorting", list(gm.SORTINGS))
+def test_line_index_stays_consistent(trace, sorting):
+    line = gm.ProcessLine(gm.SORTINGS[sorting](), sink=gm.NullSink())
+    processes = openTrace(trace)
+    while not processes.isEmpty() or len(line.__buff__) != 0 or not line.isEmpty():
+        line.update(processes=gm.getProcessesToAdd(processes, line.__time__))
+        assertIndexMatches(line)
+
+def test_line_index_stays_consistent_while_compacting(trace):
+    line = gm.ProcessLine(gm.BestFitSorting(), sink=gm.NullSink(), compaction=gm.FragmentationCompaction(0.3, 100))
+    processes = openTrace(trace)
+    while not processes.isEmpty() or len(line.__buff__) != 0 or not line.isEmpty():
+        line.update(processes=gm.getProcessesToAdd(processes, line.__time__))
+        assertIndexMatches(line)
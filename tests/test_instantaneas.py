@@ -0,0 +1,55 @@
+import io
+import pytest
+import gestormemoria as gm #modulo gestor
+from conftest import runTicks, openTrace
+
+def simulateFull(trace: list, sorting: str, admission, compaction = None):
+    """Simula una carga sin interrupciones y devuelve la línea temporal, los mensajes de consola y las estadísticas de la compactación
+    """
+    sink = gm.MemorySink()
+    log = io.StringIO()
+    line = gm.ProcessLine(gm.SORTINGS[sorting](), sink=sink, admission=admission(), listeners=[gm.ConsoleLogger(log)], compaction=compaction() if compaction else None)
+    runTicks(line, openTrace(trace))
+    return sink.getvalue(), log.getvalue(), line.compactionStats.asDict()
+
+def simulateResumed(trace: list, sorting: str, admission, path, stop, compaction = None):
+    """Simula una carga hasta que stop(line) sea cierto, guarda la instantánea en un archivo y continúa desde ella con una línea nueva
+
+    Returns:
+        tuple: Línea temporal, mensajes de consola, estadísticas de la compactación e instantánea cargada
+    """
+    first = gm.MemorySink()
+    log = io.StringIO()
+    line = gm.ProcessLine(gm.SORTINGS[sorting](), sink=first, admission=admission(), listeners=[gm.ConsoleLogger(log)], compaction=compaction() if compaction else None)
+    processes = openTrace(trace)
+    while (not processes.isEmpty() or len(line.__buff__) != 0 or not line.isEmpty()) and not stop(line):
+        line.update(processes=gm.getProcessesToAdd(processes, line.__time__))
+    line.snapshot(processes).save(path)
+    snapshot = gm.LineSnapshot.load(path)
+    second = gm.MemorySink()
+    resumed = gm.ProcessLine.fromSnapshot(snapshot, sink=second, listeners=[gm.ConsoleLogger(log)], compaction=compaction() if compaction else None)
+    processes = openTrace(trace)
+    processes.advance(snapshot.cursor)
+    runTicks(resumed, processes)
+    return first.getvalue() + second.getvalue(), log.getvalue(), resumed.compactionStats.asDict(), snapshot
+
+@pytest.mark.parametrize("sorting", list(gm.SORTINGS))
+@pytest.mark.parametrize("admission", [gm.RetryAdmission, gm.FirstFitAdmission])
+@pytest.mark.parametrize("stopTime", [1, 7, 30])
+def test_snapshot_round_trip(trace, sorting, admission, stopTime, tmp_path):
+    resumed = simulateResumed(trace, sorting, admission, tmp_path / "linea.snap", lambda line: line.__time__ >= stopTime)
+    assert resumed[:3] == simulateFull(trace, sorting, admission)
+
+def test_snapshot_round_trip_mid_compaction(trace, tmp_path):
+    def compaction():
+        return gm.FragmentationCompaction(0.2, 20, 0.01)
+    resumed = simulateResumed(trace, "best", gm.RetryAdmission, tmp_path / "linea.snap", lambda line: line.__compacting__, compaction)
+    if not resumed[3].compacting:
+        pytest.skip("la carga no deja ninguna compactación a medias")
+    assert resumed[:3] == simulateFull(trace, "best", gm.RetryAdmission, compaction)
+
+def test_snapshot_rejects_smaller_memory(tmp_path):
+    line = gm.ProcessLine(gm.BestFitSorting(), sink=gm.NullSink())
+    line.update(processes=[gm.Process("P1", 1, 1500, 5)])
+    with pytest.raises(gm.SnapshotSizeError):
+        gm.ProcessLine.fromSnapshot(line.snapshot(), sink=gm.NullSink(), size=1000)
@@ -0,0 +1,427 @@
+import os
+import sys
+import mmap
+import struct
+import argparse
+from array import array
+import gestormemoria as gm #modulo gestor
+
+MAGIC = b"GMTRACE1"
+VERSION = 2
+HEADER = struct.Struct("<8sIIQQ") #magic, versión, reservado, número de procesos, bytes de la tabla de nombres
+COLUMNS = (("arrivals", "q"), ("memory", "q"), ("durations", "q"), ("nameOffsets", "Q")) #columnas en orden, con su tipo de array
+VERSION_COLUMNS = {1: (("arrivals", "q"), ("memory", "i"), ("durations", "i"), ("nameOffsets", "Q")), VERSION: COLUMNS} #columnas de cada versión que se puede leer
+
+class InvalidTraceError(Exception): #exception
+    """Error que ocurre cuando un archivo no es una traza binaria válida
+    """
+    def __init__(self, reason: str = None) -> None:
+        super().__init__("Invalid binary trace file" + (f": {reason}" if reason else ""))
+
+def getLayout(count: int, nameBytes: int, columns: tuple = COLUMNS):
+    """Calcula la posición de cada columna en el archivo.
+    Tras la cabecera van las llegadas, la memoria y la duración (int64; int32 la memoria y la duración en la versión 1),
+    los desplazamientos de los nombres (uint64, count + 1) y los nombres en UTF-8 seguidos. Todas las columnas quedan alineadas a su tamaño.
+
+    Args:
+        count (int): Número de procesos
+        nameBytes (int): Bytes de la tabla de nombres
+        columns (tuple, optional): Columnas de la versión del archivo. Defaults to COLUMNS.
+
+    Returns:
+        dict: Posición inicial de cada columna y de los nombres por nombre, y "end" con el tamaño del archivo
+    """
+    layout = {}
+    position = HEADER.size
+    for column, typecode in columns:
+        layout[column] = position
+        position += array(typecode).itemsize * (count + 1 if column == "nameOffsets" else count)
+    layout["names"] = position
+    layout["end"] = position + nameBytes
+    return layout
+
+def writeTrace(filename: str, processes):
+    """Escribe los procesos en una traza binaria, ordenados por llegada.
+    Los procesos que llegan a la vez mantienen su orden, igual que con ArrivalIndex.
+
+    Args:
+        filename (str): Nombre del archivo
+        processes (iterable): Procesos a escribir
+
+    Raises:
+        InvalidTraceError: En caso de que la llegada, la memoria o la duración de un proceso no quepan en 64 bits
+
+    Returns:
+        int: Número de procesos escritos
+    """
+    columns = {column: array(typecode) for column, typecode in COLUMNS}
+    names = bytearray()
+    columns["nameOffsets"].append(0)
+    ordered = True
+    for process in processes:
+        if len(columns["arrivals"]) != 0 and process.arribal < columns["arrivals"][-1]:
+            ordered = False
+        try:
+            columns["arrivals"].append(process.arribal)
+            columns["memory"].append(process.memory)
+            columns["durations"].append(process.execTime)
+        except OverflowError:
+            raise InvalidTraceError(f"process {process.name} does not fit in 64-bit columns")
+        names += process.name.encode()
+        columns["nameOffsets"].append(len(names))
+    count = len(columns["arrivals"])
+    if not ordered:
+        order = sorted(range(count), key=columns["arrivals"].__getitem__)
+        offsets = columns["nameOffsets"]
+        names = b"".join(names[offsets[i]:offsets[i + 1]] for i in order)
+        columns["nameOffsets"] = array("Q", [0])
+        for i in order:
+            columns["nameOffsets"].append(columns["nameOffsets"][-1] + offsets[i + 1] - offsets[i])
+        for column in ("arrivals", "memory", "durations"):
+            columns[column] = array(columns[column].typecode, (columns[column][i] for i in order))
+    with open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, count, len(names)))
+        for column, _ in COLUMNS:
+            if sys.byteorder == "big":
+                columns[column].byteswap()
+            columns[column].tofile(f)
+        f.write(names)
+    return count
+
+def convertText(source: str, target: str):
+    """Convierte un archivo de procesos con el formato de samples/process.txt en una traza binaria
+
+    Args:
+        source (str): Archivo de texto
+        target (str): Archivo binario a generar
+
+    Returns:
+        int: Número de procesos convertidos
+    """
+    return writeTrace(target, gm.iterProcessesFromFile(source))
+
+def isBinaryTrace(filename: str):
+    """Indica si un archivo es una traza binaria, según sus primeros bytes
+
+    Args:
+        filename (str): Nombre del archivo
+
+    Returns:
+        bool: True si empieza por MAGIC
+    """
+    try:
+        with open(filename, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+class BinaryTrace:
+    """Clase que representa una traza binaria abierta con mmap. Las columnas se leen del archivo sin copiarlas
+    y los procesos solo se crean al pedirlos, por lo que abrir la traza no depende de su tamaño.
+    Mientras haya vistas de NumPy de las columnas no se puede cerrar.
+
+    Attributes:
+        filename (str): Nombre del archivo
+        count (int): Número de procesos
+        arrivals (memoryview): Llegada de cada proceso, ordenadas
+        memory (memoryview): Memoria de cada proceso
+        durations (memoryview): Duración de cada proceso
+        nameOffsets (memoryview): Posición del nombre de cada proceso en la tabla de nombres, con una posición final de más
+        names (memoryview): Nombres en UTF-8 seguidos
+    """
+    def __init__(self, filename: str) -> None:
+        """Constructor de la clase, abre el archivo y comprueba la cabecera
+
+        Args:
+            filename (str): Nombre del archivo
+
+        Raises:
+            InvalidTraceError: En caso de que la cabecera o el tamaño del archivo no sean válidos
+        """
+        self.filename = filename
+        with open(filename, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                raise InvalidTraceError("truncated header")
+            self.__mmap__ = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.count, nameBytes = HEADER.unpack_from(self.__mmap__)
+        if magic != MAGIC:
+            self.close()
+            raise InvalidTraceError("bad magic")
+        self.__columns__ = VERSION_COLUMNS.get(version, COLUMNS)
+        if version not in VERSION_COLUMNS:
+            self.close()
+            raise InvalidTraceError(f"unsupported version {version}")
+        self.__layout__ = getLayout(self.count, nameBytes, self.__columns__)
+        if self.__layout__["end"] != size:
+            self.close()
+            raise InvalidTraceError("file size does not match header")
+        view = memoryview(self.__mmap__)
+        for column, typecode in self.__columns__:
+            start = self.__layout__[column]
+            end = start + array(typecode).itemsize * (self.count + 1 if column == "nameOffsets" else self.count)
+            if sys.byteorder == "big": # el archivo es little-endian: se copia la columna
+                values = array(typecode, bytes(view[start:end]))
+                values.byteswap()
+                setattr(self, column, memoryview(values))
+            else:
+                setattr(self, column, view[start:end].cast(typecode))
+        self.names = view[self.__layout__["names"]:]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int):
+        """Crea el proceso de la posición dada
+
+        Args:
+            index (int): Posición del proceso en la traza
+
+        Returns:
+            Process: Proceso
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return gm.Process(self.getName(index), self.arrivals[index], self.memory[index], self.durations[index])
+
+    def __iter__(self):
+        """Recorre los procesos en orden de llegada, creándolos según se piden
+
+        Yields:
+            Process: Siguiente proceso
+        """
+        return self.iterProcesses()
+
+    def iterProcesses(self, start: int = 0):
+        """Recorre los procesos en orden de llegada a partir de una posición, creándolos según se piden
+
+        Args:
+            start (int, optional): Posición del primer proceso. Defaults to 0.
+
+        Yields:
+            Process: Siguiente proceso
+        """
+        arrivals, memory, durations, offsets, names = self.arrivals, self.memory, self.durations, self.nameOffsets, self.names
+        for i in range(start, self.count):
+            yield gm.Process(str(names[offsets[i]:offsets[i + 1]], "utf-8"), arrivals[i], memory[i], durations[i])
+
+    def getName(self, index: int):
+        """Obtiene el nombre de un proceso de la tabla de nombres
+
+        Args:
+            index (int): Posición del proceso en la traza
+
+        Returns:
+            str: Nombre del proceso
+        """
+        return str(self.names[self.nameOffsets[index]:self.nameOffsets[index + 1]], "utf-8")
+
+    def getStream(self):
+        """Obtiene un flujo de los procesos de la traza, que los crea según avanza la simulación.
+        La traza sigue siendo de quien la abrió, ver openProcesses para un flujo que la cierra
+
+        Returns:
+            TraceStream: Flujo de procesos
+        """
+        return TraceStream(self)
+
+    def asArrays(self):
+        """Obtiene las columnas como arrays de NumPy, sin copiarlas del archivo
+
+        Raises:
+            ImportError: En caso de que NumPy no esté instalado
+
+        Returns:
+            tuple: Arrays de llegada, memoria y duración
+        """
+        import numpy as np
+        return tuple(np.frombuffer(self.__mmap__, dtype=np.dtype(typecode).newbyteorder("<"), count=self.count, offset=self.__layout__[column])
+                     for column, typecode in self.__columns__[:3])
+
+    def close(self):
+        """Cierra el archivo. Falla si quedan arrays de NumPy de las columnas
+        """
+        for column in [column for column, _ in self.__columns__] + ["names"]:
+            view = getattr(self, column, None)
+            if view is not None:
+                view.release()
+                setattr(self, column, None)
+        self.__mmap__.close()
+
+class TraceStream(gm.ProcessStream):
+    """Flujo de procesos de una traza binaria. Avanzar salta directamente a la posición pedida sin crear los procesos intermedios,
+    y si el flujo es dueño de la traza la cierra al agotarse o al cerrar el flujo.
+
+    Attributes:
+        trace (BinaryTrace): Traza de la que se leen los procesos
+        owned (bool): Indica si el flujo cierra la traza
+    """
+    def __init__(self, trace: BinaryTrace, owned: bool = False) -> None:
+        """Constructor de la clase
+
+        Args:
+            trace (BinaryTrace): Traza abierta
+            owned (bool, optional): Cierra la traza al agotarse el flujo. Defaults to False.
+        """
+        super().__init__(trace.iterProcesses())
+        self.trace = trace
+        self.owned = owned
+        self.__closeIfEmpty__()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __closeIfEmpty__(self):
+        if self.isEmpty():
+            self.close()
+
+    def getArrivals(self, time):
+        ready_processes = super().getArrivals(time)
+        self.__closeIfEmpty__()
+        return ready_processes
+
+    def advance(self, count: int):
+        """Salta los siguientes procesos sin crearlos, empezando a leer la traza desde la nueva posición
+
+        Args:
+            count (int): Número de procesos a sacar
+        """
+        if count <= 0 or self.isEmpty():
+            return
+        self.__cursor__ = min(self.__cursor__ + count, len(self.trace))
+        self.__source__ = self.trace.iterProcesses(self.__cursor__)
+        self.__head__ = next(self.__source__, None)
+        self.__closeIfEmpty__()
+
+    def close(self):
+        """Deja el flujo vacío y, si es dueño de la traza, la cierra. Se puede llamar más de una vez
+        """
+        self.__head__ = None
+        self.__source__ = iter(())
+        if self.owned and self.trace.names is not None:
+            self.trace.close()
+
+def openTrace(filename: str):
+    """Abre una traza binaria
+
+    Args:
+        filename (str): Nombre del archivo
+
+    Returns:
+        BinaryTrace: Traza abierta
+    """
+    return BinaryTrace(filename)
+
+def loadProcesses(filename: str):
+    """Carga todos los procesos de un archivo de texto o de una traza binaria
+
+    Args:
+        filename (str): Nombre del archivo
+
+    Returns:
+        list: Lista de procesos
+    """
+    if isBinaryTrace(filename):
+        with BinaryTrace(filename) as trace:
+            return list(trace)
+    return gm.generateProcessFromFile(filename)
+
+def openProcesses(filename: str):
+    """Abre un archivo de texto o una traza binaria como flujo de procesos.
+    La traza binaria crea los procesos según avanza la simulación y se cierra al agotarse el flujo o al cerrarlo;
+    el archivo de texto se carga y se ordena entero
+
+    Args:
+        filename (str): Nombre del archivo
+
+    Returns:
+        ProcessStream: Flujo de procesos
+    """
+    if isBinaryTrace(filename):
+        return TraceStream(BinaryTrace(filename), owned=True)
+    return gm.ArrivalIndex(gm.generateProcessFromFile(filename))
+
+def getStatistics(trace: BinaryTrace):
+    """Comprueba que el contenido de la traza es válido y calcula sus estadísticas
+
+    Args:
+        trace (BinaryTrace): Traza abierta
+
+    Raises:
+        InvalidTraceError: En caso de que la traza no esté ordenada, tenga memorias o duraciones negativas o nombres no válidos
+
+    Returns:
+        dict: Estadísticas de la traza
+    """
+    count = trace.count
+    arrivals, memory, durations, offsets = trace.arrivals, trace.memory, trace.durations, trace.nameOffsets
+    if offsets[0] != 0 or offsets[count] != len(trace.names) or any(offsets[i] > offsets[i + 1] for i in range(count)):
+        raise InvalidTraceError("bad name table")
+    try:
+        str(trace.names, "utf-8")
+    except UnicodeDecodeError:
+        raise InvalidTraceError("names are not UTF-8")
+    if any(arrivals[i] > arrivals[i + 1] for i in range(count - 1)):
+        raise InvalidTraceError("not sorted by arrival")
+    if count != 0 and min(memory) < 0:
+        raise InvalidTraceError("memory must not be negative")
+    if count != 0 and min(durations) < 0:
+        raise InvalidTraceError("duration must not be negative")
+    return {
+        "processes": count,
+        "firstArrival": arrivals[0] if count else None,
+        "lastArrival": arrivals[-1] if count else None,
+        "minMemory": min(memory, default=None),
+        "meanMemory": sum(memory) / count if count else 0.0,
+        "maxMemory": max(memory, default=None),
+        "minDuration": min(durations, default=None),
+        "meanDuration": sum(durations) / count if count else 0.0,
+        "maxDuration": max(durations, default=None),
+        "demand": sum(m * d for m, d in zip(memory, durations)),
+        "fileSize": os.path.getsize(trace.filename),
+    }
+
+def formatStatistics(statistics: dict):
+    """Genera un texto con las estadísticas de una traza
+
+    Args:
+        statistics (dict): Estadísticas de getStatistics
+
+    Returns:
+        str: Una línea por estadística
+    """
+    return "\n".join(f"{name:<13} {value:.2f}" if isinstance(value, float) else f"{name:<13} {value}" for name, value in statistics.items())
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Convierte y comprueba trazas binarias de procesos")
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert = commands.add_parser("convert", help="Convierte un archivo con el formato de samples/process.txt en una traza binaria")
+    convert.add_argument("source", help="Archivo de texto")
+    convert.add_argument("target", help="Traza binaria a generar")
+    validate = commands.add_parser("validate", help="Comprueba una traza binaria y muestra sus estadísticas")
+    validate.add_argument("file", help="Traza binaria")
+    args = parser.parse_args()
+    if args.command == "convert":
+        try:
+            print(f"Se convirtieron {convertText(args.source, args.target)} procesos en {args.target}")
+        except InvalidTraceError as err:
+            print(err)
+            sys.exit(1)
+    else:
+        try:
+            with BinaryTrace(args.file) as trace:
+                print(formatStatistics(getStatistics(trace)))
+        except InvalidTraceError as err:
+            print(err)
+            sys.exit(1)